@@ -17,11 +17,16 @@ __version__ = "1.2.0"
 from .config import (
     get_arango_config,
     get_gae_config,
+    clear_config_cache,
     GAEConfig,
     ArangoConfig,
     DeploymentMode,
 )
-from .db_connection import get_db_connection, get_connection_info
+from .db_connection import (
+    get_db_connection,
+    get_connection_info,
+    clear_db_connection_cache,
+)
 from .gae_connection import GAEManager, GenAIGAEConnection, GAEConnectionBase
 from .gae_orchestrator import (
     GAEOrchestrator,
@@ -41,12 +46,14 @@ __all__ = [
     # Configuration
     "get_arango_config",
     "get_gae_config",
+    "clear_config_cache",
     "GAEConfig",
     "ArangoConfig",
     "DeploymentMode",
     # Database
     "get_db_connection",
     "get_connection_info",
+    "clear_db_connection_cache",
     # GAE Connections
     "GAEManager",
     "GenAIGAEConnection",
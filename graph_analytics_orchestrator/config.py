@@ -5,9 +5,12 @@ Supports both Arango Managed Platform (AMP) and self-managed deployments.
 """
 
 import os
+import threading
 import warnings
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List, Union
+from typing import Dict, Optional, List, Tuple, Union
+from urllib.parse import urlsplit
 from enum import Enum
 from dotenv import load_dotenv
 
@@ -32,24 +35,76 @@ class DeploymentMode(Enum):
     SELF_MANAGED = "self_managed"  # Self-managed via GenAI Suite
 
 
+# Accepted GAE_DEPLOYMENT_MODE spellings (lowercased)
+_MODE_ALIASES: Dict[str, DeploymentMode] = {
+    "amp": DeploymentMode.AMP,
+    "managed": DeploymentMode.AMP,
+    "arangograph": DeploymentMode.AMP,
+    "self_managed": DeploymentMode.SELF_MANAGED,
+    "self-managed": DeploymentMode.SELF_MANAGED,
+    "genai": DeploymentMode.SELF_MANAGED,
+    "gen-ai": DeploymentMode.SELF_MANAGED,
+}
+
+# String values parse_bool() and parse_ssl_verify() treat as True (lowercased)
+_TRUE_TOKENS = frozenset(("true", "1", "yes", "on"))
+
 # Constants (kept for backward compatibility)
 DEFAULT_SSL_VERIFY = True
 DEFAULT_TIMEOUT = DEFAULT_TIMEOUT_SECONDS
 
-
+# Set once load_env_vars() has resolved the environment for this process
+_env_loaded = False
+
+
+# Environment variables each config class reads; their values key the cache
+_ARANGO_ENV_KEYS = (
+    "ARANGO_ENDPOINT",
+    "ARANGO_USER",
+    "ARANGO_PASSWORD",
+    "ARANGO_DATABASE",
+    "ARANGO_VERIFY_SSL",
+    "ARANGO_TIMEOUT",
+    "ARANGO_SKIP_DB_LISTING",
+)
+_GAE_ENV_KEYS = (
+    "GAE_DEPLOYMENT_MODE",
+    "ARANGO_GRAPH_API_KEY_ID",
+    "ARANGO_GRAPH_API_KEY_SECRET",
+    "ARANGO_GRAPH_TOKEN",
+    "ARANGO_ENDPOINT",
+    "ARANGO_GAE_PORT",
+)
+
+# Parsed config attributes keyed on (class, values of its environment
+# variables), so construction skips parsing until one of those changes
+_config_cache: Dict[Tuple, Dict[str, object]] = {}
+_config_cache_lock = threading.Lock()
+
+# Files marking the project root (checked with one directory read per level)
+_PROJECT_ROOT_MARKERS = frozenset((".env", "setup.py"))
+
+
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """
     Get the project root directory.
 
+    The result is cached for the lifetime of the process.
+
     Returns:
         Path: Absolute path to project root
     """
     # Try to find project root by looking for .env or setup.py
-    current = Path(__file__).parent
-    while current != current.parent:
-        if (current / ".env").exists() or (current / "setup.py").exists():
-            return current
-        current = current.parent
+    for directory in Path(__file__).resolve().parents:
+        if directory == directory.parent:
+            break  # Stop at the filesystem anchor
+        try:
+            with os.scandir(directory) as entries:
+                if any(entry.name in _PROJECT_ROOT_MARKERS for entry in entries):
+                    return directory
+        except OSError:
+            continue
     # Fallback to current directory
     return Path.cwd()
 
@@ -64,14 +119,24 @@ def get_env_path() -> Path:
     return get_project_root() / ".env"
 
 
-def load_env_vars() -> None:
+def load_env_vars(force: bool = False) -> None:
     """
     Load environment variables from .env file.
 
     If required variables are already present in the environment, no file load
     is attempted. File load errors (e.g., permission issues) are ignored with a
     warning to keep runtime and tests resilient.
+
+    Resolution runs once per process; later calls return immediately so
+    repeated config construction does not re-scan the filesystem.
+
+    Args:
+        force: Re-run resolution even if it already ran (e.g., after
+               changing directory or editing the .env file)
     """
+    global _env_loaded
+    if _env_loaded and not force:
+        return
 
     def _required_vars_present() -> bool:
         required = {"ARANGO_ENDPOINT", "ARANGO_PASSWORD", "ARANGO_DATABASE"}
@@ -92,26 +157,63 @@ def load_env_vars() -> None:
                 f"Skipping .env load due to access error at {path}", UserWarning
             )
 
-    # Skip file reads when env is already populated (common in tests/CI)
-    if _required_vars_present():
-        return
-
-    # First, try loading from current working directory (most common case)
-    cwd_env = Path.cwd() / ".env"
-    if cwd_env.exists():
-        _safe_load(cwd_env)
+    def _resolve() -> None:
+        # Skip file reads when env is already populated (common in tests/CI)
         if _required_vars_present():
             return
 
-    # Fallback to library's project root
-    env_path = get_env_path()
-    if env_path.exists():
-        _safe_load(env_path)
-        if _required_vars_present():
-            return
+        # First, try loading from current working directory (most common case)
+        cwd_env = Path.cwd() / ".env"
+        if cwd_env.exists():
+            _safe_load(cwd_env)
+            if _required_vars_present():
+                return
+
+        # Fallback to library's project root
+        env_path = get_env_path()
+        if env_path.exists():
+            _safe_load(env_path)
+            if _required_vars_present():
+                return
+
+        # Last resort: try loading from current directory (dotenv default)
+        _safe_load()
 
-    # Last resort: try loading from current directory (dotenv default)
-    _safe_load()
+    _resolve()
+    _env_loaded = True
+
+
+def clear_config_cache() -> None:
+    """
+    Drop all cached ArangoConfig and GAEConfig settings.
+
+    Configs are re-parsed automatically when their environment variables
+    change; clearing is only needed in tests.
+    """
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
+def _config_cache_key(cls: type, env_keys: Tuple[str, ...]) -> Tuple:
+    """Build the cache key for a config class from its environment values."""
+    environ = os.environ
+    return (cls, tuple([environ.get(key) for key in env_keys]))
+
+
+def _load_cached_config(config: object, key: Tuple) -> bool:
+    """Copy cached attributes onto config; returns False on a cache miss."""
+    with _config_cache_lock:
+        cached = _config_cache.get(key)
+    if cached is None:
+        return False
+    config.__dict__.update(cached)
+    return True
+
+
+def _store_config(config: object, key: Tuple) -> None:
+    """Cache a snapshot of a fully parsed config under its environment key."""
+    with _config_cache_lock:
+        _config_cache[key] = dict(config.__dict__)
 
 
 def get_required_env(var_name: str, error_msg: Optional[str] = None) -> str:
@@ -161,12 +263,10 @@ class ArangoConfig:
         """Initialize from environment variables."""
         load_env_vars()
 
-        self.endpoint = get_required_env("ARANGO_ENDPOINT")
-        self.user = os.getenv("ARANGO_USER", "root")
-        self.password = get_required_env("ARANGO_PASSWORD")
-        self.database = get_required_env("ARANGO_DATABASE")
-        verify_ssl_str = os.getenv("ARANGO_VERIFY_SSL", str(DEFAULT_SSL_VERIFY))
-        self.verify_ssl = parse_ssl_verify(verify_ssl_str)
+        cache_key = _config_cache_key(ArangoConfig, _ARANGO_ENV_KEYS)
+        if not _load_cached_config(self, cache_key):
+            self._parse_env()
+            _store_config(self, cache_key)
 
         # Warn if SSL verification is disabled
         if not self.verify_ssl:
@@ -177,7 +277,16 @@ class ArangoConfig:
                 UserWarning,
             )
 
+    def _parse_env(self) -> None:
+        """Read and validate the ArangoDB settings from the environment."""
+        self.endpoint = get_required_env("ARANGO_ENDPOINT")
+        self.user = os.getenv("ARANGO_USER", "root")
+        self.password = get_required_env("ARANGO_PASSWORD")
+        self.database = get_required_env("ARANGO_DATABASE")
+        verify_ssl_str = os.getenv("ARANGO_VERIFY_SSL", str(DEFAULT_SSL_VERIFY))
+        self.verify_ssl = parse_ssl_verify(verify_ssl_str)
         self.timeout = int(os.getenv("ARANGO_TIMEOUT", str(DEFAULT_TIMEOUT)))
+        self.skip_db_listing = parse_bool(os.getenv("ARANGO_SKIP_DB_LISTING", "true"))
 
     def to_dict(self, mask_secrets: bool = True) -> Dict[str, str]:
         """
@@ -194,9 +303,11 @@ class ArangoConfig:
             "database": self.database,
             "verify_ssl": self.verify_ssl,
             "timeout": str(self.timeout),
+            "skip_db_listing": self.skip_db_listing,
         }
 
 
+@lru_cache(maxsize=32)
 def _extract_deployment_url(endpoint: str) -> str:
     """
     Extract deployment URL from endpoint by removing port.
@@ -207,15 +318,13 @@ def _extract_deployment_url(endpoint: str) -> str:
     Returns:
         Deployment URL without port (e.g., https://example.arangodb.cloud)
     """
-    # Remove port if present (e.g., https://example.arangodb.cloud:8529 -> https://example.arangodb.cloud)
+    # Remove port and path (e.g., https://example.arangodb.cloud:8529 -> https://example.arangodb.cloud)
     if "://" in endpoint:
-        parts = endpoint.split("://", 1)
-        host_part = parts[1].split("/", 1)[0]
-        if ":" in host_part:
-            host = host_part.split(":", 1)[0]
-            return f"{parts[0]}://{host}"
-        else:
-            return f"{parts[0]}://{host_part}"
+        parts = urlsplit(endpoint)
+        host = parts.hostname or ""
+        if ":" in host:
+            host = f"[{host}]"  # Re-bracket IPv6 literals
+        return f"{parts.scheme}://{host}"
     else:
         return endpoint.rsplit(":", 1)[0] if ":" in endpoint else endpoint
 
@@ -227,17 +336,22 @@ class GAEConfig:
         """Initialize from environment variables."""
         load_env_vars()
 
+        cache_key = _config_cache_key(GAEConfig, _GAE_ENV_KEYS)
+        if not _load_cached_config(self, cache_key):
+            self._parse_env()
+            _store_config(self, cache_key)
+
+    def _parse_env(self) -> None:
+        """Read and validate the GAE settings from the environment."""
         # Determine deployment mode
         mode_str = os.getenv("GAE_DEPLOYMENT_MODE", "amp").lower()
-        if mode_str in ("amp", "managed", "arangograph"):
-            self.deployment_mode = DeploymentMode.AMP
-        elif mode_str in ("self_managed", "self-managed", "genai", "gen-ai"):
-            self.deployment_mode = DeploymentMode.SELF_MANAGED
-        else:
+        try:
+            self.deployment_mode = _MODE_ALIASES[mode_str]
+        except KeyError:
             raise ValueError(
                 f"Invalid GAE_DEPLOYMENT_MODE: {mode_str}. "
                 f"Must be 'amp' or 'self_managed'"
-            )
+            ) from None
 
         if self.deployment_mode == DeploymentMode.AMP:
             # AMP requires API keys and deployment URL
@@ -304,6 +418,24 @@ def get_arango_config(mask_secrets: bool = False) -> Dict[str, str]:
     return config.to_dict(mask_secrets=mask_secrets)
 
 
+def get_default_database() -> str:
+    """
+    Get the default database name from the environment.
+
+    A lightweight alternative to get_arango_config()["database"] for callers
+    that only need the database: it skips building and validating the full
+    connection configuration, while still following environment changes.
+
+    Returns:
+        str: Value of ARANGO_DATABASE
+
+    Raises:
+        ValueError: If ARANGO_DATABASE is not set
+    """
+    load_env_vars()
+    return get_required_env("ARANGO_DATABASE")
+
+
 def get_gae_config() -> Dict[str, str]:
     """
     Get Graph Analytics Engine configuration from environment.
@@ -334,7 +466,25 @@ def parse_ssl_verify(value: Union[str, bool]) -> bool:
 
     # Handle string input
     if isinstance(value, str):
-        return value.lower() in ("true", "1", "yes", "on")
+        return value.lower() in _TRUE_TOKENS
 
     # Default to True for other types
     return True
+
+
+def parse_bool(value: Union[str, bool]) -> bool:
+    """
+    Parse a boolean flag from an environment string.
+
+    Kept separate from parse_ssl_verify() so flags are not affected by
+    changes to how SSL verification settings are read.
+
+    Args:
+        value: String value ('true', 'false', '1', '0', etc.) or bool
+
+    Returns:
+        bool: Parsed boolean value
+    """
+    if isinstance(value, str):
+        return value.lower() in _TRUE_TOKENS
+    return bool(value)
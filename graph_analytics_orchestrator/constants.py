@@ -12,14 +12,47 @@ DEFAULT_GAE_PORT = 8829
 DEFAULT_TIMEOUT = 300  # 5 minutes for general operations
 DEFAULT_ENGINE_API_TIMEOUT = 30  # 30 seconds for engine API readiness
 DEFAULT_JOB_TIMEOUT = 3600  # 1 hour for job completion
+OASISCTL_TIMEOUT = 30  # 30 seconds for oasisctl token generation
+
+# ArangoDB HTTP Connection Pool
+ARANGO_HTTP_POOL_CONNECTIONS = 16  # Number of per-host connection pools to cache
+ARANGO_HTTP_POOL_MAXSIZE = 64  # Keep-alive connections kept per pool
+ARANGO_HTTP_RETRY_ATTEMPTS = 3  # Retries for idempotent requests on 502/503/504
+ARANGO_HTTP_BACKOFF_FACTOR = 0.2  # Seconds; exponential backoff between retries
+
+# GAE HTTP Connection Pool
+GAE_HTTP_POOL_CONNECTIONS = 4  # Per-host pools cached (management API + engines)
+GAE_HTTP_POOL_MAXSIZE = 32  # Keep-alive connections kept per pool
+GAE_HTTP_RETRY_ATTEMPTS = 3  # Retries for idempotent requests on 502/503/504
+GAE_HTTP_BACKOFF_FACTOR = 0.25  # Seconds; exponential backoff between retries
+
+# Orchestration
+DEFAULT_BATCH_CONCURRENCY = 4  # Engines a batch runs at once (<= GAE pool size)
+
+# Result Collection Management
+RESULT_COLLECTION_WORKERS = 8  # Collections whose indexes are checked at once
+
+# API Response Caching (in seconds)
+GAE_METADATA_CACHE_TTL = 3600  # Engine sizes and API version rarely change
+GENAI_SERVICE_CACHE_TTL = 5  # GenAI service listings and engine versions
 
 # Polling Intervals (in seconds)
 DEFAULT_POLL_INTERVAL = 2  # 2 seconds between status checks
 DEFAULT_RETRY_DELAY = 2  # 2 seconds between retries
+ENGINE_READY_INITIAL_DELAY = 0.25  # First wait while an engine starts up
+ENGINE_READY_MAX_DELAY = 2.0  # Cap on the engine readiness backoff
+JOB_POLL_INITIAL_DELAY = 0.1  # First wait before re-checking an orchestrated job
+BACKOFF_MULTIPLIER = 1.5  # Growth factor between consecutive polls
+BACKOFF_JITTER = 0.1  # Up to 10% random extra delay per poll
+POLL_BACKOFF_CAP = 30  # Longest single wait between job/service status checks
+PROGRESS_POLL_ETA_FRACTION = 0.3  # Re-check a progressing job 30% of the way to its ETA
+PROGRESS_POLL_MIN_DELAY = 1  # Shortest wait between checks of a progressing job
 
 # Token Management (in hours)
 TOKEN_LIFETIME_HOURS = 24  # ArangoGraph tokens expire after 24 hours
 TOKEN_REFRESH_THRESHOLD_HOURS = 1  # Refresh token 1 hour before expiry
+JWT_REFRESH_MINUTES = 50  # Re-authenticate GenAI JWTs after 50 minutes
+JWT_EXPIRY_MARGIN_SECONDS = 60  # ...or this long before their exp claim
 
 # Algorithm Defaults
 DEFAULT_DAMPING_FACTOR = 0.85  # PageRank damping factor
@@ -30,6 +63,11 @@ DEFAULT_START_LABEL_ATTRIBUTE = "_key"  # Label Propagation initial attribute
 DEFAULT_PARALLELISM = 8  # Degree of parallelism for storing results
 DEFAULT_BATCH_SIZE = 10000  # Batch size for writing results
 
+# Export Defaults
+DEFAULT_CURSOR_BATCH_SIZE = 10000  # Documents fetched per AQL cursor round-trip
+DEFAULT_EXPORT_WRITE_CHUNK_SIZE = 5000  # Rows encoded and written per file write
+EXPORT_FILE_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer for export files
+
 # Status Strings
 STATUS_COMPLETED = "completed"
 STATUS_FAILED = "failed"
@@ -49,6 +87,6 @@ ICON_SUCCESS = "[SUCCESS]"
 ICON_ERROR = "[ERROR]"
 ICON_WARNING = "[WARNING]"
 
-# Job Status Values (for normalization)
-COMPLETED_STATES = ["done", "finished", "completed", "succeeded"]
-FAILED_STATES = ["failed", "error"]
+# Job Status Values (for normalization; frozensets for O(1) membership tests)
+COMPLETED_STATES = frozenset({"done", "finished", "completed", "succeeded"})
+FAILED_STATES = frozenset({"failed", "error"})
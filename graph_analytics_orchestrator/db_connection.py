@@ -4,21 +4,180 @@ ArangoDB Connection Helper
 Provides a unified interface to connect to ArangoDB clusters.
 """
 
+import hashlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from arango import ArangoClient
-from typing import Optional
+from arango.http import DefaultHTTPClient
+from requests import Session
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote, quote_plus
+from urllib3.util.retry import Retry
 
-from .config import get_arango_config, parse_ssl_verify
+from .config import get_arango_config, parse_bool, parse_ssl_verify
+from .constants import (
+    ARANGO_HTTP_POOL_CONNECTIONS,
+    ARANGO_HTTP_POOL_MAXSIZE,
+    ARANGO_HTTP_RETRY_ATTEMPTS,
+    ARANGO_HTTP_BACKOFF_FACTOR,
+)
 
+# Process-wide caches so repeated calls reuse HTTP sessions and skip the
+# validation round-trips once a credential set has connected successfully.
+# Database connections are keyed on a password digest, never the password.
+_client_cache: Dict[str, ArangoClient] = {}
+_db_cache: Dict[Tuple[str, str, str, str, bool], object] = {}
+_cache_lock = threading.Lock()
 
-def get_db_connection():
+# ArangoDB error number for "database not found"
+_ERR_DATABASE_NOT_FOUND = 1228
+
+
+class _PooledHTTPClient(DefaultHTTPClient):
+    """
+    HTTP client with a larger keep-alive pool and retry/backoff.
+
+    Cursor-heavy workloads (exports, batch operations) issue many requests
+    per connection; pooled sockets amortize TCP/TLS setup across them.
+    """
+
+    def create_session(self, host: str) -> Session:
+        """
+        Create the driver's session, then enlarge its pool and tune retries.
+
+        The adapters the driver mounted are resized in place rather than
+        replaced, so its connection and pool timeouts still apply.
+        """
+        session = super().create_session(host)
+        retry_strategy = Retry(
+            total=ARANGO_HTTP_RETRY_ATTEMPTS,
+            backoff_factor=ARANGO_HTTP_BACKOFF_FACTOR,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS"],
+        )
+        for adapter in set(session.adapters.values()):
+            adapter.max_retries = retry_strategy
+            adapter._pool_connections = ARANGO_HTTP_POOL_CONNECTIONS
+            adapter._pool_maxsize = ARANGO_HTTP_POOL_MAXSIZE
+            adapter.init_poolmanager(
+                ARANGO_HTTP_POOL_CONNECTIONS,
+                ARANGO_HTTP_POOL_MAXSIZE,
+                block=adapter._pool_block,
+            )
+        return session
+
+
+def _get_client(endpoint: str) -> ArangoClient:
+    """Get the shared ArangoClient for an endpoint, creating it on first use."""
+    with _cache_lock:
+        client = _client_cache.get(endpoint)
+        if client is None:
+            client = ArangoClient(hosts=endpoint, http_client=_PooledHTTPClient())
+            _client_cache[endpoint] = client
+        return client
+
+
+def clear_db_connection_cache() -> None:
+    """
+    Drop all cached ArangoDB clients and database connections.
+
+    The next call to get_db_connection() will reconnect and re-validate
+    credentials. Useful after rotating passwords or in tests.
+    """
+    with _cache_lock:
+        _client_cache.clear()
+        _db_cache.clear()
+
+
+def _is_auth_error(error: Exception) -> bool:
+    """Check whether an exception is an ArangoDB authorization failure."""
+    error_str = str(error).lower()
+    return "401" in error_str or "not authorized" in error_str or "err 11" in error_str
+
+
+def _is_database_not_found(error: Exception) -> bool:
+    """Check whether an exception reports a missing database (ERR 1228)."""
+    if getattr(error, "error_code", None) == _ERR_DATABASE_NOT_FOUND:
+        return True
+    return "database not found" in str(error).lower()
+
+
+def _redact_secrets(text: str, *secrets: str) -> str:
+    """
+    Mask every occurrence of the given secrets in text in a single pass.
+
+    Percent-encoded forms are masked too, since credentials can leak through
+    request URLs quoted in driver error messages. Empty secrets are ignored.
+    """
+    variants = set()
+    for secret in secrets:
+        if secret:
+            variants.update((secret, quote(secret, safe=""), quote_plus(secret)))
+    if not variants:
+        return text
+
+    # Longest first so a secret never leaves part of a longer variant behind
+    pattern = re.compile(
+        "|".join(map(re.escape, sorted(variants, key=len, reverse=True)))
+    )
+    return pattern.sub("***MASKED***", text)
+
+
+def _connection_error(error: Exception, password: str) -> ConnectionError:
+    """
+    Build the ConnectionError raised when credentials fail to validate.
+
+    Authorization failures get troubleshooting hints; the password is
+    masked in every message.
+    """
+    # Don't expose password in error messages
+    error_msg = _redact_secrets(str(error), password)
+
+    # Enhanced error messages for common issues
+    if _is_auth_error(error):
+        # This is an authorization error
+        enhanced_msg = (
+            f"Failed to connect to ArangoDB: {error_msg}\n\n"
+            f"Authorization Error Detected\n\n"
+            f"This error means the server rejected your credentials or permissions.\n\n"
+            f"Common causes:\n"
+            f"  1. User doesn't have access to _system database (limited users)\n"
+            f"  2. Wrong username or password\n"
+            f"  3. Password has extra spaces (check .env file)\n"
+            f"  4. Endpoint missing port :8529\n\n"
+            f"Troubleshooting:\n"
+            f"  1. Verify credentials in .env file (no spaces, no quotes)\n"
+            f"  2. Check endpoint includes port: ARANGO_ENDPOINT=https://hostname:8529\n"
+            f"  3. Verify credentials work in web UI\n"
+            f"  4. For limited users, connect directly to target database (skip _system)\n"
+        )
+        return ConnectionError(enhanced_msg)
+    return ConnectionError(f"Failed to connect to ArangoDB: {error_msg}")
+
+
+def get_db_connection(use_cache: bool = True, skip_db_listing: Optional[bool] = None):
     """
     Establish connection to ArangoDB cluster.
 
+    Connections are cached per endpoint, user, password and database, so
+    validation only runs on the first call. By default it is a single
+    properties() request against the target database; the _system version
+    probe and database listing are kept for diagnostics.
+
+    Args:
+        use_cache: Reuse a previously validated connection if available
+                   (default: True). Set to False to force re-validation.
+        skip_db_listing: Validate with one request to the target database
+                         instead of probing _system and listing databases
+                         (default: ARANGO_SKIP_DB_LISTING, true if unset)
+
     Returns:
         StandardDatabase: ArangoDB database connection
 
     Raises:
-        ValueError: If required credentials are missing
+        ValueError: If required credentials are missing or the database
+                    does not exist
         ConnectionError: If connection fails
     """
     # Get configuration from environment
@@ -29,45 +188,60 @@ def get_db_connection():
     password = config["password"]
     database = config["database"]
     verify_ssl = parse_ssl_verify(config["verify_ssl"])
+    if skip_db_listing is None:
+        skip_db_listing = parse_bool(config.get("skip_db_listing", True))
+
+    password_digest = hashlib.blake2b(
+        password.encode("utf-8"), digest_size=16
+    ).hexdigest()
+    cache_key = (endpoint, username, password_digest, database, verify_ssl)
+    if use_cache:
+        with _cache_lock:
+            cached_db = _db_cache.get(cache_key)
+        if cached_db is not None:
+            return cached_db
+
+    # Initialize (or reuse) ArangoDB client
+    client = _get_client(endpoint)
+
+    if skip_db_listing:
+        # Open the target database directly; one request checks both the
+        # credentials and that the database exists
+        db = client.db(
+            database, username=username, password=password, verify=verify_ssl
+        )
+        try:
+            db.properties()
+        except Exception as e:
+            if _is_database_not_found(e):
+                raise ValueError(
+                    f"Database '{database}' does not exist on this cluster"
+                )
+            raise _connection_error(e, password)
+        print(f"OK: Connected to database: {database} at {endpoint}")
 
-    # Initialize ArangoDB client
-    client = ArangoClient(hosts=endpoint)
+        with _cache_lock:
+            _db_cache[cache_key] = db
+
+        return db
 
     # Connect to system database to verify credentials
     sys_db = client.db(
         "_system", username=username, password=password, verify=verify_ssl
     )
 
+    # Issue the credential probe and database listing concurrently so the
+    # diagnostic path costs one round-trip of latency instead of two
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        version_future = executor.submit(sys_db.version)
+        listing_future = executor.submit(sys_db.databases)
+
     # Check connection
     try:
-        sys_db.version()
+        version_future.result()
         print(f"OK: Successfully connected to ArangoDB at {endpoint}")
     except Exception as e:
-        # Don't expose password in error messages
-        error_msg = str(e).replace(password, "***MASKED***")
-
-        # Enhanced error messages for common issues
-        error_str = str(e).lower()
-        if "401" in error_str or "not authorized" in error_str or "err 11" in error_str:
-            # This is an authorization error
-            enhanced_msg = (
-                f"Failed to connect to ArangoDB: {error_msg}\n\n"
-                f"Authorization Error Detected\n\n"
-                f"This error means the server rejected your credentials or permissions.\n\n"
-                f"Common causes:\n"
-                f"  1. User doesn't have access to _system database (limited users)\n"
-                f"  2. Wrong username or password\n"
-                f"  3. Password has extra spaces (check .env file)\n"
-                f"  4. Endpoint missing port :8529\n\n"
-                f"Troubleshooting:\n"
-                f"  1. Verify credentials in .env file (no spaces, no quotes)\n"
-                f"  2. Check endpoint includes port: ARANGO_ENDPOINT=https://hostname:8529\n"
-                f"  3. Verify credentials work in web UI\n"
-                f"  4. For limited users, connect directly to target database (skip _system)\n"
-            )
-            raise ConnectionError(enhanced_msg)
-        else:
-            raise ConnectionError(f"Failed to connect to ArangoDB: {error_msg}")
+        raise _connection_error(e, password)
 
     # Connect to target database
     # Note: For limited users, we may not be able to list databases
@@ -76,7 +250,7 @@ def get_db_connection():
     db_names = []
 
     try:
-        available_dbs = sys_db.databases()
+        available_dbs = listing_future.result()
         listing_succeeded = True
         # Handle both dict format and string format
         if available_dbs and isinstance(available_dbs[0], dict):
@@ -84,9 +258,8 @@ def get_db_connection():
         else:
             db_names = available_dbs
     except Exception as e:
-        error_str = str(e).lower()
         # If it's an authorization error, user might be limited - that's okay
-        if "401" in error_str or "not authorized" in error_str or "err 11" in error_str:
+        if _is_auth_error(e):
             print(f"Warning: Cannot list databases (user may have limited permissions)")
             print(f"   Attempting direct connection to '{database}' database...")
             # Continue - will try direct connection
@@ -104,6 +277,9 @@ def get_db_connection():
     db = client.db(database, username=username, password=password, verify=verify_ssl)
     print(f"OK: Connected to database: {database}")
 
+    with _cache_lock:
+        _db_cache[cache_key] = db
+
     return db
 
 
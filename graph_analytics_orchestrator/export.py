@@ -7,12 +7,202 @@ Provides utilities for exporting GAE result collections to CSV and JSON formats.
 import csv
 import json
 import logging
+import operator
+import re
+import textwrap
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Union, Any
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
 from arango.database import StandardDatabase
 
+from .constants import (
+    DEFAULT_CURSOR_BATCH_SIZE,
+    DEFAULT_EXPORT_WRITE_CHUNK_SIZE,
+    EXPORT_FILE_BUFFER_SIZE,
+)
+
+# orjson is optional: a much faster C serializer, with stdlib json as fallback
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Attribute paths spliced into generated AQL: identifiers joined by dots
+_FIELD_PATH_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+
+
+def _row_getter(fieldnames: Sequence[str]) -> Callable[[dict], tuple]:
+    """
+    Build a fast dict-to-row accessor for a fixed set of CSV columns.
+
+    Uses operator.itemgetter for the common case and falls back to .get()
+    with an empty value for documents that are missing a column.
+    """
+    getter = operator.itemgetter(*fieldnames)
+    single = len(fieldnames) == 1
+
+    def get_row(doc: dict) -> tuple:
+        try:
+            row = getter(doc)
+        except KeyError:
+            return tuple(doc.get(name, "") for name in fieldnames)
+        return (row,) if single else row
+
+    return get_row
+
+
+def _json_encoder(pretty: bool) -> Callable[[Any], bytes]:
+    """Return a callable encoding one document to UTF-8 JSON bytes."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS keeps stdlib json's coercion of int/float keys
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return lambda doc: orjson.dumps(doc, option=option)
+
+    indent = 2 if pretty else None
+    return lambda doc: json.dumps(doc, indent=indent, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+@lru_cache(maxsize=64)
+def _compile_projection(var: str, paths: Tuple[str, ...]) -> str:
+    """
+    Build AQL object attributes projecting (possibly dotted) paths from a variable.
+
+    The last path segment is used as the attribute name, e.g. "profile.name"
+    becomes "name: person.profile.name". Results are memoized per
+    (variable, paths) so repeated exports skip validation and splitting.
+
+    Returns:
+        Comma-separated attribute list (empty string if no paths)
+
+    Raises:
+        ValueError: If a path is not a plain (dotted) identifier, since paths
+                    cannot be passed as bind parameters and are spliced into AQL
+    """
+    attributes = []
+    for path in paths:
+        if not _FIELD_PATH_PATTERN.match(path):
+            raise ValueError(f"Invalid field name: {path!r}")
+        attributes.append(f"{path.rpartition('.')[2]}: {var}.{path}")
+    return ", ".join(attributes)
+
+
+_EXPORT_PREFIX = "FOR r IN @@col RETURN "
+_EXPORT_JOIN_PREFIX = textwrap.dedent("""
+    FOR r IN @@col
+      LET person = DOCUMENT(r.id)
+      RETURN """)
+
+# Default export RETURN expressions keyed on (join_vertex, has_fields, flatten).
+# {projection} holds result attributes, {vjoin} the ", "-prefixed vertex ones.
+_EXPORT_ROW_TEMPLATES = {
+    (False, False, False): "r",
+    (False, True, False): "{{ {projection} }}",
+    (True, False, False): "{{ vertex_id: r.id, result: r{vjoin} }}",
+    (True, False, True): "MERGE(r, {{ vertex_id: r.id{vjoin} }})",
+    (True, True, False): "{{ vertex_id: r.id, {projection}{vjoin} }}",
+}
+
+
+def _build_export_query(
+    fields: Optional[List[str]],
+    join_vertex: bool,
+    vertex_fields: Optional[List[str]],
+    flatten: bool,
+    stringify: bool = False,
+) -> str:
+    """
+    Build the default export query with server-side field projection.
+
+    The result collection is referenced through the @@col bind parameter.
+    When fields are given, only those attributes are returned so ArangoDB
+    projects documents before they are sent over the wire.
+
+    Args:
+        fields: Result fields to return (if None, whole result documents)
+        join_vertex: Whether to join each result with its vertex document
+        vertex_fields: Vertex fields to include when joining
+        flatten: Merge whole result documents into the joined row (CSV)
+                 instead of nesting them under 'result' (JSON)
+        stringify: Return each row as a JSON string serialized by the
+                   server (JSON_STRINGIFY) instead of a document
+    """
+    has_fields = bool(fields)
+    # Flattening only changes the join query that returns whole documents
+    flatten = flatten and join_vertex and not has_fields
+    template = _EXPORT_ROW_TEMPLATES[(join_vertex, has_fields, flatten)]
+
+    projection = _compile_projection("r", tuple(fields)) if has_fields else ""
+    vjoin = ""
+    if join_vertex and vertex_fields:
+        vjoin = ", " + _compile_projection("person", tuple(vertex_fields))
+
+    row = template.format(projection=projection, vjoin=vjoin)
+    if stringify:
+        row = f"JSON_STRINGIFY({row})"
+
+    if join_vertex:
+        return f"{_EXPORT_JOIN_PREFIX}{row}\n"
+    return _EXPORT_PREFIX + row
+
+
+# (opening, separator, closing) bytes per JSON export format, keyed on pretty
+_JSON_EXPORT_FORMATS = {
+    "json": {True: (b"[\n", b",\n", b"\n]"), False: (b"[", b",", b"]")},
+    "ndjson": {False: (b"", b"\n", b"\n")},
+}
+
+
+def _write_csv_stream(
+    f: TextIO, first: Any, cursor: Iterator[Any], include_headers: bool
+) -> int:
+    """
+    Write a peeked first row and the rest of a cursor to an open CSV file.
+
+    The row accessor is chosen once from the first row: documents are
+    written as columns of their keys (with a header row), sequences as-is
+    and scalars as single-column rows.
+
+    Returns:
+        Number of rows written
+    """
+    writer = csv.writer(f)
+
+    if isinstance(first, dict):
+        fieldnames = list(first.keys())
+        if include_headers:
+            writer.writerow(fieldnames)
+        get_row = _row_getter(fieldnames) if fieldnames else lambda doc: ()
+    elif isinstance(first, (list, tuple)):
+        get_row = lambda row: row
+    else:
+        get_row = lambda value: (value,)
+
+    writer.writerow(get_row(first))
+    count = 1
+    while True:
+        chunk = list(islice(cursor, DEFAULT_EXPORT_WRITE_CHUNK_SIZE))
+        if not chunk:
+            return count
+        writer.writerows(map(get_row, chunk))
+        count += len(chunk)
+
 
 def export_results_to_csv(
     db: StandardDatabase,
@@ -56,63 +246,44 @@ def export_results_to_csv(
     output_path = Path(output_path)
 
     # Build query if not provided
+    bind_vars = None
     if query is None:
-        if join_vertex:
-            vertex_selects = []
-            if vertex_fields:
-                for field in vertex_fields:
-                    parts = field.split(".")
-                    vertex_selects.append(f"{parts[-1]}: person.{field}")
-
-            vertex_join = ", " + ", ".join(vertex_selects) if vertex_selects else ""
-
-            query = f"""
-            FOR r IN {result_collection}
-              LET person = DOCUMENT(r.id)
-              RETURN {{
-                vertex_id: r.id,
-                {', '.join(fields) if fields else '*'},
-                {vertex_join}
-              }}
-            """
-        else:
-            field_list = ", ".join(fields) if fields else "*"
-            query = f"FOR r IN {result_collection} RETURN {field_list}"
-
-    # Execute query
+        query = _build_export_query(fields, join_vertex, vertex_fields, flatten=True)
+        bind_vars = {"@col": result_collection}
+
+    # Execute query as a streaming cursor so rows are written as they arrive
     try:
-        results = list(db.aql.execute(query))
+        cursor = iter(
+            db.aql.execute(
+                query,
+                bind_vars=bind_vars,
+                stream=True,
+                batch_size=DEFAULT_CURSOR_BATCH_SIZE,
+            )
+        )
     except Exception as e:
         logger.error(f"Failed to execute query: {e}")
         raise
 
-    if not results:
+    # Peek the first row so an empty result never creates an output file
+    first = next(cursor, None)
+    if first is None:
         logger.warning(f"No results found for collection '{result_collection}'")
         return 0
 
     # Write to CSV
     try:
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
-            if not results:
-                return 0
-
-            # Handle case where results might be strings or dicts
-            if isinstance(results[0], dict):
-                writer = csv.DictWriter(f, fieldnames=results[0].keys())
-                if include_headers:
-                    writer.writeheader()
-                writer.writerows(results)
-            else:
-                # If results are not dicts, write as-is
-                writer = csv.writer(f)
-                if include_headers and results:
-                    writer.writerow(
-                        results[0].keys() if isinstance(results[0], dict) else []
-                    )
-                writer.writerows(results)
-
-        logger.info(f"Exported {len(results)} rows to {output_path}")
-        return len(results)
+        with open(
+            output_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=EXPORT_FILE_BUFFER_SIZE,
+        ) as f:
+            count = _write_csv_stream(f, first, cursor, include_headers)
+
+        logger.info(f"Exported {count} rows to {output_path}")
+        return count
     except Exception as e:
         logger.error(f"Failed to write CSV file: {e}")
         raise
@@ -127,6 +298,8 @@ def export_results_to_json(
     join_vertex: bool = False,
     vertex_collection: str = "nodes",
     vertex_fields: Optional[List[str]] = None,
+    fields: Optional[List[str]] = None,
+    format: str = "json",
 ) -> int:
     """
     Export result collection to JSON file.
@@ -140,6 +313,10 @@ def export_results_to_json(
         join_vertex: Whether to join with vertex collection
         vertex_collection: Vertex collection name if joining
         vertex_fields: Optional list of vertex fields to include
+        fields: Optional list of result fields to export (if None, exports
+                whole result documents)
+        format: 'json' for a single JSON array, or 'ndjson' for one compact
+                document per line (pretty is ignored)
 
     Returns:
         Number of documents exported
@@ -153,49 +330,71 @@ def export_results_to_json(
             query="FOR r IN wcc_results FILTER r.component_id != null RETURN r"
         )
     """
+    if format not in _JSON_EXPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported export format: {format!r} "
+            f"(expected one of {', '.join(_JSON_EXPORT_FORMATS)})"
+        )
+    ndjson = format == "ndjson"
+    if ndjson:
+        pretty = False
+
     output_path = Path(output_path)
 
-    # Build query if not provided
+    # Build query if not provided. For compact output the server serializes
+    # each row (JSON_STRINGIFY) and the text is written through unchanged,
+    # skipping the decode-to-dict / re-encode round trip in Python.
+    bind_vars = None
+    raw_rows = False
     if query is None:
-        if join_vertex:
-            vertex_selects = []
-            if vertex_fields:
-                for field in vertex_fields:
-                    parts = field.split(".")
-                    vertex_selects.append(f"{parts[-1]}: person.{field}")
-
-            vertex_join = ", " + ", ".join(vertex_selects) if vertex_selects else ""
-
-            query = f"""
-            FOR r IN {result_collection}
-              LET person = DOCUMENT(r.id)
-              RETURN {{
-                vertex_id: r.id,
-                result: r,
-                {vertex_join}
-              }}
-            """
-        else:
-            query = f"FOR r IN {result_collection} RETURN r"
-
-    # Execute query
+        raw_rows = not pretty
+        query = _build_export_query(
+            fields, join_vertex, vertex_fields, flatten=False, stringify=raw_rows
+        )
+        bind_vars = {"@col": result_collection}
+
+    # Execute query as a streaming cursor so documents are written as they arrive
     try:
-        results = list(db.aql.execute(query))
+        cursor = iter(
+            db.aql.execute(
+                query,
+                bind_vars=bind_vars,
+                stream=True,
+                batch_size=DEFAULT_CURSOR_BATCH_SIZE,
+            )
+        )
     except Exception as e:
         logger.error(f"Failed to execute query: {e}")
         raise
 
-    if not results:
+    # Peek the first document so an empty result never creates an output file
+    first = next(cursor, None)
+    if first is None:
         logger.warning(f"No results found for collection '{result_collection}'")
         return 0
 
-    # Write to JSON
+    # Write to JSON incrementally, one document at a time: either as an
+    # array or, for NDJSON, as newline-delimited documents
+    encode = (lambda row: row.encode("utf-8")) if raw_rows else _json_encoder(pretty)
+    opening, separator, closing = _JSON_EXPORT_FORMATS[format][pretty]
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2 if pretty else None, ensure_ascii=False)
+        count = 0
+        with open(output_path, "wb", buffering=EXPORT_FILE_BUFFER_SIZE) as f:
+            f.write(opening)
+            f.write(encode(first))
+            count += 1
+            # Encode documents in chunks and issue one write per chunk
+            while True:
+                chunk = list(islice(cursor, DEFAULT_EXPORT_WRITE_CHUNK_SIZE))
+                if not chunk:
+                    break
+                f.write(separator)
+                f.write(separator.join(map(encode, chunk)))
+                count += len(chunk)
+            f.write(closing)
 
-        logger.info(f"Exported {len(results)} documents to {output_path}")
-        return len(results)
+        logger.info(f"Exported {count} documents to {output_path}")
+        return count
     except Exception as e:
         logger.error(f"Failed to write JSON file: {e}")
         raise
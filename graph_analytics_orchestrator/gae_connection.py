@@ -4,17 +4,51 @@ Graph Analytics Engine (GAE) Connection
 Unified interface for both Arango Managed Platform (AMP) and self-managed deployments.
 """
 
+import asyncio
+import base64
+import functools
+import json
+import logging
 import os
+import random
+import re
 import requests
 import time
 import subprocess
+import threading
 import warnings
-from typing import Optional, Dict, List, Any, Union
+from contextlib import contextmanager
+from typing import Optional, Callable, Dict, Iterator, List, Any, Sequence, Tuple, Union
 from pathlib import Path
 from datetime import datetime, timedelta
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional: a much faster C parser, with stdlib json as fallback
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
 
 from .config import get_gae_config, get_arango_config, DeploymentMode
+from .db_connection import get_db_connection
+from .results import (
+    ensure_result_collection_indexes,
+    verify_result_collection,
+    validate_result_schema,
+    compare_result_collections,
+    bulk_update_result_metadata,
+    copy_results,
+    delete_results_by_filter,
+)
+from .queries import (
+    cross_reference_results,
+    get_top_influential_connected,
+    get_results_with_details,
+)
+from .export import export_results_to_csv, export_results_to_json
 from .constants import (
     DEFAULT_POLL_INTERVAL,
     DEFAULT_JOB_TIMEOUT,
@@ -32,14 +66,227 @@ from .constants import (
     ICON_ERROR,
     ICON_WARNING,
     API_VERSION_PREFIX,
+    AUTHORIZATION_BEARER_PREFIX,
     TOKEN_LIFETIME_HOURS,
     TOKEN_REFRESH_THRESHOLD_HOURS,
+    GAE_HTTP_POOL_CONNECTIONS,
+    GAE_HTTP_POOL_MAXSIZE,
+    GAE_HTTP_RETRY_ATTEMPTS,
+    GAE_HTTP_BACKOFF_FACTOR,
+    ENGINE_READY_INITIAL_DELAY,
+    ENGINE_READY_MAX_DELAY,
+    BACKOFF_MULTIPLIER,
+    BACKOFF_JITTER,
+    POLL_BACKOFF_CAP,
+    PROGRESS_POLL_ETA_FRACTION,
+    PROGRESS_POLL_MIN_DELAY,
+    GAE_METADATA_CACHE_TTL,
+    GENAI_SERVICE_CACHE_TTL,
+    OASISCTL_TIMEOUT,
+    JWT_REFRESH_MINUTES,
+    JWT_EXPIRY_MARGIN_SECONDS,
 )
 
+logger = logging.getLogger(__name__)
+
+# Shell metacharacters rejected in API keys passed to oasisctl
+_SHELL_META_PATTERN = re.compile(r"[;&|`$()<>]")
+
+# HTTP methods the engine APIs are called with
+_HTTP_METHODS = frozenset(("GET", "POST", "DELETE"))
+
+# Endpoint URL with an explicit port (bracketed IPv6 hosts included)
+_ENDPOINT_PORT_RE = re.compile(r"^https?://(?:\[[^\]/]*\]|[^/:\[]+):\d+")
+
+# Engine API endpoints (relative to the engine URL), built once at import
+_EP_LOADDATA = f"{API_VERSION_PREFIX}loaddata"
+_EP_PAGERANK = f"{API_VERSION_PREFIX}pagerank"
+_EP_WCC = f"{API_VERSION_PREFIX}wcc"
+_EP_SCC = f"{API_VERSION_PREFIX}scc"
+_EP_LABELPROP = f"{API_VERSION_PREFIX}labelpropagation"
+_EP_STORERESULTS = f"{API_VERSION_PREFIX}storeresults"
+_EP_VERSION = f"{API_VERSION_PREFIX}version"
+_EP_JOBS_LIST = f"{API_VERSION_PREFIX}jobs"
+_EP_JOBS = f"{API_VERSION_PREFIX}jobs/"  # + job_id
+_EP_GRAPHS_LIST = f"{API_VERSION_PREFIX}graphs"
+_EP_GRAPHS = f"{API_VERSION_PREFIX}graphs/"  # + graph_id
+
+
+def _create_session() -> requests.Session:
+    """
+    Create a keep-alive HTTP session for GAE API calls.
+
+    Reusing one session keeps the TCP+TLS connection open across requests,
+    so polling loops don't pay a new handshake per call. Transient gateway
+    errors on idempotent requests are retried with backoff; POSTs are not,
+    since a retried deploy or job submission could run twice.
+    """
+    retry_strategy = Retry(
+        total=GAE_HTTP_RETRY_ATTEMPTS,
+        backoff_factor=GAE_HTTP_BACKOFF_FACTOR,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET", "DELETE"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=GAE_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=GAE_HTTP_POOL_MAXSIZE,
+        max_retries=retry_strategy,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body straight from its bytes.
+
+    Uses orjson when installed and skips requests' text decoding step.
+    Returns an empty dict for an empty body.
+    """
+    content = response.content
+    if not content:
+        return {}
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _encode_json(payload: Any) -> bytes:
+    """Encode a request body as JSON bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _jwt_expiry(token: str) -> Optional[datetime]:
+    """
+    Read the expiry time from a JWT's exp claim without verifying it.
+
+    Returns None if the token carries no readable exp claim.
+    """
+    try:
+        claims = token.split(".")[1]
+        claims += "=" * (-len(claims) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(claims)).get("exp")
+        return datetime.fromtimestamp(exp) if exp else None
+    except (IndexError, TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def _backoff_delays(
+    initial: float,
+    maximum: float,
+    multiplier: float = BACKOFF_MULTIPLIER,
+    jitter: float = BACKOFF_JITTER,
+) -> Iterator[float]:
+    """
+    Yield exponentially growing poll delays with a little random jitter.
+
+    Delays start at `initial`, grow by `multiplier` and are capped at
+    `maximum`; each one gets up to `jitter` (a fraction) added on top.
+    """
+    delay = initial
+    while True:
+        yield delay + random.uniform(0, delay * jitter)
+        delay = min(delay * multiplier, maximum)
+
+
+def _full_jitter_delays(base: float, cap: float = POLL_BACKOFF_CAP) -> Iterator[float]:
+    """
+    Yield exponential backoff delays with full jitter.
+
+    Each delay is drawn uniformly from [0, min(cap, base * 2**attempt)], so
+    concurrent pollers spread out instead of hitting the API in lockstep.
+    """
+    attempt = 0
+    while True:
+        yield random.uniform(0, min(cap, base * 2 ** min(attempt, 6)))
+        attempt += 1
+
 
 class GAEConnectionBase(ABC):
     """Base class for GAE connections."""
 
+    # Also print progress messages to stdout (they always go to the logger)
+    verbose = False
+
+    def _report(self, message: str, *args: Any) -> None:
+        """Log a progress message at INFO, printing it too when verbose."""
+        logger.info(message, *args)
+        if self.verbose:
+            print(message % args if args else message)
+
+    def _reporting(self) -> bool:
+        """Check whether progress messages are emitted anywhere."""
+        return self.verbose or logger.isEnabledFor(logging.INFO)
+
+    @contextmanager
+    def request_timeout(self, seconds: float) -> Iterator[None]:
+        """
+        Bound the calling thread's requests by seconds inside the block.
+
+        The connection's own timeout is left untouched, so other threads
+        and later callers keep the value it was configured with.
+        """
+        local = self.__dict__.setdefault("_timeout_local", threading.local())
+        previous = getattr(local, "seconds", None)
+        local.seconds = seconds
+        try:
+            yield
+        finally:
+            local.seconds = previous
+
+    def _request_timeout(self) -> float:
+        """Timeout for the calling thread's next request."""
+        local = self.__dict__.get("_timeout_local")
+        seconds = getattr(local, "seconds", None)
+        return self.timeout if seconds is None else seconds
+
+    def _with_request_timeout(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Bind the calling thread's request timeout to func for a worker thread.
+
+        The override is thread-local, so calls handed to a pool would
+        otherwise fall back to the connection's default timeout.
+        """
+        seconds = getattr(self.__dict__.get("_timeout_local"), "seconds", None)
+        if seconds is None:
+            return func
+
+        @functools.wraps(func)
+        def run(*args: Any, **kwargs: Any) -> Any:
+            with self.request_timeout(seconds):
+                return func(*args, **kwargs)
+
+        return run
+
+    def _cached(self, key: str, ttl: float, load: Callable[[], Any]) -> Any:
+        """
+        Return a cached API result younger than ttl seconds, else load it.
+
+        Subclasses keep the entries in self._response_cache.
+        """
+        now = time.monotonic()
+        entry = self._response_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        value = load()
+        self._response_cache[key] = (now + ttl, value)
+        return value
+
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     @abstractmethod
     def _request(
         self,
@@ -54,8 +301,9 @@ class GAEConnectionBase(ABC):
 
     def _normalize_job_response(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize job response to have consistent 'id' field."""
-        if "job_id" in job and "id" not in job:
-            job["id"] = job["job_id"]
+        job_id = job.get("job_id")
+        if job_id is not None:
+            job.setdefault("id", job_id)
         return job
 
     @abstractmethod
@@ -100,23 +348,26 @@ class GAEConnectionBase(ABC):
 
         if graph_name:
             payload["graph_name"] = graph_name
-            msg = f"Loading named graph '{graph_name}' from database '{database}'..."
+            self._report(
+                "Loading named graph '%s' from database '%s'...", graph_name, database
+            )
         else:
             payload["vertex_collections"] = vertex_collections
             payload["edge_collections"] = edge_collections
-            msg = (
-                f"Loading graph from database '{database}': "
-                f"{len(vertex_collections)} vertex collections, "
-                f"{len(edge_collections)} edge collections"
+            self._report(
+                "Loading graph from database '%s': "
+                "%d vertex collections, %d edge collections",
+                database,
+                len(vertex_collections),
+                len(edge_collections),
             )
 
         if vertex_attributes:
             payload["vertex_attributes"] = vertex_attributes
 
-        print(msg)
         result = self._request(
             method="POST",
-            endpoint=f"{API_VERSION_PREFIX}loaddata",
+            endpoint=_EP_LOADDATA,
             payload=payload,
             success_message="Load data job submitted",
             error_message="Failed to load graph",
@@ -137,10 +388,10 @@ class GAEConnectionBase(ABC):
             "maximum_supersteps": maximum_supersteps,
         }
 
-        print(f"Running PageRank on graph {graph_id}...")
+        self._report("Running PageRank on graph %s...", graph_id)
         result = self._request(
             method="POST",
-            endpoint=f"{API_VERSION_PREFIX}pagerank",
+            endpoint=_EP_PAGERANK,
             payload=payload,
             success_message="PageRank job submitted: {job_id}",
             error_message="Failed to run PageRank",
@@ -151,10 +402,10 @@ class GAEConnectionBase(ABC):
         """Run Weakly Connected Components."""
         payload = {"graph_id": graph_id}
 
-        print(f"Running WCC on graph {graph_id}...")
+        self._report("Running WCC on graph %s...", graph_id)
         result = self._request(
             method="POST",
-            endpoint=f"{API_VERSION_PREFIX}wcc",
+            endpoint=_EP_WCC,
             payload=payload,
             success_message="WCC job submitted: {job_id}",
             error_message="Failed to run WCC",
@@ -165,10 +416,10 @@ class GAEConnectionBase(ABC):
         """Run Strongly Connected Components."""
         payload = {"graph_id": graph_id}
 
-        print(f"Running SCC on graph {graph_id}...")
+        self._report("Running SCC on graph %s...", graph_id)
         result = self._request(
             method="POST",
-            endpoint=f"{API_VERSION_PREFIX}scc",
+            endpoint=_EP_SCC,
             payload=payload,
             success_message="SCC job submitted: {job_id}",
             error_message="Failed to run SCC",
@@ -192,10 +443,10 @@ class GAEConnectionBase(ABC):
             "maximum_supersteps": maximum_supersteps,
         }
 
-        print(f"Running Label Propagation on graph {graph_id}...")
+        self._report("Running Label Propagation on graph %s...", graph_id)
         result = self._request(
             method="POST",
-            endpoint=f"{API_VERSION_PREFIX}labelpropagation",
+            endpoint=_EP_LABELPROP,
             payload=payload,
             success_message="Label Propagation job submitted: {job_id}",
             error_message="Failed to run Label Propagation",
@@ -224,23 +475,174 @@ class GAEConnectionBase(ABC):
             "batch_size": batch_size,
         }
 
-        print(
-            f"Storing {len(job_ids)} job results to {database}.{target_collection}..."
+        self._report(
+            "Storing %d job results to %s.%s...",
+            len(job_ids),
+            database,
+            target_collection,
         )
         result = self._request(
             method="POST",
-            endpoint=f"{API_VERSION_PREFIX}storeresults",
+            endpoint=_EP_STORERESULTS,
             payload=payload,
             success_message="Store results job submitted: {job_id}",
             error_message="Failed to store results",
         )
         return self._normalize_job_response(result)
 
+    # ====================================================================
+    # ASYNC SUBMISSION
+    # ====================================================================
+
+    async def _run_async(self, func, *args, **kwargs) -> Dict[str, Any]:
+        """Run a blocking API method on the event loop's default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self._with_request_timeout(func), *args, **kwargs)
+        )
+
+    async def arun_pagerank(
+        self,
+        graph_id: str,
+        damping_factor: float = DEFAULT_DAMPING_FACTOR,
+        maximum_supersteps: int = DEFAULT_MAX_SUPERSTEPS,
+    ) -> Dict[str, Any]:
+        """Async variant of run_pagerank()."""
+        return await self._run_async(
+            self.run_pagerank, graph_id, damping_factor, maximum_supersteps
+        )
+
+    async def arun_wcc(self, graph_id: str) -> Dict[str, Any]:
+        """Async variant of run_wcc()."""
+        return await self._run_async(self.run_wcc, graph_id)
+
+    async def arun_scc(self, graph_id: str) -> Dict[str, Any]:
+        """Async variant of run_scc()."""
+        return await self._run_async(self.run_scc, graph_id)
+
+    async def arun_label_propagation(self, graph_id: str, **kwargs) -> Dict[str, Any]:
+        """Async variant of run_label_propagation()."""
+        return await self._run_async(self.run_label_propagation, graph_id, **kwargs)
+
+    async def submit_all(
+        self,
+        graph_id: str,
+        algorithms: Sequence[str] = ("pagerank", "wcc", "scc"),
+    ) -> List[Dict[str, Any]]:
+        """
+        Submit several algorithms on the same graph concurrently.
+
+        Submissions overlap on the shared keep-alive session, so N jobs take
+        roughly one round-trip instead of N. Default parameters are used.
+
+        Args:
+            graph_id: Loaded graph ID
+            algorithms: Algorithm names ('pagerank', 'wcc', 'scc',
+                        'label_propagation')
+
+        Returns:
+            Normalized job responses, in the order of `algorithms`
+        """
+        submitters = self._algorithm_submitters()
+        unknown = [name for name in algorithms if name not in submitters]
+        if unknown:
+            raise ValueError(f"Unsupported algorithm(s): {', '.join(unknown)}")
+
+        return list(
+            await asyncio.gather(
+                *(self._run_async(submitters[name], graph_id) for name in algorithms)
+            )
+        )
+
+    def _algorithm_submitters(self) -> Dict[str, Callable[..., Dict[str, Any]]]:
+        """Map algorithm names to the methods that submit them."""
+        return {
+            "pagerank": self.run_pagerank,
+            "wcc": self.run_wcc,
+            "scc": self.run_scc,
+            "label_propagation": self.run_label_propagation,
+        }
+
+    def submit_batch(
+        self,
+        graph_id: str,
+        algos: List[Dict[str, Any]],
+        max_workers: int = GAE_HTTP_POOL_MAXSIZE // 2,
+    ) -> List[Dict[str, Any]]:
+        """
+        Submit several algorithm jobs on the same graph in one call.
+
+        The engine API has no batch endpoint, so the jobs are submitted
+        concurrently over the shared keep-alive session instead of one
+        after another.
+
+        Args:
+            graph_id: Loaded graph ID
+            algos: One dict per job, naming the algorithm under 'algorithm'
+                   ('pagerank', 'wcc', 'scc', 'label_propagation'); other
+                   keys are passed as algorithm parameters
+            max_workers: Maximum concurrent submissions
+
+        Returns:
+            Normalized job responses, in the order of `algos`
+
+        Example:
+            jobs = gae.submit_batch(graph_id, [
+                {"algorithm": "pagerank", "damping_factor": 0.9},
+                {"algorithm": "wcc"},
+            ])
+        """
+        submitters = self._algorithm_submitters()
+        calls = []
+        for spec in algos:
+            params = dict(spec)
+            name = params.pop("algorithm", None)
+            if name not in submitters:
+                raise ValueError(f"Unsupported algorithm: {name}")
+            calls.append(functools.partial(submitters[name], graph_id, **params))
+
+        if len(calls) <= 1:
+            return [call() for call in calls]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+            futures = [pool.submit(self._with_request_timeout(call)) for call in calls]
+            return [future.result() for future in futures]
+
     @abstractmethod
     def get_job(self, job_id: str) -> Dict[str, Any]:
         """Get job status."""
         pass
 
+    def get_jobs(
+        self, job_ids: List[str], max_workers: int = GAE_HTTP_POOL_MAXSIZE // 2
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the status of several jobs concurrently.
+
+        The requests are independent, so they run on a thread pool and the
+        total wait is roughly the slowest single request.
+
+        Args:
+            job_ids: Job IDs to look up
+            max_workers: Maximum concurrent requests
+
+        Returns:
+            Job status dictionaries, in the order of `job_ids`
+        """
+        if not job_ids:
+            return []
+        if len(job_ids) == 1:
+            return [self.get_job(job_ids[0])]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(job_ids))) as pool:
+            return list(pool.map(self._with_request_timeout(self.get_job), job_ids))
+
+    def get_jobs_by_id(
+        self, job_ids: List[str], max_workers: int = GAE_HTTP_POOL_MAXSIZE // 2
+    ) -> Dict[str, Dict[str, Any]]:
+        """Like get_jobs(), but keyed by job ID."""
+        return dict(zip(job_ids, self.get_jobs(job_ids, max_workers)))
+
     @abstractmethod
     def get_graph(self, graph_id: str) -> Dict[str, Any]:
         """Get graph details."""
@@ -260,13 +662,25 @@ class GAEManager(GAEConnectionBase):
     # Refresh token proactively when it's this close to expiry
     TOKEN_REFRESH_THRESHOLD_HOURS = TOKEN_REFRESH_THRESHOLD_HOURS
 
-    def __init__(self, auto_refresh: bool = True):
+    def __init__(
+        self,
+        auto_refresh: bool = True,
+        verbose: bool = False,
+        timeout: int = DEFAULT_TIMEOUT,
+    ):
         """
         Initialize GAE Manager with credentials from environment.
 
         Args:
             auto_refresh: Enable automatic token refresh (default: True)
+            verbose: Print progress messages to stdout as well as logging
+                     them (default: False)
+            timeout: Request timeout in seconds, so a server that never
+                     answers cannot hang a call
         """
+        self.verbose = verbose
+        self.timeout = timeout
+
         # Get configuration from environment
         config = get_gae_config()
 
@@ -283,12 +697,20 @@ class GAEManager(GAEConnectionBase):
 
         # Management API base URL
         self.base_url = f"{self.deployment_url}:{self.gae_port}/graph-analytics/api/graphanalytics/v1"
+        self._mgmt_prefix = self.base_url + "/"
+
+        # Keep-alive HTTP session shared by all API calls
+        self._session = _create_session()
 
         # Token management
         self.auto_refresh = auto_refresh
         self.access_token = None
         self.token_created_at = None
 
+        # Request headers, reused across calls; Authorization tracks the token
+        self._headers = {"Authorization": "", "Content-Type": "application/json"}
+        self._headers_token = None
+
         # Get or generate access token
         self._initialize_token(config)
 
@@ -296,22 +718,25 @@ class GAEManager(GAEConnectionBase):
         self.current_engine_id = None
         self.current_engine_url = None
 
+        # Short-lived API responses: key -> (expires_at monotonic, value)
+        self._response_cache: Dict[str, Tuple[float, Any]] = {}
+
     def _initialize_token(self, config: Dict[str, str]) -> None:
         """Initialize access token from environment or generate a new one."""
         # Try to use existing token from environment
         token = config.get("access_token", "")
         if token:
-            print("Using existing access token from environment")
+            self._report("Using existing access token from environment")
             self.access_token = token
             self.token_created_at = datetime.now()
         else:
             # Generate new token
-            print("No token found in environment, generating new token...")
+            self._report("No token found in environment, generating new token...")
             self._refresh_token()
 
     def _refresh_token(self) -> None:
         """Generate a new access token using oasisctl."""
-        print("Refreshing access token...")
+        self._report("Refreshing access token...")
 
         # Validate API key format (basic validation to prevent command injection)
         if not self.api_key_id or not isinstance(self.api_key_id, str):
@@ -320,15 +745,9 @@ class GAEManager(GAEConnectionBase):
             raise ValueError("Invalid API key secret format")
 
         # Sanitize: ensure no shell metacharacters
-        if any(
-            char in self.api_key_id
-            for char in [";", "&", "|", "`", "$", "(", ")", "<", ">"]
-        ):
+        if _SHELL_META_PATTERN.search(self.api_key_id):
             raise ValueError("API key ID contains invalid characters")
-        if any(
-            char in self.api_key_secret
-            for char in [";", "&", "|", "`", "$", "(", ")", "<", ">"]
-        ):
+        if _SHELL_META_PATTERN.search(self.api_key_secret):
             raise ValueError("API key secret contains invalid characters")
 
         try:
@@ -342,10 +761,12 @@ class GAEManager(GAEConnectionBase):
                     "--key-secret",
                     self.api_key_secret,
                 ],
+                stdin=subprocess.DEVNULL,  # Never wait on terminal input
                 capture_output=True,
                 text=True,
                 check=True,
                 shell=False,  # Explicitly disable shell
+                timeout=OASISCTL_TIMEOUT,
             )
 
             # Extract token from stdout
@@ -356,14 +777,19 @@ class GAEManager(GAEConnectionBase):
 
             self.access_token = token
             self.token_created_at = datetime.now()
-            print(
-                f"OK: Token refreshed successfully at {self.token_created_at.strftime('%Y-%m-%d %H:%M:%S')}"
+            self._report(
+                "OK: Token refreshed successfully at %s",
+                self.token_created_at.strftime("%Y-%m-%d %H:%M:%S"),
             )
 
         except subprocess.CalledProcessError as e:
             error_msg = f"Failed to generate token: {e.stderr}"
-            print(f"Error: {error_msg}")
+            logger.error("Error: %s", error_msg)
             raise RuntimeError(error_msg) from e
+        except subprocess.TimeoutExpired as e:
+            raise RuntimeError(
+                f"oasisctl did not return a token within {OASISCTL_TIMEOUT} seconds"
+            ) from e
         except FileNotFoundError:
             raise RuntimeError(
                 "oasisctl not found. Please install it:\n"
@@ -371,18 +797,34 @@ class GAEManager(GAEConnectionBase):
                 "  Other: https://github.com/arangodb-managed/oasisctl/releases"
             )
 
+    @property
+    def token_created_at(self) -> Optional[datetime]:
+        """Wall-clock time the current token was obtained (for display)."""
+        return self._token_created_at
+
+    @token_created_at.setter
+    def token_created_at(self, created_at: Optional[datetime]) -> None:
+        self._token_created_at = created_at
+        # Expiry checks use the monotonic clock, immune to wall-clock jumps
+        if created_at is None:
+            self._token_created_monotonic = None
+        else:
+            age = (datetime.now() - created_at).total_seconds()
+            self._token_created_monotonic = time.monotonic() - age
+
+    def _token_age_seconds(self) -> float:
+        """Seconds since the current token was obtained."""
+        return time.monotonic() - self._token_created_monotonic
+
     def _is_token_expired(self) -> bool:
         """Check if the token is expired or close to expiry."""
-        if not self.token_created_at:
+        if self._token_created_monotonic is None:
             return True
 
-        age = datetime.now() - self.token_created_at
-        threshold = timedelta(
-            hours=self.TOKEN_LIFETIME_HOURS - self.TOKEN_REFRESH_THRESHOLD_HOURS
+        return self._token_age_seconds() >= (
+            (self.TOKEN_LIFETIME_HOURS - self.TOKEN_REFRESH_THRESHOLD_HOURS) * 3600
         )
 
-        return age >= threshold
-
     def _ensure_token_valid(self) -> None:
         """Ensure the access token is valid, refreshing if necessary."""
         if not self.auto_refresh:
@@ -390,11 +832,11 @@ class GAEManager(GAEConnectionBase):
 
         if self._is_token_expired():
             age_hours = (
-                (datetime.now() - self.token_created_at).total_seconds() / 3600
-                if self.token_created_at
+                self._token_age_seconds() / 3600
+                if self._token_created_monotonic is not None
                 else 0
             )
-            print(f"Token is {age_hours:.1f} hours old, refreshing...")
+            self._report("Token is %.1f hours old, refreshing...", age_hours)
             self._refresh_token()
 
     def _api_request_with_retry(
@@ -406,17 +848,24 @@ class GAEManager(GAEConnectionBase):
         max_retries: int = 1,
     ) -> requests.Response:
         """Make an API request with automatic retry on 401 errors."""
+        if method not in _HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        # Encode once; headers already carry Content-Type: application/json
+        body = (
+            _encode_json(json_data)
+            if method == "POST" and json_data is not None
+            else None
+        )
+
         for attempt in range(max_retries + 1):
             try:
-                if method == "GET":
-                    response = requests.get(url, headers=headers)
-                elif method == "POST":
-                    response = requests.post(url, headers=headers, json=json_data)
-                elif method == "DELETE":
-                    response = requests.delete(url, headers=headers)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-
+                response = self._session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=body,
+                    timeout=self._request_timeout(),
+                )
                 response.raise_for_status()
                 return response
 
@@ -427,88 +876,142 @@ class GAEManager(GAEConnectionBase):
                     and attempt < max_retries
                     and self.auto_refresh
                 ):
-                    print("Token expired (401 error), refreshing and retrying...")
+                    self._report(
+                        "Token expired (401 error), refreshing and retrying..."
+                    )
                     self._refresh_token()
                     # Update headers with new token
-                    headers["Authorization"] = f"bearer {self.access_token}"
+                    headers = self._auth_headers()
                     continue
                 else:
                     raise
 
         raise RuntimeError("Request failed after all retry attempts")
 
+    def _auth_headers(self) -> Dict[str, str]:
+        """Get the shared request headers, updating them only when the token changes."""
+        if self._headers_token != self.access_token:
+            self._headers["Authorization"] = (
+                f"{AUTHORIZATION_BEARER_PREFIX} {self.access_token}"
+            )
+            self._headers_token = self.access_token
+        return self._headers
+
     def _management_headers(self) -> Dict[str, str]:
         """Get headers for Management API requests."""
-        return {
-            "Authorization": f"bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        return self._auth_headers()
 
     def _engine_headers(self) -> Dict[str, str]:
         """Get headers for Engine API requests."""
-        return {
-            "Authorization": f"bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        return self._auth_headers()
 
-    def _request(
+    def _call(
         self,
         method: str,
-        endpoint: str,
+        url: str,
+        headers: Dict[str, str],
         payload: Optional[Dict[str, Any]] = None,
         success_message: Optional[str] = None,
         error_message: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Make a call to the GAE API."""
-        self._ensure_token_valid()
-
-        # Determine if it's a management call or engine call
-        if (
-            "engines" in endpoint
-            or "enginesizes" in endpoint
-            or "api-version" in endpoint
-        ):
-            url = f"{self.base_url}/{endpoint.lstrip('/')}"
-            headers = self._management_headers()
-        else:
-            if not self.current_engine_url:
-                raise ValueError("No engine URL set. Deploy an engine first.")
-            url = f"{self.current_engine_url}/{endpoint.lstrip('/')}"
-            headers = self._engine_headers()
-
+        """Send a request to a fully built URL and decode the JSON response."""
         try:
             response = self._api_request_with_retry(
                 method, url, headers, json_data=payload
             )
-            result = response.json() if response.text else {}
+            result = _decode_json(response)
 
-            if success_message:
+            if success_message and self._reporting():
                 job_id = result.get("job_id", result.get("id", "N/A"))
                 formatted_msg = (
                     success_message.format(job_id=job_id)
                     if "{job_id}" in success_message
                     else success_message
                 )
-                print(f"{ICON_SUCCESS} {formatted_msg}")
+                self._report("%s %s", ICON_SUCCESS, formatted_msg)
 
             return result
         except Exception as e:
             if error_message:
-                print(f"{ICON_ERROR} {error_message}: {e}")
+                logger.error("%s %s: %s", ICON_ERROR, error_message, e)
             raise
 
+    @property
+    def current_engine_url(self) -> Optional[str]:
+        """Base URL of the current engine's API, or None if no engine is set."""
+        return self._current_engine_url
+
+    @current_engine_url.setter
+    def current_engine_url(self, url: Optional[str]) -> None:
+        self._current_engine_url = url
+        # Endpoints are appended to this on every engine call
+        self._engine_prefix = url + "/" if url else None
+
+    def _request_mgmt(
+        self,
+        method: str,
+        endpoint: str,
+        payload: Optional[Dict[str, Any]] = None,
+        success_message: Optional[str] = None,
+        error_message: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Make a call to the Management API (engines, sizes, API version)."""
+        self._ensure_token_valid()
+        url = self._mgmt_prefix + endpoint
+        return self._call(
+            method,
+            url,
+            self._management_headers(),
+            payload,
+            success_message,
+            error_message,
+        )
+
+    def _request_engine(
+        self,
+        method: str,
+        endpoint: str,
+        payload: Optional[Dict[str, Any]] = None,
+        success_message: Optional[str] = None,
+        error_message: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Make a call to the current engine's API (graphs, jobs, algorithms)."""
+        self._ensure_token_valid()
+        if self._engine_prefix is None:
+            raise ValueError("No engine URL set. Deploy an engine first.")
+        url = self._engine_prefix + endpoint
+        return self._call(
+            method,
+            url,
+            self._engine_headers(),
+            payload,
+            success_message,
+            error_message,
+        )
+
+    # Shared submission methods (load_graph, run_*, store_results) use the
+    # engine API
+    _request = _request_engine
+
     def get_api_version(self) -> Dict[str, Any]:
-        """Get the Management API version."""
-        return self._request("GET", "api-version")
+        """Get the Management API version (cached for an hour)."""
+        return self._cached(
+            "api-version",
+            GAE_METADATA_CACHE_TTL,
+            lambda: self._request_mgmt("GET", "api-version"),
+        )
 
     def list_engine_sizes(self) -> List[Dict[str, Any]]:
-        """List available engine sizes."""
-        result = self._request("GET", "enginesizes")
-        return result.get("items", [])
+        """List available engine sizes (cached for an hour)."""
+        return self._cached(
+            "enginesizes",
+            GAE_METADATA_CACHE_TTL,
+            lambda: self._request_mgmt("GET", "enginesizes").get("items", []),
+        )
 
     def list_engines(self) -> List[Dict[str, Any]]:
         """List all deployed engines."""
-        result = self._request("GET", "engines")
+        result = self._request_mgmt("GET", "engines")
         return result.get("items", [])
 
     def deploy_engine(
@@ -517,18 +1020,21 @@ class GAEManager(GAEConnectionBase):
         """Deploy a new Graph Analytics Engine."""
         payload = {"type_id": type_id, "size_id": size_id}
 
-        print(f"Deploying {type_id} engine with size {size_id}...")
-        engine_info = self._request("POST", "engines", payload=payload)
+        self._report("Deploying %s engine with size %s...", type_id, size_id)
+        engine_info = self._request_mgmt("POST", "engines", payload=payload)
 
         self.current_engine_id = engine_info.get("id")
 
         # Wait for engine to be ready
-        print("Waiting for engine to start...")
+        self._report("Waiting for engine to start...")
         engine_details = self._wait_for_engine_ready(self.current_engine_id)
 
         self.current_engine_url = engine_details["status"]["endpoint"]
-        print(f"OK: Engine deployed successfully: {self.current_engine_id}")
-        print(f"  Engine URL: {self.current_engine_url}")
+        self._report(
+            "OK: Engine deployed successfully: %s\n  Engine URL: %s",
+            self.current_engine_id,
+            self.current_engine_url,
+        )
 
         # Additional wait for API endpoints to be ready
         self._wait_for_engine_api_ready()
@@ -543,14 +1049,14 @@ class GAEManager(GAEConnectionBase):
         if engine_id is None:
             raise ValueError("No engine ID specified and no current engine set")
 
-        print(f"Deleting engine {engine_id}...")
-        result = self._request("DELETE", f"engines/{engine_id}")
+        self._report("Deleting engine %s...", engine_id)
+        result = self._request_mgmt("DELETE", f"engines/{engine_id}")
 
         if engine_id == self.current_engine_id:
             self.current_engine_id = None
             self.current_engine_url = None
 
-        print("OK: Engine deleted successfully")
+        self._report("OK: Engine deleted successfully")
         return result
 
     def _wait_for_engine_ready(
@@ -558,6 +1064,7 @@ class GAEManager(GAEConnectionBase):
     ) -> Dict[str, Any]:
         """Wait for engine to be in ready state."""
         start_time = time.time()
+        delays = _backoff_delays(ENGINE_READY_INITIAL_DELAY, ENGINE_READY_MAX_DELAY)
         while time.time() - start_time < timeout:
             engine = self.get_engine(engine_id)
             status = engine.get("status", {})
@@ -565,13 +1072,13 @@ class GAEManager(GAEConnectionBase):
             if status.get("is_started") and status.get("succeeded"):
                 return engine
 
-            time.sleep(2)
+            time.sleep(next(delays))
 
         raise TimeoutError(f"Engine {engine_id} did not start within {timeout} seconds")
 
     def get_engine(self, engine_id: str) -> Dict[str, Any]:
         """Get details about a specific engine."""
-        return self._request("GET", f"engines/{engine_id}")
+        return self._request_mgmt("GET", f"engines/{engine_id}")
 
     def _wait_for_engine_api_ready(
         self,
@@ -579,18 +1086,22 @@ class GAEManager(GAEConnectionBase):
         retry_delay: int = DEFAULT_RETRY_DELAY,
     ) -> None:
         """Wait for engine API endpoints to be ready."""
-        print("Waiting for engine API to be ready...")
+        self._report("Waiting for engine API to be ready...")
         start_time = time.time()
         last_error = None
+        # Back off from a short first wait up to retry_delay between attempts
+        delays = _backoff_delays(
+            min(ENGINE_READY_INITIAL_DELAY, retry_delay), retry_delay
+        )
 
         while time.time() - start_time < timeout:
             try:
                 self.get_engine_version()
-                print("OK: Engine API is ready")
+                self._report("OK: Engine API is ready")
                 return
             except Exception as e:
                 last_error = e
-                time.sleep(retry_delay)
+                time.sleep(next(delays))
 
         raise TimeoutError(
             f"Engine API did not become ready within {timeout} seconds. "
@@ -599,15 +1110,15 @@ class GAEManager(GAEConnectionBase):
 
     def get_engine_version(self) -> Dict[str, Any]:
         """Get the Engine API version."""
-        return self._request("GET", "v1/version")
+        return self._request_engine("GET", _EP_VERSION)
 
     def get_job(self, job_id: str) -> Dict[str, Any]:
         """Get details about a specific job."""
-        return self._request("GET", f"v1/jobs/{job_id}")
+        return self._request_engine("GET", _EP_JOBS + job_id)
 
     def get_graph(self, graph_id: str) -> Dict[str, Any]:
         """Get details about a specific graph."""
-        return self._request("GET", f"v1/graphs/{graph_id}")
+        return self._request_engine("GET", _EP_GRAPHS + graph_id)
 
 
 class GenAIGAEConnection(GAEConnectionBase):
@@ -626,6 +1137,7 @@ class GenAIGAEConnection(GAEConnectionBase):
         timeout: int = DEFAULT_TIMEOUT,
         verify_ssl: bool = False,
         auto_reuse_services: bool = True,
+        verbose: bool = False,
     ):
         """
         Initialize GenAI GAE Connection.
@@ -638,7 +1150,11 @@ class GenAIGAEConnection(GAEConnectionBase):
             timeout: Request timeout in seconds
             verify_ssl: Verify SSL certificates (False for self-signed)
             auto_reuse_services: Automatically reuse existing services (default: True)
+            verbose: Print progress messages to stdout as well as logging
+                     them (default: False)
         """
+        self.verbose = verbose
+
         # Get config from environment or parameters
         arango_config = get_arango_config()
 
@@ -662,10 +1178,28 @@ class GenAIGAEConnection(GAEConnectionBase):
                 UserWarning,
             )
 
+        # Keep-alive HTTP session shared by all API calls. Calls still pass
+        # verify explicitly: REQUESTS_CA_BUNDLE would override the session
+        # default and re-enable verification for self-signed deployments.
+        self._session = _create_session()
+        self._session.verify = self.verify_ssl
+        self._session.headers["Content-Type"] = "application/json"
+
         # Will be populated after authentication
         self.jwt_token: Optional[str] = None
+        self._jwt_created_at: Optional[datetime] = None
+        self._jwt_expires_at: Optional[datetime] = None
         self.engine_id: Optional[str] = None
 
+        # JWT currently set as the session's Authorization header
+        self._headers_token: Optional[str] = None
+
+        # Database handle for result helpers, opened on first get_db()
+        self._db = None
+
+        # Service listings and engine versions: key -> (expires_at, value)
+        self._response_cache: Dict[str, Tuple[float, Any]] = {}
+
         # Validate required credentials
         if not self.db_endpoint or not self.db_password:
             raise ValueError(
@@ -673,113 +1207,180 @@ class GenAIGAEConnection(GAEConnectionBase):
             )
 
         # Validate endpoint format - warn if missing port (common configuration issue)
-        if self.db_endpoint and self.db_endpoint.startswith("http"):
-            # Extract hostname part (after protocol)
-            host_part = self.db_endpoint.split("://", 1)[-1].split("/", 1)[0]
-            # Check if port is missing (no colon in hostname part)
-            if ":" not in host_part:
-                warnings.warn(
-                    f"ARANGO_ENDPOINT appears to be missing the port number.\n"
-                    f"  Current: {self.db_endpoint}\n"
-                    f"  Expected: {self.db_endpoint}:8529\n"
-                    f"  If you get 401 errors, add :8529 to your endpoint URL.",
-                    UserWarning,
-                )
+        if self.db_endpoint.startswith("http") and not _ENDPOINT_PORT_RE.match(
+            self.db_endpoint
+        ):
+            warnings.warn(
+                f"ARANGO_ENDPOINT appears to be missing the port number.\n"
+                f"  Current: {self.db_endpoint}\n"
+                f"  Expected: {self.db_endpoint}:8529\n"
+                f"  If you get 401 errors, add :8529 to your endpoint URL.",
+                UserWarning,
+            )
 
     def _get_jwt_token(self) -> str:
         """Get JWT session token from ArangoDB."""
-        print("Getting JWT token from ArangoDB...")
+        self._report("Getting JWT token from ArangoDB...")
 
         auth_url = f"{self.db_endpoint}/_open/auth"
         payload = {"username": self.db_user, "password": self.db_password}
 
         try:
-            response = requests.post(
-                auth_url, json=payload, timeout=self.timeout, verify=self.verify_ssl
+            # Don't send the previous (possibly rejected) JWT to the auth endpoint
+            response = self._session.post(
+                auth_url,
+                json=payload,
+                headers={"Authorization": None},
+                timeout=self._request_timeout(),
+                verify=self.verify_ssl,
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = _decode_json(response)
             token = data.get("jwt")
 
             if not token:
                 raise ValueError("No JWT token in response")
 
             self.jwt_token = token
-            print("JWT token obtained")
+            self._jwt_created_at = datetime.now()
+            self._jwt_expires_at = _jwt_expiry(token)
+            self._report("JWT token obtained")
             return token
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
-                print(f"Authentication failed (401 Unauthorized)")
-                print(f"   URL: {auth_url}")
-                print(f"   This usually means:")
-                print(f"   1. Wrong username or password")
-                print(f"   2. Endpoint URL is incorrect (missing port :8529?)")
-                print(f"   3. Network/VPN access issue")
-                print(f"   4. Password may have extra spaces (check .env file)")
+                lines = [
+                    "Authentication failed (401 Unauthorized)",
+                    f"   URL: {auth_url}",
+                    "   This usually means:",
+                    "   1. Wrong username or password",
+                    "   2. Endpoint URL is incorrect (missing port :8529?)",
+                    "   3. Network/VPN access issue",
+                    "   4. Password may have extra spaces (check .env file)",
+                ]
 
                 # Check for missing port
                 if ":8529" not in self.db_endpoint:
-                    print(
-                        f"\n   WARNING: Your endpoint '{self.db_endpoint}' is missing port :8529"
-                    )
-                    print(f"   It should be: {self.db_endpoint}:8529")
-                    print(f"   This is the #1 cause of 401 errors!")
+                    lines += [
+                        "",
+                        f"   WARNING: Your endpoint '{self.db_endpoint}' is missing port :8529",
+                        f"   It should be: {self.db_endpoint}:8529",
+                        "   This is the #1 cause of 401 errors!",
+                    ]
 
                 # Check for password formatting issues
-                if self.db_password:
-                    if self.db_password.startswith(" ") or self.db_password.endswith(
-                        " "
-                    ):
-                        print(
-                            f"\n   WARNING: Password appears to have leading/trailing spaces"
-                        )
-                        print(f"   Remove spaces from ARANGO_PASSWORD in .env file")
-
-                print(f"\n   Troubleshooting steps:")
-                print(f"   1. Verify endpoint includes :8529 port")
-                print(f"   2. Check credentials match exactly (no extra spaces)")
-                print(f"   3. Verify credentials work in ArangoDB web UI")
-                print(f"   4. Check network/VPN connectivity")
+                if self.db_password and self.db_password != self.db_password.strip(" "):
+                    lines += [
+                        "",
+                        "   WARNING: Password appears to have leading/trailing spaces",
+                        "   Remove spaces from ARANGO_PASSWORD in .env file",
+                    ]
+
+                lines += [
+                    "",
+                    "   Troubleshooting steps:",
+                    "   1. Verify endpoint includes :8529 port",
+                    "   2. Check credentials match exactly (no extra spaces)",
+                    "   3. Verify credentials work in ArangoDB web UI",
+                    "   4. Check network/VPN connectivity",
+                ]
+                logger.warning("\n".join(lines))
             raise
         except Exception as e:
-            print(f"Failed to get JWT token: {e}")
+            lines = [f"Failed to get JWT token: {e}"]
             # Check for missing port in any error
             if ":8529" not in self.db_endpoint:
-                print(f"\n   TIP: Check if your endpoint includes port :8529")
-                print(f"   Current: {self.db_endpoint}")
-                print(f"   Should be: {self.db_endpoint}:8529")
+                lines += [
+                    "",
+                    "   TIP: Check if your endpoint includes port :8529",
+                    f"   Current: {self.db_endpoint}",
+                    f"   Should be: {self.db_endpoint}:8529",
+                ]
+            logger.warning("\n".join(lines))
             raise
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get HTTP headers with JWT authentication."""
+    def _is_jwt_expired(self) -> bool:
+        """Check if the JWT is missing or old enough to refresh proactively."""
         if not self.jwt_token:
+            return True
+        if self._jwt_created_at is None:
+            # Token supplied externally; rely on 401 retries to refresh it
+            return False
+        now = datetime.now()
+        if self._jwt_expires_at is not None and now >= (
+            self._jwt_expires_at - timedelta(seconds=JWT_EXPIRY_MARGIN_SECONDS)
+        ):
+            return True
+        return now - self._jwt_created_at > timedelta(minutes=JWT_REFRESH_MINUTES)
+
+    def _get_headers(self) -> Dict[str, str]:
+        """
+        Get the session headers, refreshing a stale JWT first.
+
+        The Authorization header lives on the session, so it is only
+        rewritten when the JWT changes; requests don't pass headers.
+        """
+        if self._is_jwt_expired():
             self._get_jwt_token()
 
-        return {
-            "Authorization": f"bearer {self.jwt_token}",
-            "Content-Type": "application/json",
+        if self._headers_token != self.jwt_token:
+            self._session.headers["Authorization"] = (
+                f"{AUTHORIZATION_BEARER_PREFIX} {self.jwt_token}"
+            )
+            self._headers_token = self.jwt_token
+        return self._session.headers
+
+    def _genai_request_with_retry(
+        self,
+        method: str,
+        url: str,
+        json_data: Optional[Dict] = None,
+        max_retries: int = 1,
+    ) -> requests.Response:
+        """Make a GenAI API request, re-authenticating and retrying on 401 errors."""
+        if method not in _HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        # Built once per call; only POSTs carry a body
+        request_kwargs = {
+            "timeout": self._request_timeout(),
+            "verify": self.verify_ssl,
         }
+        if method == "POST" and json_data is not None:
+            # Content-Type: application/json is a session default
+            request_kwargs["data"] = _encode_json(json_data)
+
+        self._get_headers()
+        for attempt in range(max_retries + 1):
+            try:
+                response = self._session.request(method, url, **request_kwargs)
+                response.raise_for_status()
+                return response
+
+            except requests.HTTPError as e:
+                # JWT rejected (expired or revoked): re-authenticate and retry
+                if e.response.status_code == 401 and attempt < max_retries:
+                    self._report(
+                        "JWT rejected (401 error), re-authenticating and retrying..."
+                    )
+                    self.jwt_token = None
+                    self._get_headers()
+                    continue
+                raise
+
+        raise RuntimeError("Request failed after all retry attempts")
 
     def start_engine(self) -> str:
         """Start a new GAE service via GenAI platform."""
-        print("Starting GAE service...")
+        self._report("Starting GAE service...")
 
         url = f"{self.db_endpoint}/gen-ai/v1/graphanalytics"
-        headers = self._get_headers()
 
         try:
-            response = requests.post(
-                url,
-                json={},
-                headers=headers,
-                timeout=self.timeout,
-                verify=self.verify_ssl,
-            )
-            response.raise_for_status()
+            response = self._genai_request_with_retry("POST", url, json_data={})
 
-            data = response.json()
+            data = _decode_json(response)
             service_info = data.get("serviceInfo", {})
             service_id = service_info.get("serviceId")
 
@@ -787,13 +1388,13 @@ class GenAIGAEConnection(GAEConnectionBase):
                 raise RuntimeError("Failed to start engine")
 
             self.engine_id = service_id
-            print(f"Engine started successfully")
-            print(f"   Service ID: {service_id}")
+            self._invalidate_service_cache()
+            self._report("Engine started successfully (service ID: %s)", service_id)
 
             return service_id
 
         except Exception as e:
-            print(f"Failed to start engine: {e}")
+            logger.error("Failed to start engine: %s", e)
             raise
 
     def deploy_engine(
@@ -807,27 +1408,24 @@ class GenAIGAEConnection(GAEConnectionBase):
         """Stop a GAE service."""
         service_id = service_id or self.engine_id
         if not service_id:
-            print("No service ID provided")
+            logger.warning("No service ID provided")
             return False
 
-        print(f"Stopping GAE service {service_id}...")
+        self._report("Stopping GAE service %s...", service_id)
 
         url = f"{self.db_endpoint}/gen-ai/v1/service/{service_id}"
-        headers = self._get_headers()
 
         try:
-            response = requests.delete(
-                url, headers=headers, timeout=self.timeout, verify=self.verify_ssl
-            )
-            response.raise_for_status()
+            self._genai_request_with_retry("DELETE", url)
 
-            print(f"Engine stopped successfully")
+            self._report("Engine stopped successfully")
+            self._invalidate_service_cache()
             if service_id == self.engine_id:
                 self.engine_id = None
             return True
 
         except Exception as e:
-            print(f"Failed to stop engine: {e}")
+            logger.error("Failed to stop engine: %s", e)
             return False
 
     def ensure_service(
@@ -851,8 +1449,11 @@ class GenAIGAEConnection(GAEConnectionBase):
             size_id: Engine size (e.g., 'e8', 'e16') - used only if starting new service
             reuse_existing: If True, reuse existing DEPLOYED services (default: True)
             wait_for_ready: If True, wait for service API health check (default: True)
-            max_retries: Maximum health check attempts (default: 60 = 120 seconds)
-            retry_interval: Seconds between health checks (default: 2)
+            max_retries: Maximum health check attempts (default: 60); the
+                         wait is also capped at max_retries * retry_interval
+                         seconds (default: 120)
+            retry_interval: Base delay between health checks; later checks
+                            back off exponentially with jitter (default: 2)
 
         Returns:
             Service ID of the ready service
@@ -861,7 +1462,7 @@ class GenAIGAEConnection(GAEConnectionBase):
 
         # 1. Try to reuse existing service
         if reuse_existing:
-            print("Checking for existing GAE services...")
+            self._report("Checking for existing GAE services...")
             try:
                 services = self.list_services()
 
@@ -872,38 +1473,50 @@ class GenAIGAEConnection(GAEConnectionBase):
                         and service.get("type") == "gral"
                     ):
                         service_id = service.get("serviceId")
-                        print(f"Found existing DEPLOYED service: {service_id}")
+                        self._report("Found existing DEPLOYED service: %s", service_id)
                         self.engine_id = service_id
                         break
             except Exception as e:
-                print(f"Warning: Failed to list services: {e}")
+                logger.warning("Failed to list services: %s", e)
 
         # 2. Start new service if needed
         if not service_id:
-            print("No suitable existing service found. Starting new one...")
+            self._report("No suitable existing service found. Starting new one...")
             # Note: start_engine doesn't currently support size_id for GenAI
             # but we keep the parameter for future compatibility
             service_id = self.start_engine()
 
         # 3. Wait for service to be ready
         if wait_for_ready:
-            print(f"Waiting for service {service_id} to be ready...")
+            self._report("Waiting for service %s to be ready...", service_id)
 
-            for i in range(max_retries):
+            budget = max_retries * retry_interval
+            deadline = time.monotonic() + budget
+            delays = _full_jitter_delays(retry_interval)
+            attempt = 0
+            while attempt < max_retries:
                 try:
                     # Test connection by checking version
                     self._get_engine_url()  # Ensures URL is constructed correctly
                     self.get_engine_version()
-                    print(f"OK: Service {service_id} is ready")
+                    self._report("OK: Service %s is ready", service_id)
                     return service_id
                 except Exception:
-                    if i % 5 == 0:  # Log every 5th attempt to avoid spam
-                        print(f"  Waiting for API... ({i+1}/{max_retries})")
-                    time.sleep(retry_interval)
+                    if attempt % 5 == 0:  # Log every 5th attempt to avoid spam
+                        logger.debug(
+                            "Waiting for API... (%d/%d)", attempt + 1, max_retries
+                        )
+                    attempt += 1
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    time.sleep(min(remaining, next(delays)))
 
             # If we get here, we timed out
-            print(
-                f"Warning: Service {service_id} did not become ready after {max_retries*retry_interval}s"
+            logger.warning(
+                "Service %s did not become ready after %ss",
+                service_id,
+                max_retries * retry_interval,
             )
 
         return service_id
@@ -915,16 +1528,27 @@ class GenAIGAEConnection(GAEConnectionBase):
             return {"status": "deleted"}
         raise RuntimeError(f"Failed to delete engine {service_id}")
 
+    @property
+    def engine_id(self) -> Optional[str]:
+        """Service ID of the current engine, or None if none is running."""
+        return self._engine_id
+
+    @engine_id.setter
+    def engine_id(self, service_id: Optional[str]) -> None:
+        self._engine_id = service_id
+        if service_id:
+            # Extract short ID from full service ID (e.g., "arangodb-gral-hkhti" -> "hkhti")
+            short_id = service_id.split("-")[-1]
+            # GenAI Platform: /gral/<short_id> path
+            self._engine_url = f"{self.db_endpoint}/gral/{short_id}"
+        else:
+            self._engine_url = None
+
     def _get_engine_url(self) -> str:
         """Get the engine API base URL."""
-        if not self.engine_id:
+        if not self._engine_url:
             raise ValueError("No engine running. Call start_engine() first.")
-
-        # Extract short ID from full service ID (e.g., "arangodb-gral-hkhti" -> "hkhti")
-        short_id = self.engine_id.split("-")[-1]
-
-        # GenAI Platform: /gral/<short_id> path
-        return f"{self.db_endpoint}/gral/{short_id}"
+        return self._engine_url
 
     def _request(
         self,
@@ -933,63 +1557,70 @@ class GenAIGAEConnection(GAEConnectionBase):
         payload: Optional[Dict[str, Any]] = None,
         success_message: Optional[str] = None,
         error_message: Optional[str] = None,
+        _retried: bool = False,
     ) -> Dict[str, Any]:
-        """Make an HTTP request to the GAE engine API."""
+        """
+        Make an HTTP request to the GAE engine API.
+
+        If the engine answers 404/410 and the platform no longer lists it as
+        deployed, the service is re-resolved and the request retried once.
+        """
         if not self.engine_id:
             if self.auto_reuse_services:
                 self.ensure_service()
             else:
                 self.start_engine()
 
-        engine_url = self._get_engine_url()
-        url = f"{engine_url}/{endpoint.lstrip('/')}"
-        headers = self._get_headers()
+        url = self._get_engine_url() + "/" + endpoint
 
         try:
-            if method == "GET":
-                response = requests.get(
-                    url, headers=headers, timeout=self.timeout, verify=self.verify_ssl
-                )
-            elif method == "POST":
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=self.timeout,
-                    verify=self.verify_ssl,
-                )
-            elif method == "DELETE":
-                response = requests.delete(
-                    url, headers=headers, timeout=self.timeout, verify=self.verify_ssl
-                )
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            response.raise_for_status()
-
-            result = response.json() if response.text else {}
+            response = self._genai_request_with_retry(method, url, json_data=payload)
+            result = _decode_json(response)
 
             # Format success message with job_id if present
-            if success_message:
+            if success_message and self._reporting():
                 job_id = result.get("job_id", result.get("id", "N/A"))
                 formatted_msg = (
                     success_message.format(job_id=job_id)
                     if "{job_id}" in success_message
                     else success_message
                 )
-                print(f"{ICON_SUCCESS} {formatted_msg}")
+                self._report("%s %s", ICON_SUCCESS, formatted_msg)
 
             return result
 
         except requests.exceptions.HTTPError as e:
-            error_msg = error_message or f"Request failed"
-            print(f"{ICON_ERROR} {error_msg}: {e}")
+            if e.response is not None and e.response.status_code in (404, 410):
+                # The service may be gone; don't keep serving stale listings
+                self._invalidate_service_cache()
+                if not _retried and not self._engine_deployed():
+                    self._report(
+                        "Service %s is no longer deployed; re-resolving and retrying...",
+                        self.engine_id,
+                    )
+                    self.engine_id = None
+                    return self._request(
+                        method,
+                        endpoint,
+                        payload,
+                        success_message,
+                        error_message,
+                        _retried=True,
+                    )
+            error_msg = error_message or "Request failed"
             if e.response is not None and e.response.text:
-                print(f"   Response: {e.response.text[:200]}")
+                logger.error(
+                    "%s %s: %s\n   Response: %s",
+                    ICON_ERROR,
+                    error_msg,
+                    e,
+                    e.response.text[:200],
+                )
+            else:
+                logger.error("%s %s: %s", ICON_ERROR, error_msg, e)
             raise
         except Exception as e:
-            error_msg = error_message or f"Request failed"
-            print(f"{ICON_ERROR} {error_msg}: {e}")
+            logger.error("%s %s: %s", ICON_ERROR, error_message or "Request failed", e)
             raise
 
     def load_graph(
@@ -1035,36 +1666,62 @@ class GenAIGAEConnection(GAEConnectionBase):
         try:
             return self._request(
                 method="GET",
-                endpoint=f"{API_VERSION_PREFIX}jobs/{job_id}",
+                endpoint=_EP_JOBS + job_id,
                 error_message=f"Failed to get job {job_id} status",
             )
         except Exception:
             return {}
 
     def get_engine_version(self) -> Dict[str, Any]:
-        """Get the Engine API version."""
-        return self._request("GET", f"{API_VERSION_PREFIX}version")
+        """Get the Engine API version (cached briefly per service)."""
+        if not self.engine_id:
+            # _request starts or reuses a service first; nothing to key on yet
+            return self._request("GET", _EP_VERSION)
+        return self._cached(
+            "version:" + self.engine_id,
+            GENAI_SERVICE_CACHE_TTL,
+            lambda: self._request("GET", _EP_VERSION),
+        )
+
+    def _engine_deployed(self) -> bool:
+        """Check the platform's live service list for the current engine."""
+        return any(
+            service.get("serviceId") == self.engine_id
+            and service.get("status") == "DEPLOYED"
+            for service in self.list_services(force=True)
+        )
 
-    def list_services(self) -> List[Dict[str, Any]]:
+    def _invalidate_service_cache(self) -> None:
+        """Forget cached service listings and engine versions."""
+        self._response_cache.clear()
+
+    def list_services(self, force: bool = False) -> List[Dict[str, Any]]:
         """
         List all running GenAI services.
 
+        Results are cached for a few seconds, and dropped whenever a service
+        is started or stopped or an engine call returns 404/410.
+
+        Args:
+            force: Bypass the cache and query the platform (default: False)
+
         Returns:
             List of service information dictionaries
         """
         url = f"{self.db_endpoint}/gen-ai/v1/list_services"
-        headers = self._get_headers()
 
-        try:
-            response = requests.post(
-                url, headers=headers, timeout=self.timeout, verify=self.verify_ssl
-            )
-            response.raise_for_status()
-            data = response.json()
+        def load() -> List[Dict[str, Any]]:
+            response = self._genai_request_with_retry("POST", url)
+            data = _decode_json(response)
             # Response has structure: {"services": [...]}
             return data.get("services", [])
+
+        if force:
+            self._response_cache.pop("services", None)
+        try:
+            return self._cached("services", GENAI_SERVICE_CACHE_TTL, load)
         except Exception as e:
-            print(f"Error listing services: {e}")
+            logger.error("Error listing services: %s", e)
             return []
 
     def test_connection(self) -> bool:
@@ -1080,10 +1737,10 @@ class GenAIGAEConnection(GAEConnectionBase):
 
             # Try to list services (lightweight operation)
             services = self.list_services()
-            print("Connection test successful")
+            self._report("Connection test successful")
             return True
         except Exception as e:
-            print(f"Connection test failed: {e}")
+            logger.error("Connection test failed: %s", e)
             return False
 
     def list_graphs(self) -> List[Dict[str, Any]]:
@@ -1099,12 +1756,12 @@ class GenAIGAEConnection(GAEConnectionBase):
         try:
             graphs = self._request(
                 method="GET",
-                endpoint=f"{API_VERSION_PREFIX}graphs",
+                endpoint=_EP_GRAPHS_LIST,
                 error_message="Failed to list graphs",
             )
             return graphs if isinstance(graphs, list) else []
         except Exception as e:
-            print(f"Failed to list graphs: {e}")
+            logger.error("Failed to list graphs: %s", e)
             raise
 
     def delete_graph(self, graph_id: str) -> Dict[str, Any]:
@@ -1122,7 +1779,7 @@ class GenAIGAEConnection(GAEConnectionBase):
 
         result = self._request(
             method="DELETE",
-            endpoint=f"{API_VERSION_PREFIX}graphs/{graph_id}",
+            endpoint=_EP_GRAPHS + graph_id,
             success_message=f"Graph {graph_id} deleted successfully",
             error_message=f"Failed to delete graph {graph_id}",
         )
@@ -1141,7 +1798,10 @@ class GenAIGAEConnection(GAEConnectionBase):
 
         Args:
             job_id: Job ID to wait for
-            poll_interval: Seconds between status checks
+            poll_interval: Base delay between status checks; later checks
+                           back off exponentially (with jitter, up to
+                           POLL_BACKOFF_CAP seconds). Jobs reporting
+                           progress/total are polled relative to their ETA.
             max_wait: Maximum seconds to wait before timing out
 
         Returns:
@@ -1151,46 +1811,203 @@ class GenAIGAEConnection(GAEConnectionBase):
             TimeoutError: If job doesn't complete within max_wait seconds
             RuntimeError: If job fails
         """
-        print(f"Waiting for job {job_id}...")
-        start_time = time.time()
+        self._report("Waiting for job %s...", job_id)
+        start_time = time.monotonic()
+        delays = _full_jitter_delays(poll_interval)
+        next_report = 10
+        prev_progress = prev_time = None
+        stall_delay = poll_interval
 
         while True:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if elapsed > max_wait:
                 raise TimeoutError(f"Job {job_id} did not complete within {max_wait}s")
 
             job = self.get_job(job_id)
-            status = job.get("status", {})
-            state = status.get("state", job.get("state", "unknown"))
-
-            # Check for progress-based format (flat structure)
-            if "progress" in job and "total" in job:
-                progress = job.get("progress", 0)
-                total = job.get("total", 1)
-
-                # Check for explicit error field
-                if job.get("error", False):
-                    error_msg = job.get(
-                        "error_message", job.get("errorMessage", "Unknown error")
+            if self._job_finished(job_id, job):
+                self._report(
+                    "%s Job %s completed in %ds", ICON_SUCCESS, job_id, elapsed
+                )
+                return job
+
+            next_delay = None
+            progress, total = job.get("progress"), job.get("total")
+            if progress is not None and total is not None:
+
+                # Schedule the next poll from the observed progress rate:
+                # check back part of the way to the ETA while the job moves,
+                # and back off further each time it stalls
+                now = time.monotonic()
+                if prev_time is not None and now > prev_time:
+                    rate = (progress - prev_progress) / (now - prev_time)
+                    if rate > 0:
+                        eta = (total - progress) / rate
+                        next_delay = min(
+                            max(
+                                eta * PROGRESS_POLL_ETA_FRACTION,
+                                PROGRESS_POLL_MIN_DELAY,
+                            ),
+                            POLL_BACKOFF_CAP,
+                        )
+                        stall_delay = poll_interval
+                    else:
+                        stall_delay = min(stall_delay * 2, POLL_BACKOFF_CAP)
+                        next_delay = stall_delay
+                prev_progress, prev_time = progress, now
+
+            # Show progress for long-running jobs
+            if elapsed >= next_report:
+                if self._reporting():
+                    self._report("  Job still running... (%ds elapsed)", elapsed)
+                next_report = elapsed + 10
+
+            # Without progress data, back off; never sleep past the deadline
+            if next_delay is None:
+                next_delay = next(delays)
+            time.sleep(max(0.0, min(max_wait - elapsed, next_delay)))
+
+    def wait_for_jobs(
+        self,
+        job_ids: List[str],
+        poll_interval: int = DEFAULT_POLL_INTERVAL,
+        max_wait: int = DEFAULT_JOB_TIMEOUT,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for several jobs to complete, polling them together.
+
+        Each poll fetches every job's status with a single list_jobs()
+        call; jobs missing from the listing are fetched individually (and
+        concurrently), so one round costs about one request however many
+        jobs are tracked.
+
+        Args:
+            job_ids: Job IDs to wait for
+            poll_interval: Base delay between polls (backs off like
+                           wait_for_job)
+            max_wait: Maximum seconds to wait for all jobs
+
+        Returns:
+            Final job status dictionaries keyed by job ID, in input order
+
+        Raises:
+            TimeoutError: If any job doesn't complete within max_wait seconds
+            RuntimeError: If any job fails
+        """
+        pending = list(dict.fromkeys(job_ids))
+        self._report("Waiting for %d jobs...", len(pending))
+        start_time = time.monotonic()
+        delays = _full_jitter_delays(poll_interval)
+        next_report = 10
+        finished: Dict[str, Dict[str, Any]] = {}
+
+        while True:
+            elapsed = time.monotonic() - start_time
+            if elapsed > max_wait:
+                raise TimeoutError(
+                    f"Jobs {', '.join(pending)} did not complete within {max_wait}s"
+                )
+
+            for job_id, job in self._poll_jobs(pending).items():
+                if self._job_finished(job_id, job):
+                    self._report(
+                        "%s Job %s completed in %ds", ICON_SUCCESS, job_id, elapsed
+                    )
+                    finished[job_id] = job
+            pending = [job_id for job_id in pending if job_id not in finished]
+
+            if not pending:
+                return {job_id: finished[job_id] for job_id in job_ids}
+
+            if elapsed >= next_report:
+                if self._reporting():
+                    self._report(
+                        "  %d job(s) still running... (%ds elapsed)",
+                        len(pending),
+                        elapsed,
                     )
-                    raise RuntimeError(f"Job {job_id} failed: {error_msg}")
+                next_report = elapsed + 10
 
-                if progress >= total and total > 0:
-                    print(f"{ICON_SUCCESS} Job {job_id} completed in {int(elapsed)}s")
-                    return job
+            time.sleep(max(0.0, min(max_wait - elapsed, next(delays))))
 
-            if state in COMPLETED_STATES:
-                print(f"{ICON_SUCCESS} Job {job_id} completed in {int(elapsed)}s")
-                return job
-            elif state in FAILED_STATES:
-                error_msg = status.get("error", job.get("error", "Unknown error"))
+    def _poll_jobs(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch job statuses from one job listing, falling back per job."""
+        try:
+            listed = self.list_jobs()
+        except Exception as e:
+            logger.debug("Job listing failed, polling jobs individually: %s", e)
+            listed = []
+
+        by_id = {}
+        for job in listed:
+            job_id = job.get("job_id", job.get("id"))
+            if job_id is not None:
+                by_id[str(job_id)] = job
+
+        missing = [job_id for job_id in job_ids if str(job_id) not in by_id]
+        fetched = self.get_jobs_by_id(missing) if missing else {}
+        return {
+            job_id: fetched[job_id] if job_id in fetched else by_id[str(job_id)]
+            for job_id in job_ids
+        }
+
+    @staticmethod
+    def _job_finished(job_id: str, job: Dict[str, Any]) -> bool:
+        """
+        Check whether a job status reports completion.
+
+        Raises:
+            RuntimeError: If the job reports a failure
+        """
+        status = job.get("status") or {}
+        state = status.get("state") or job.get("state", "unknown")
+        progress, total = job.get("progress"), job.get("total")
+
+        # Check for progress-based format (flat structure)
+        if progress is not None and total is not None:
+            # Check for explicit error field
+            if job.get("error", False):
+                error_msg = job.get(
+                    "error_message", job.get("errorMessage", "Unknown error")
+                )
                 raise RuntimeError(f"Job {job_id} failed: {error_msg}")
 
-            # Show progress for long-running jobs
-            if int(elapsed) % 10 == 0 and int(elapsed) > 0:
-                print(f"  Job still running... ({int(elapsed)}s elapsed)")
+            if progress >= total and total > 0:
+                return True
+
+        if state in COMPLETED_STATES:
+            return True
+        if state in FAILED_STATES:
+            error_msg = status.get("error", job.get("error", "Unknown error"))
+            raise RuntimeError(f"Job {job_id} failed: {error_msg}")
+        return False
 
-            time.sleep(poll_interval)
+    async def await_job(self, job_id: str, **kwargs) -> Dict[str, Any]:
+        """Async variant of wait_for_job()."""
+        return await self._run_async(self.wait_for_job, job_id, **kwargs)
+
+    async def await_jobs(self, job_ids: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """
+        Wait for several jobs concurrently.
+
+        Each job is polled on its own worker thread over the shared
+        keep-alive session, so one slow job doesn't delay checks on the
+        others.
+
+        Args:
+            job_ids: Job IDs to wait for
+            **kwargs: Passed to wait_for_job() (poll_interval, max_wait)
+
+        Returns:
+            Final job status dictionaries, in the order of job_ids
+
+        Example:
+            results = asyncio.run(gae.await_jobs([pr_job["id"], wcc_job["id"]]))
+        """
+        return list(
+            await asyncio.gather(
+                *(self.await_job(job_id, **kwargs) for job_id in job_ids)
+            )
+        )
 
     def list_jobs(self) -> List[Dict[str, Any]]:
         """
@@ -1204,7 +2021,7 @@ class GenAIGAEConnection(GAEConnectionBase):
 
         jobs = self._request(
             method="GET",
-            endpoint=f"{API_VERSION_PREFIX}jobs",
+            endpoint=_EP_JOBS_LIST,
             error_message="Failed to list jobs",
         )
 
@@ -1215,7 +2032,7 @@ class GenAIGAEConnection(GAEConnectionBase):
         try:
             graph = self._request(
                 method="GET",
-                endpoint=f"{API_VERSION_PREFIX}graphs/{graph_id}",
+                endpoint=_EP_GRAPHS + graph_id,
                 error_message=f"Failed to get graph {graph_id}",
             )
             return graph
@@ -1227,12 +2044,15 @@ class GenAIGAEConnection(GAEConnectionBase):
         """
         Get ArangoDB database connection object.
 
+        The connection is opened on first use and reused by every result,
+        query and export helper on this instance.
+
         Returns:
             StandardDatabase: ArangoDB database connection
         """
-        from .db_connection import get_db_connection
-
-        return get_db_connection()
+        if self._db is None:
+            self._db = get_db_connection()
+        return self._db
 
     # ====================================================================
     # RESULT COLLECTION MANAGEMENT (delegates to results module)
@@ -1242,8 +2062,6 @@ class GenAIGAEConnection(GAEConnectionBase):
         self, collection_names: Optional[List[str]] = None, verbose: bool = False
     ) -> Dict[str, int]:
         """Ensure indexes exist on 'id' field for result collections."""
-        from .results import ensure_result_collection_indexes
-
         return ensure_result_collection_indexes(
             self.get_db(), collection_names, verbose
         )
@@ -1255,8 +2073,6 @@ class GenAIGAEConnection(GAEConnectionBase):
         check_index: bool = True,
     ) -> Dict[str, Any]:
         """Verify that a result collection has the expected structure."""
-        from .results import verify_result_collection
-
         return verify_result_collection(
             self.get_db(), collection_name, check_id_field, check_index
         )
@@ -1269,8 +2085,6 @@ class GenAIGAEConnection(GAEConnectionBase):
         sample_size: int = 100,
     ) -> Dict[str, Any]:
         """Validate that result collection matches expected schema."""
-        from .results import validate_result_schema
-
         return validate_result_schema(
             self.get_db(),
             result_collection,
@@ -1286,8 +2100,6 @@ class GenAIGAEConnection(GAEConnectionBase):
         compare_fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Compare two result collections."""
-        from .results import compare_result_collections
-
         return compare_result_collections(
             self.get_db(), collection1, collection2, compare_fields
         )
@@ -1304,10 +2116,9 @@ class GenAIGAEConnection(GAEConnectionBase):
         filter2: Optional[str] = None,
         join_fields: Optional[Dict[str, str]] = None,
         limit: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+        stream: bool = False,
+    ) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
         """Cross-reference two result collections by 'id' field."""
-        from .queries import cross_reference_results
-
         return cross_reference_results(
             self.get_db(),
             collection1,
@@ -1316,6 +2127,7 @@ class GenAIGAEConnection(GAEConnectionBase):
             filter2,
             join_fields,
             limit,
+            stream,
         )
 
     def get_top_influential_connected(
@@ -1326,12 +2138,10 @@ class GenAIGAEConnection(GAEConnectionBase):
         min_influence: Optional[float] = None,
         limit: int = 100,
         include_vertex_details: bool = False,
-        vertex_collection: str = "nodes",
+        vertex_collection: Optional[str] = "nodes",
         vertex_fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Get top influential vertices who are in the connected component."""
-        from .queries import get_top_influential_connected
-
         return get_top_influential_connected(
             self.get_db(),
             pagerank_collection,
@@ -1347,14 +2157,14 @@ class GenAIGAEConnection(GAEConnectionBase):
     def get_results_with_details(
         self,
         result_collection: str,
-        vertex_collection: str = "nodes",
+        vertex_collection: Optional[str] = "nodes",
         result_filter: Optional[str] = None,
         fields: Optional[List[str]] = None,
         limit: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+        stream: bool = False,
+        return_format: str = "list",
+    ) -> Any:
         """Get result collection data joined with vertex details."""
-        from .queries import get_results_with_details
-
         return get_results_with_details(
             self.get_db(),
             result_collection,
@@ -1362,6 +2172,8 @@ class GenAIGAEConnection(GAEConnectionBase):
             result_filter,
             fields,
             limit,
+            stream,
+            return_format,
         )
 
     # ====================================================================
@@ -1380,8 +2192,6 @@ class GenAIGAEConnection(GAEConnectionBase):
         vertex_fields: Optional[List[str]] = None,
     ) -> int:
         """Export result collection to CSV file."""
-        from .export import export_results_to_csv
-
         return export_results_to_csv(
             self.get_db(),
             result_collection,
@@ -1403,10 +2213,10 @@ class GenAIGAEConnection(GAEConnectionBase):
         join_vertex: bool = False,
         vertex_collection: str = "nodes",
         vertex_fields: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        format: str = "json",
     ) -> int:
         """Export result collection to JSON file."""
-        from .export import export_results_to_json
-
         return export_results_to_json(
             self.get_db(),
             result_collection,
@@ -1416,6 +2226,8 @@ class GenAIGAEConnection(GAEConnectionBase):
             join_vertex,
             vertex_collection,
             vertex_fields,
+            fields,
+            format,
         )
 
     # ====================================================================
@@ -1430,8 +2242,6 @@ class GenAIGAEConnection(GAEConnectionBase):
         batch_size: int = 1000,
     ) -> int:
         """Add metadata fields to all results in a collection."""
-        from .results import bulk_update_result_metadata
-
         return bulk_update_result_metadata(
             self.get_db(), result_collection, metadata, filter_query, batch_size
         )
@@ -1445,8 +2255,6 @@ class GenAIGAEConnection(GAEConnectionBase):
         batch_size: int = 1000,
     ) -> int:
         """Copy results from one collection to another."""
-        from .results import copy_results
-
         return copy_results(
             self.get_db(),
             source_collection,
@@ -1460,8 +2268,6 @@ class GenAIGAEConnection(GAEConnectionBase):
         self, result_collection: str, filter_query: str, batch_size: int = 1000
     ) -> int:
         """Delete results matching a filter query."""
-        from .results import delete_results_by_filter
-
         return delete_results_by_filter(
             self.get_db(), result_collection, filter_query, batch_size
         )
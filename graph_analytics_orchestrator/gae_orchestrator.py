@@ -14,16 +14,95 @@ Works with both Arango Managed Platform (AMP) and self-managed deployments.
 
 import time
 import json
+import logging
+import random
+import re
+import sys
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, List, Any
+from dataclasses import dataclass, field, fields
+from typing import IO, Optional, Dict, List, Any, Tuple, Callable
 from datetime import datetime
 from enum import Enum
 
-from .gae_connection import get_gae_connection, GAEConnectionBase
+from .gae_connection import get_gae_connection, GAEConnectionBase, _backoff_delays
 from .db_connection import get_db_connection
-from .config import get_arango_config
-from .constants import DEFAULT_JOB_TIMEOUT, DEFAULT_POLL_INTERVAL
+from .config import get_default_database
+from .constants import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_JOB_TIMEOUT,
+    DEFAULT_POLL_INTERVAL,
+    JOB_POLL_INITIAL_DELAY,
+)
+
+# orjson is optional: a much faster C serializer, with stdlib json as fallback
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# (job, description, last_status) -> (done, last_status)
+_JobHandler = Callable[[Dict[str, Any], str, Optional[str]], Tuple[bool, Optional[str]]]
+
+# Default algorithm parameters, copied into each AnalysisConfig that has none
+_ALGO_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "pagerank": {"damping_factor": 0.85, "maximum_supersteps": 100},
+    "label_propagation": {
+        "start_label_attribute": "_key",
+        "maximum_supersteps": 100,
+    },
+    "scc": {},
+    "wcc": {},
+    "betweenness": {"maximum_supersteps": 100},
+}
+
+
+def _console_logger() -> logging.Logger:
+    """
+    Logger that shows orchestrator progress on stdout.
+
+    Used by verbose orchestrators when logging isn't configured. It is a
+    separate, non-propagating child logger, so the library logger's level
+    and handlers stay untouched and quiet orchestrators stay quiet.
+    """
+    console = logging.getLogger(f"{__name__}.console")
+    if not console.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(
+            logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s", "%H:%M:%S")
+        )
+        console.addHandler(handler)
+        console.setLevel(logging.INFO)
+        console.propagate = False
+    return console
+
+
+class _Thousands:
+    """Integer shown with thousands separators when a log message is formatted."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def __str__(self) -> str:
+        return f"{self.value:,}"
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-JSON values found in analysis results."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class AnalysisStatus(Enum):
@@ -39,7 +118,7 @@ class AnalysisStatus(Enum):
     CLEANING_UP = "cleaning_up"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AnalysisConfig:
     """Configuration for a GAE analysis."""
 
@@ -66,12 +145,16 @@ class AnalysisConfig:
 
     # Storage configuration
     target_collection: str = "graph_analysis_results"  # Where to store results
+    count_stored_documents: bool = False  # Count target docs after storing
 
     # Workflow options
     auto_cleanup: bool = True  # Automatically delete engine after completion
     retry_on_failure: bool = True
     max_retries: int = 3
+    retry_base_seconds: float = 1.0  # First retry waits ~2x this, doubling after
+    retry_cap_seconds: float = 30.0  # Longest wait between retries
     timeout_seconds: int = DEFAULT_JOB_TIMEOUT  # 1 hour max
+    request_timeout_seconds: int = 60  # Per GAE HTTP request
 
     # Cost tracking
     estimated_cost_usd: Optional[float] = None
@@ -79,8 +162,7 @@ class AnalysisConfig:
     def __post_init__(self):
         """Validate and set defaults."""
         if not self.database:
-            config = get_arango_config()
-            self.database = config["database"]
+            self.database = get_default_database()
 
         if not self.result_field:
             self.result_field = f"{self.algorithm}_{self.name}"
@@ -91,20 +173,11 @@ class AnalysisConfig:
 
     def _get_default_params(self) -> Dict[str, Any]:
         """Get default parameters for the algorithm."""
-        defaults = {
-            "pagerank": {"damping_factor": 0.85, "maximum_supersteps": 100},
-            "label_propagation": {
-                "start_label_attribute": "_key",
-                "maximum_supersteps": 100,
-            },
-            "scc": {},
-            "wcc": {},
-            "betweenness": {"maximum_supersteps": 100},
-        }
-        return defaults.get(self.algorithm, {})
+        # Copy so configs never share (or mutate) the module-level defaults
+        return dict(_ALGO_DEFAULTS.get(self.algorithm, {}))
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AnalysisResult:
     """Results from a completed analysis."""
 
@@ -142,18 +215,63 @@ class AnalysisResult:
     error_message: Optional[str] = None
     retry_count: int = 0
 
+    # Engine cost per second of runtime, set when the engine is deployed
+    _per_second_cost: float = field(default=0.0, init=False, repr=False)
+    # Monotonic clock reading at creation, for durations immune to clock jumps
+    _start_monotonic: float = field(
+        default_factory=time.monotonic, init=False, repr=False
+    )
+    # Config as a dict, built by the first to_dict() call and reused after
+    _config_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AnalysisResult":
+        """Rebuild a result from the output of to_dict()."""
+        values = dict(data)
+        values["config"] = AnalysisConfig(**values["config"])
+        values["status"] = AnalysisStatus(values["status"])
+        values["start_time"] = datetime.fromisoformat(values["start_time"])
+        if values.get("end_time"):
+            values["end_time"] = datetime.fromisoformat(values["end_time"])
+        return cls(**values)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for logging."""
-        result = asdict(self)
+        """
+        Convert to dictionary for logging.
+
+        The dictionary is shallow: lists and dicts (e.g. the config's
+        collections and algorithm_params) are shared, not copied. The config
+        part is built once per result, so saving a growing history after
+        every analysis doesn't convert every config again.
+        """
+        result = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if not f.name.startswith("_")
+        }
         result["status"] = self.status.value
         result["start_time"] = self.start_time.isoformat()
         if self.end_time:
             result["end_time"] = self.end_time.isoformat()
         # Convert config to dict
-        result["config"] = asdict(self.config)
+        if self._config_dict is None:
+            self._config_dict = {
+                f.name: getattr(self.config, f.name) for f in fields(self.config)
+            }
+        result["config"] = self._config_dict
         return result
 
 
+def _encode_history_record(result: AnalysisResult) -> bytes:
+    """Encode one analysis as a newline-terminated JSON line."""
+    record = result.to_dict()
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
 class GAEOrchestrator:
     """
     Orchestrates complete GAE analysis workflows.
@@ -174,6 +292,14 @@ class GAEOrchestrator:
         "e128": 3.20,
     }
 
+    # GAE connection method that submits each supported algorithm
+    _ALGO_DISPATCH = {
+        "pagerank": "run_pagerank",
+        "label_propagation": "run_label_propagation",
+        "scc": "run_scc",
+        "wcc": "run_wcc",
+    }
+
     # Non-retryable error patterns (configuration/setup issues)
     NON_RETRYABLE_ERRORS = [
         "ARANGO_GRAPH_TOKEN not set",
@@ -184,6 +310,10 @@ class GAEOrchestrator:
         "Invalid configuration",
         "maximum recursion depth",
     ]
+    _NON_RETRYABLE_RE = re.compile(
+        "|".join(re.escape(pattern) for pattern in NON_RETRYABLE_ERRORS),
+        re.IGNORECASE,
+    )
 
     def __init__(
         self, verbose: bool = True, gae_connection: Optional[GAEConnectionBase] = None
@@ -192,22 +322,56 @@ class GAEOrchestrator:
         Initialize orchestrator.
 
         Args:
-            verbose: Print progress messages
+            verbose: Print progress messages (to stdout, or to the module
+                     logger when logging is already configured)
             gae_connection: Optional GAE connection (will be created if not provided)
         """
         self.verbose = verbose
-        self.gae: Optional[GAEConnectionBase] = gae_connection
+        # An application that has set up its own handlers keeps full control
+        self._logger = (
+            _console_logger() if verbose and not logger.hasHandlers() else logger
+        )
+        self._gae: Optional[GAEConnectionBase] = gae_connection
+        self._gae_injected = gae_connection is not None
         self.db = None
+        self._existing_engines_checked = False
+
+        # Per-thread state: the analysis a thread is running and, inside a
+        # parallel batch, the GAE connection that drives its engine
+        self._local = threading.local()
 
         # Analysis tracking
-        self.current_analysis: Optional[AnalysisResult] = None
         self.analysis_history: List[AnalysisResult] = []
+        self._history_lock = threading.Lock()
+        self._history_file: Optional[IO[bytes]] = None
+
+    @property
+    def gae(self) -> Optional[GAEConnectionBase]:
+        """GAE connection for the calling thread."""
+        return getattr(self._local, "gae", None) or self._gae
 
-    def _log(self, message: str, level: str = "INFO"):
-        """Log message if verbose."""
-        if self.verbose:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            print(f"[{timestamp}] {level}: {message}")
+    @gae.setter
+    def gae(self, connection: Optional[GAEConnectionBase]) -> None:
+        self._gae = connection
+
+    @property
+    def current_analysis(self) -> Optional[AnalysisResult]:
+        """Analysis currently running on the calling thread."""
+        return getattr(self._local, "current_analysis", None)
+
+    @current_analysis.setter
+    def current_analysis(self, result: Optional[AnalysisResult]) -> None:
+        self._local.current_analysis = result
+
+    def _log(self, message: str, *args: Any, level: str = "INFO"):
+        """
+        Log a progress message at the given level name if verbose.
+
+        The message is %-formatted with args only when it is emitted.
+        """
+        if not self.verbose:
+            return
+        self._logger.log(getattr(logging, level, logging.INFO), message, *args)
 
     def _initialize_connections(self):
         """Initialize GAE and database connections."""
@@ -226,18 +390,19 @@ class GAEOrchestrator:
         Configuration errors, missing tokens, and recursion errors
         should NOT be retried.
         """
-        error_lower = error_message.lower()
-        for pattern in self.NON_RETRYABLE_ERRORS:
-            if pattern.lower() in error_lower:
-                return False
-        return True
+        return self._NON_RETRYABLE_RE.search(error_message) is None
 
     def _check_existing_engines(self):
         """
         Check for existing running engines and warn/fail.
 
-        Only works for AMP deployments.
+        Only works for AMP deployments. Once the check has passed it is
+        skipped for the rest of this orchestrator's life, since the only
+        engines left would be its own; see force_recheck_engines().
         """
+        if self._existing_engines_checked:
+            return
+
         try:
             # Only GAEManager has list_engines method
             if hasattr(self.gae, "list_engines"):
@@ -250,14 +415,21 @@ class GAEOrchestrator:
                         f"Engines already running: {', '.join(engine_info)}. "
                         f"Delete them first or risk multiple billing charges."
                     )
+            self._existing_engines_checked = True
         except AttributeError:
             # Self-managed doesn't have list_engines, skip check
-            pass
+            self._existing_engines_checked = True
         except Exception as e:
             if "already running" in str(e):
                 raise
             # If we can't check, log warning but continue
-            self._log(f"Warning: Could not check for existing engines: {e}", "WARN")
+            self._log(
+                "Warning: Could not check for existing engines: %s", e, level="WARN"
+            )
+
+    def force_recheck_engines(self):
+        """Make the next analysis check for existing engines again."""
+        self._existing_engines_checked = False
 
     def run_analysis(self, config: AnalysisConfig) -> AnalysisResult:
         """
@@ -277,22 +449,29 @@ class GAEOrchestrator:
         Returns:
             AnalysisResult with complete information
         """
-        self._log(f"=== Starting Analysis: {config.name} ===")
-
-        # Create result tracker
-        result = AnalysisResult(
-            config=config,
-            status=AnalysisStatus.PENDING,
-            start_time=datetime.now(),
-            engine_size=config.engine_size,
-            algorithm=config.algorithm,
-        )
-        self.current_analysis = result
-
         # Initialize connections and do safety checks ONCE (before retry loop)
         self._initialize_connections()
         self._check_existing_engines()
 
+        return self._execute_analysis(config)
+
+    def _execute_analysis(self, config: AnalysisConfig) -> AnalysisResult:
+        """
+        Run the deploy/load/run/store/cleanup workflow for one analysis.
+
+        Connections must already be initialized and the existing-engine
+        check done; run_analysis() and run_batch() take care of that.
+        """
+        self._log("=== Starting Analysis: %s ===", config.name)
+        with self._request_timeout(config):
+            return self._run_with_retries(config)
+
+    def _run_with_retries(self, config: AnalysisConfig) -> AnalysisResult:
+        """Run one analysis' workflow, retrying it as the config allows."""
+        # Create result tracker
+        result = self._new_result(config)
+        self.current_analysis = result
+
         # Retry loop (not recursion!)
         attempt = 0
         max_attempts = config.max_retries + 1 if config.retry_on_failure else 1
@@ -300,7 +479,7 @@ class GAEOrchestrator:
         while attempt < max_attempts:
             if attempt > 0:
                 result.retry_count = attempt
-                self._log(f"Retry attempt {attempt}/{config.max_retries}")
+                self._log("Retry attempt %s/%s", attempt, config.max_retries)
 
             try:
 
@@ -313,24 +492,23 @@ class GAEOrchestrator:
                 # Mark as completed
                 result.status = AnalysisStatus.COMPLETED
                 result.end_time = datetime.now()
-                result.duration_seconds = (
-                    result.end_time - result.start_time
-                ).total_seconds()
+                result.duration_seconds = time.monotonic() - result._start_monotonic
 
                 # Calculate costs (AMP only)
                 result.engine_runtime_minutes = result.duration_seconds / 60
-                hourly_cost = self.ENGINE_COSTS.get(config.engine_size, 0)
-                if hourly_cost > 0:  # Only calculate if we have cost data
+                if result._per_second_cost:  # Only calculate if we have cost data
                     result.estimated_cost_usd = (
-                        result.engine_runtime_minutes / 60
-                    ) * hourly_cost
+                        result.duration_seconds * result._per_second_cost
+                    )
 
-                self._log(f"OK: Analysis completed successfully!")
+                self._log("OK: Analysis completed successfully!")
                 self._log(
-                    f"  Duration: {result.duration_seconds:.1f}s ({result.engine_runtime_minutes:.1f} min)"
+                    "  Duration: %.1fs (%.1f min)",
+                    result.duration_seconds,
+                    result.engine_runtime_minutes,
                 )
                 if result.estimated_cost_usd:
-                    self._log(f"  Estimated cost: ${result.estimated_cost_usd:.4f}")
+                    self._log("  Estimated cost: $%.4f", result.estimated_cost_usd)
 
                 # Success - break out of retry loop
                 break
@@ -339,26 +517,25 @@ class GAEOrchestrator:
                 result.status = AnalysisStatus.FAILED
                 result.error_message = str(e)
                 result.end_time = datetime.now()
-                result.duration_seconds = (
-                    result.end_time - result.start_time
-                ).total_seconds()
+                result.duration_seconds = time.monotonic() - result._start_monotonic
 
-                self._log(f"ERROR: Analysis failed: {e}", "ERROR")
+                self._log("ERROR: Analysis failed: %s", e, level="ERROR")
 
                 # Check if error is retryable
                 is_retryable = self._is_retryable_error(str(e))
 
                 if not is_retryable:
                     self._log(
-                        f"Error is not retryable (configuration/setup issue)", "ERROR"
+                        "Error is not retryable (configuration/setup issue)",
+                        level="ERROR",
                     )
-                    self._log(f"Fix the issue and try again", "ERROR")
+                    self._log("Fix the issue and try again", level="ERROR")
                     break  # Don't retry configuration errors
 
                 # Check if we should retry
                 if config.retry_on_failure and attempt < config.max_retries:
                     attempt += 1
-                    self._log(f"Error appears transient, will retry...")
+                    self._log("Error appears transient, will retry...")
                     # Clean up failed engine before retry
                     if result.engine_id:
                         try:
@@ -366,8 +543,17 @@ class GAEOrchestrator:
                             result.engine_id = None  # Reset for retry
                         except Exception as cleanup_err:
                             self._log(
-                                f"Cleanup before retry failed: {cleanup_err}", "WARN"
+                                "Cleanup before retry failed: %s",
+                                cleanup_err,
+                                level="WARN",
                             )
+                    # Back off so retries don't pile onto a struggling server
+                    delay = min(
+                        config.retry_base_seconds * 2**attempt,
+                        config.retry_cap_seconds,
+                    ) + random.uniform(0, config.retry_base_seconds)
+                    self._log("Waiting %.1fs before retrying...", delay)
+                    time.sleep(delay)
                     continue  # Retry
                 else:
                     break  # No more retries
@@ -380,17 +566,20 @@ class GAEOrchestrator:
                     self._cleanup_engine(result)
                 else:
                     self._log(
-                        f"Engine {result.engine_id} left running (auto_cleanup=False)",
-                        "WARN",
+                        "Engine %s left running (auto_cleanup=False)",
+                        result.engine_id,
+                        level="WARN",
                     )
             except Exception as e:
-                self._log(f"CRITICAL: Engine cleanup failed: {e}", "ERROR")
+                self._log("CRITICAL: Engine cleanup failed: %s", e, level="ERROR")
                 self._log(
-                    f"You MUST manually delete engine: {result.engine_id}", "ERROR"
+                    "You MUST manually delete engine: %s",
+                    result.engine_id,
+                    level="ERROR",
                 )
 
         # Add to history
-        self.analysis_history.append(result)
+        self._record_history([result])
         self.current_analysis = None
 
         return result
@@ -398,7 +587,11 @@ class GAEOrchestrator:
     def _deploy_engine(self, result: AnalysisResult):
         """Deploy GAE engine."""
         result.status = AnalysisStatus.ENGINE_DEPLOYING
-        self._log(f"Deploying {result.config.engine_size} engine...")
+        self._log("Deploying %s engine...", result.config.engine_size)
+        # Billing starts with the deployment, even if it later fails
+        result._per_second_cost = (
+            self.ENGINE_COSTS.get(result.config.engine_size, 0.0) / 3600.0
+        )
 
         try:
             engine_info = self.gae.deploy_engine(
@@ -406,7 +599,7 @@ class GAEOrchestrator:
             )
 
             result.engine_id = engine_info["id"]
-            self._log(f"OK: Engine deployed: {result.engine_id}")
+            self._log("OK: Engine deployed: %s", result.engine_id)
         except Exception as e:
             # If deployment fails, try to capture engine_id for cleanup
             if (
@@ -416,18 +609,18 @@ class GAEOrchestrator:
             ):
                 result.engine_id = self.gae.current_engine_id
                 self._log(
-                    f"Deployment failed but captured engine_id: {result.engine_id}"
+                    "Deployment failed but captured engine_id: %s", result.engine_id
                 )
             raise
 
     def _load_graph(self, result: AnalysisResult):
         """Load graph data into engine."""
         result.status = AnalysisStatus.GRAPH_LOADING
-        self._log(f"Loading graph from {result.config.database}...")
-        self._log(f"  Vertices: {result.config.vertex_collections}")
-        self._log(f"  Edges: {result.config.edge_collections}")
+        self._log("Loading graph from %s...", result.config.database)
+        self._log("  Vertices: %s", result.config.vertex_collections)
+        self._log("  Edges: %s", result.config.edge_collections)
         if result.config.vertex_attributes:
-            self._log(f"  Attributes: {result.config.vertex_attributes}")
+            self._log("  Attributes: %s", result.config.vertex_attributes)
 
         graph_info = self.gae.load_graph(
             database=result.config.database,
@@ -452,34 +645,29 @@ class GAEOrchestrator:
             # Graph details may not be available immediately
             pass
 
-        self._log(f"OK: Graph loaded: {result.graph_id}")
+        self._log("OK: Graph loaded: %s", result.graph_id)
         if result.vertex_count:
-            self._log(f"  Vertices: {result.vertex_count:,}")
+            self._log("  Vertices: %s", _Thousands(result.vertex_count))
         if result.edge_count:
-            self._log(f"  Edges: {result.edge_count:,}")
+            self._log("  Edges: %s", _Thousands(result.edge_count))
 
     def _run_algorithm(self, result: AnalysisResult):
         """Run the configured algorithm."""
         result.status = AnalysisStatus.ALGORITHM_RUNNING
-        self._log(f"Running {result.config.algorithm}...")
+        self._log("Running %s...", result.config.algorithm)
 
-        # Build algorithm parameters (graph_id + any custom params)
-        params = {"graph_id": result.graph_id, **result.config.algorithm_params}
+        # Build algorithm parameters; graph_id last so custom params can't
+        # point the job at a different graph
+        params = {**result.config.algorithm_params, "graph_id": result.graph_id}
 
         # Call the appropriate algorithm
-        if result.config.algorithm == "pagerank":
-            job_info = self.gae.run_pagerank(**params)
-        elif result.config.algorithm == "label_propagation":
-            job_info = self.gae.run_label_propagation(**params)
-        elif result.config.algorithm == "scc":
-            job_info = self.gae.run_scc(**params)
-        elif result.config.algorithm == "wcc":
-            job_info = self.gae.run_wcc(**params)
-        elif result.config.algorithm == "betweenness":
-            # Betweenness not yet implemented in base class, skip for now
-            raise ValueError("Betweenness centrality not yet supported")
-        else:
+        method_name = self._ALGO_DISPATCH.get(result.config.algorithm)
+        if method_name is None:
+            if result.config.algorithm == "betweenness":
+                # Betweenness not yet implemented in base class, skip for now
+                raise ValueError("Betweenness centrality not yet supported")
             raise ValueError(f"Unsupported algorithm: {result.config.algorithm}")
+        job_info = getattr(self.gae, method_name)(**params)
 
         result.job_id = job_info.get("job_id") or job_info.get("id")
 
@@ -492,17 +680,30 @@ class GAEOrchestrator:
             job_result.get("statistics", {}).get("execution_time_ms", 0) / 1000
         )
         if execution_time > 0:
-            self._log(f"OK: Algorithm completed in {execution_time:.3f}s")
+            self._log("OK: Algorithm completed in %.3fs", execution_time)
+
+    def _store_results(
+        self, result: AnalysisResult, jobs: Optional[List[Tuple[str, str]]] = None
+    ):
+        """
+        Store algorithm results back to database.
+
+        Args:
+            result: Analysis whose target collection and database receive
+                    the results
+            jobs: (job_id, result_field) pairs to store in one request
+                  (default: the analysis' own job)
+        """
+        if jobs is None:
+            jobs = [(result.job_id, result.config.result_field)]
 
-    def _store_results(self, result: AnalysisResult):
-        """Store algorithm results back to database."""
         result.status = AnalysisStatus.STORING_RESULTS
-        self._log(f"Storing results to {result.config.target_collection}...")
+        self._log("Storing results to %s...", result.config.target_collection)
 
         store_info = self.gae.store_results(
             target_collection=result.config.target_collection,
-            job_ids=[result.job_id],
-            attribute_names=[result.config.result_field],
+            job_ids=[job_id for job_id, _ in jobs],
+            attribute_names=[result_field for _, result_field in jobs],
             database=result.config.database,
         )
 
@@ -513,24 +714,30 @@ class GAEOrchestrator:
 
         result.results_stored = True
 
+        if not result.config.count_stored_documents:
+            self._log("OK: Results stored")
+            return
+
         # Get count of stored documents
         try:
             collection = self.db.collection(result.config.target_collection)
             result.documents_updated = collection.count()
-            self._log(f"OK: Results stored: {result.documents_updated:,} documents")
+            self._log(
+                "OK: Results stored: %s documents", _Thousands(result.documents_updated)
+            )
         except Exception as e:
-            self._log(f"Warning: Could not count stored documents: {e}", "WARN")
+            self._log("Warning: Could not count stored documents: %s", e, level="WARN")
 
     def _cleanup_engine(self, result: AnalysisResult):
         """Delete the engine to stop billing."""
         # Preserve original status if it's already terminal
         original_status = result.status
         result.status = AnalysisStatus.CLEANING_UP
-        self._log(f"Cleaning up engine {result.engine_id}...")
+        self._log("Cleaning up engine %s...", result.engine_id)
 
         try:
             self.gae.delete_engine(result.engine_id)
-            self._log(f"OK: Engine deleted (billing stopped)")
+            self._log("OK: Engine deleted (billing stopped)")
         finally:
             # Restore terminal status
             if original_status in [AnalysisStatus.COMPLETED, AnalysisStatus.FAILED]:
@@ -542,10 +749,14 @@ class GAEOrchestrator:
         """
         Wait for a job to complete.
 
+        Polls quickly at first so short jobs return almost immediately, then
+        backs off exponentially (with jitter) until checks are poll_interval
+        apart.
+
         Args:
             job_id: Job ID to monitor
             description: Human-readable description for logging
-            poll_interval: Seconds between status checks
+            poll_interval: Maximum seconds between status checks
 
         Returns:
             Final job details
@@ -553,121 +764,451 @@ class GAEOrchestrator:
         Raises:
             RuntimeError: If job fails
         """
-        self._log(f"  Waiting for {description}... (job: {job_id})")
+        self._log("  Waiting for %s... (job: %s)", description, job_id)
 
-        start_time = time.time()
+        start_time = time.monotonic()
         last_status = None
+        delays = _backoff_delays(
+            min(JOB_POLL_INITIAL_DELAY, poll_interval), poll_interval
+        )
+
+        # The response format doesn't change during a job: detect it once,
+        # and again only if a response lacks the keys that format relies on
+        # (e.g. the empty dict returned when a poll fails)
+        handler, handler_keys = None, ()
 
         while True:
             job = self.gae.get_job(job_id)
 
-            # GAE API uses different response formats:
-            # 1. status-based: {'status': 'succeeded'|'failed'|'running'}
-            # 2. progress-based: {'progress': X, 'total': Y, 'error': bool}
-            # 3. state-based: {'state': 'done'|'failed'|'running'}
-
-            # Check for progress-based format first
-            if "progress" in job and "total" in job:
-                progress = job.get("progress", 0)
-                total = job.get("total", 1)
-                has_error = job.get("error", False)
-
-                if has_error:
-                    error_msg = job.get("error_message", "Unknown error")
-                    raise RuntimeError(f"{description} failed: {error_msg}")
-
-                if progress >= total and total > 0:
-                    elapsed = time.time() - start_time
-                    self._log(f"  OK: {description} completed ({elapsed:.1f}s)")
-                    return job
-
-                current_status = f"{progress}/{total}"
-                if current_status != last_status:
-                    self._log(f"    Progress: {current_status}")
-                    last_status = current_status
-
-            # Check for status-based format
-            elif "status" in job:
-                status = job["status"]
-
-                if status != last_status:
-                    self._log(f"    Status: {status}")
-                    last_status = status
-
-                if status == "succeeded":
-                    elapsed = time.time() - start_time
-                    self._log(f"  OK: {description} completed ({elapsed:.1f}s)")
-                    return job
-
-                if status == "failed":
-                    error = job.get("error", "Unknown error")
-                    raise RuntimeError(f"{description} failed: {error}")
-
-            # Check for state-based format (GenAI Platform)
-            elif "state" in job:
-                state = job["state"]
-
-                if state != last_status:
-                    self._log(f"    State: {state}")
-                    last_status = state
-
-                if state in ["done", "finished", "completed"]:
-                    elapsed = time.time() - start_time
-                    self._log(f"  OK: {description} completed ({elapsed:.1f}s)")
-                    return job
-
-                if state in ["failed", "error"]:
-                    error = job.get("error", "Unknown error")
-                    raise RuntimeError(f"{description} failed: {error}")
+            if handler is None or not all(key in job for key in handler_keys):
+                handler, handler_keys = self._job_handler(job)
+            done, last_status = (handler or self._handle_unknown)(
+                job, description, last_status
+            )
 
-            else:
-                # Unknown format - log and continue
-                if last_status != "unknown":
-                    self._log(f"    Status: unknown format")
-                    last_status = "unknown"
+            if done:
+                elapsed = time.monotonic() - start_time
+                self._log("  OK: %s completed (%.1fs)", description, elapsed)
+                return job
 
             # Check timeout
             if self.current_analysis:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 if elapsed > self.current_analysis.config.timeout_seconds:
                     raise TimeoutError(f"{description} timed out after {elapsed:.0f}s")
 
-            time.sleep(poll_interval)
+            time.sleep(next(delays))
 
-    def run_batch(self, configs: List[AnalysisConfig]) -> List[AnalysisResult]:
+    def _job_handler(
+        self, job: Dict[str, Any]
+    ) -> Tuple[Optional[_JobHandler], Tuple[str, ...]]:
         """
-        Run multiple analyses in sequence.
+        Pick the handler for a job response's format.
 
-        Each analysis gets its own engine that is cleaned up after completion.
+        GAE API uses different response formats:
+        1. status-based: {'status': 'succeeded'|'failed'|'running'}
+        2. progress-based: {'progress': X, 'total': Y, 'error': bool}
+        3. state-based: {'state': 'done'|'failed'|'running'}
+
+        Returns:
+            Tuple of (handler, keys identifying the format); the handler is
+            None while the format is not recognized
+        """
+        # Check for progress-based format first
+        if "progress" in job and "total" in job:
+            return self._handle_progress, ("progress", "total")
+        if "status" in job:
+            return self._handle_status, ("status",)
+        # State-based format (GenAI Platform)
+        if "state" in job:
+            return self._handle_state, ("state",)
+        return None, ()
+
+    # Job handlers take (job, description, last_status), log status changes
+    # and return (done, new last_status); they raise if the job failed.
+
+    def _handle_progress(
+        self, job: Dict[str, Any], description: str, last_status: Optional[str]
+    ) -> Tuple[bool, Optional[str]]:
+        """Handle a progress-based job response."""
+        progress = job.get("progress", 0)
+        total = job.get("total", 1)
+
+        if job.get("error", False):
+            error_msg = job.get("error_message", "Unknown error")
+            raise RuntimeError(f"{description} failed: {error_msg}")
+
+        if progress >= total and total > 0:
+            return True, last_status
+
+        current_status = f"{progress}/{total}"
+        if current_status != last_status:
+            self._log("    Progress: %s", current_status)
+        return False, current_status
+
+    def _handle_status(
+        self, job: Dict[str, Any], description: str, last_status: Optional[str]
+    ) -> Tuple[bool, Optional[str]]:
+        """Handle a status-based job response."""
+        status = job["status"]
+
+        if status != last_status:
+            self._log("    Status: %s", status)
+
+        if status == "succeeded":
+            return True, status
+
+        if status == "failed":
+            error = job.get("error", "Unknown error")
+            raise RuntimeError(f"{description} failed: {error}")
+
+        return False, status
+
+    def _handle_state(
+        self, job: Dict[str, Any], description: str, last_status: Optional[str]
+    ) -> Tuple[bool, Optional[str]]:
+        """Handle a state-based job response (GenAI Platform)."""
+        state = job["state"]
+
+        if state != last_status:
+            self._log("    State: %s", state)
+
+        if state in ("done", "finished", "completed"):
+            return True, state
+
+        if state in ("failed", "error"):
+            error = job.get("error", "Unknown error")
+            raise RuntimeError(f"{description} failed: {error}")
+
+        return False, state
+
+    def _handle_unknown(
+        self, job: Dict[str, Any], description: str, last_status: Optional[str]
+    ) -> Tuple[bool, Optional[str]]:
+        """Handle a job response in an unrecognized format: log and continue."""
+        if last_status != "unknown":
+            self._log("    Status: unknown format")
+        return False, "unknown"
+
+    def run_batch(
+        self,
+        configs: List[AnalysisConfig],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[AnalysisResult]:
         """
-        self._log(f"=== Starting Batch Analysis: {len(configs)} analyses ===")
+        Run multiple analyses, up to max_concurrency engines at a time.
+
+        Configs that load the same graph onto the same kind of engine share
+        one engine: it is deployed and the graph loaded once, each algorithm
+        runs and stores its results, then the engine is cleaned up. Other
+        configs get their own engine. Engines spend most of their time
+        waiting on the server, so independent groups run concurrently and
+        the batch time tends towards the slowest group rather than the sum.
+
+        The existing-engine check runs once, before any engine is deployed.
+        Each worker thread drives its engines through its own GAE connection;
+        a connection passed to the constructor cannot be shared that way, so
+        such batches run one group at a time. Every connection keeps its
+        TCP/TLS sessions alive in a pooled requests.Session, so polls don't
+        pay a new handshake.
 
-        results = []
-        for i, config in enumerate(configs, 1):
-            self._log(f"\n--- Analysis {i}/{len(configs)}: {config.name} ---")
-            result = self.run_analysis(config)
-            results.append(result)
+        Args:
+            configs: Analyses to run
+            max_concurrency: Maximum engines running at once
 
-            if result.status == AnalysisStatus.COMPLETED:
-                self._log(f"OK: Completed {i}/{len(configs)}")
-            else:
-                self._log(f"ERROR: Failed {i}/{len(configs)}: {result.error_message}")
+        Returns:
+            AnalysisResult per config, in the order of `configs`
+        """
+        self._log("=== Starting Batch Analysis: %s analyses ===", len(configs))
+
+        self._initialize_connections()
+        self._check_existing_engines()
+
+        groups = list(self._group_configs_by_graph(configs).values())
+        workers = min(max(1, max_concurrency), len(groups))
+        if workers > 1 and self._gae_injected:
+            self._log(
+                "Batch uses the provided GAE connection; running analyses "
+                "one at a time",
+                level="WARN",
+            )
+            workers = 1
+
+        # Groups finish out of config order; slot results back by position
+        positions: Dict[int, List[int]] = {}
+        for i, config in enumerate(configs):
+            positions.setdefault(id(config), []).append(i)
+        results: List[Optional[AnalysisResult]] = [None] * len(configs)
+
+        def collect(group_results: List[AnalysisResult]):
+            for result in group_results:
+                index = positions[id(result.config)].pop(0)
+                results[index] = result
+                self._log_batch_outcome(index + 1, len(configs), result)
+
+        if workers <= 1:
+            for i, group in enumerate(groups, 1):
+                names = ", ".join(config.name for config in group)
+                self._log("\n--- Engine %s/%s: %s ---", i, len(groups), names)
+                collect(self._execute_group(group))
+        else:
+            worker_connections: List[GAEConnectionBase] = []
+
+            def execute(group: List[AnalysisConfig]) -> List[AnalysisResult]:
+                if getattr(self._local, "gae", None) is None:
+                    self._local.gae = get_gae_connection()
+                    with self._history_lock:
+                        worker_connections.append(self._local.gae)
+                return self._execute_group(group)
+
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(execute, group) for group in groups]
+                    for future in futures:
+                        collect(future.result())
+            finally:
+                for connection in worker_connections:
+                    connection.close()
 
         # Final summary
-        self._log(f"\n=== Batch Complete ===")
+        self._log("\n=== Batch Complete ===")
         completed = sum(1 for r in results if r.status == AnalysisStatus.COMPLETED)
         failed = len(results) - completed
         total_cost = sum(r.estimated_cost_usd or 0 for r in results)
         total_time = sum(r.duration_seconds or 0 for r in results)
 
-        self._log(f"Completed: {completed}/{len(results)}")
-        self._log(f"Failed: {failed}/{len(results)}")
-        self._log(f"Total time: {total_time:.1f}s ({total_time/60:.1f} min)")
+        self._log("Completed: %s/%s", completed, len(results))
+        self._log("Failed: %s/%s", failed, len(results))
+        self._log("Total time: %.1fs (%.1f min)", total_time, total_time / 60)
         if total_cost > 0:
-            self._log(f"Total cost: ${total_cost:.4f}")
+            self._log("Total cost: $%.4f", total_cost)
+
+        return results
+
+    def _group_configs_by_graph(
+        self, configs: List[AnalysisConfig]
+    ) -> Dict[tuple, List[AnalysisConfig]]:
+        """
+        Group configs that can share one engine and one loaded graph.
+
+        Configs match when they load the same collections and attributes
+        from the same database onto the same engine size and type.
+        Groups and the configs in them keep their order in `configs`.
+        """
+        groups: Dict[tuple, List[AnalysisConfig]] = {}
+        for config in configs:
+            key = (
+                config.database,
+                tuple(sorted(config.vertex_collections)),
+                tuple(sorted(config.edge_collections)),
+                tuple(sorted(config.vertex_attributes or [])),
+                config.engine_size,
+                config.engine_type,
+            )
+            groups.setdefault(key, []).append(config)
+        return groups
+
+    def _execute_group(self, configs: List[AnalysisConfig]) -> List[AnalysisResult]:
+        """
+        Run analyses that share a graph on one engine.
+
+        A single config runs through the normal workflow, retries included.
+        For several, the engine is deployed and the graph loaded once; each
+        algorithm then runs and stores its results, and a failure only fails
+        that analysis. The engine's estimated cost is split across the group.
+        """
+        if len(configs) == 1:
+            return [self._execute_analysis(configs[0])]
+
+        results = [self._new_result(config) for config in configs]
+        lead = results[0]
+
+        with self._request_timeout(configs[0]):
+            try:
+                self.current_analysis = lead
+                self._deploy_engine(lead)
+                self._load_graph(lead)
+            except Exception as e:
+                for result in results:
+                    self._mark_failed(result, e)
+            else:
+                for result in results:
+                    result.engine_id = lead.engine_id
+                    result.graph_id = lead.graph_id
+                    result.vertex_count = lead.vertex_count
+                    result.edge_count = lead.edge_count
+                    self.current_analysis = result
+                    try:
+                        self._run_algorithm(result)
+                        self._store_results(result)
+                    except Exception as e:
+                        self._mark_failed(result, e)
+                        continue
+                    self._mark_completed(result)
+            finally:
+                self._release_shared_engine(lead, results)
 
         return results
 
+    def run_batch_shared_storage(
+        self, configs: List[AnalysisConfig]
+    ) -> List[AnalysisResult]:
+        """
+        Run several analyses on one engine and store their results together.
+
+        Results can only be stored together when the jobs live on the same
+        engine, so a single engine (sized from the first config) runs every
+        analysis. Completed jobs are grouped by (target_collection, database)
+        and each group is written with one store_results call, so N analyses
+        cost one storage job per target instead of one each.
+
+        Failed analyses are recorded and skipped; they are not retried.
+        The engine's estimated cost is split evenly across the analyses.
+
+        Args:
+            configs: Analyses to run
+
+        Returns:
+            AnalysisResult per config, in the order of `configs`
+        """
+        if not configs:
+            return []
+
+        self._log("=== Starting Shared-Storage Batch: %s analyses ===", len(configs))
+
+        self._initialize_connections()
+        self._check_existing_engines()
+
+        results = [
+            self._new_result(config, engine_size=configs[0].engine_size)
+            for config in configs
+        ]
+        lead = results[0]
+        groups: Dict[Tuple[str, str], List[AnalysisResult]] = {}
+
+        with self._request_timeout(configs[0]):
+            try:
+                self.current_analysis = lead
+                self._deploy_engine(lead)
+
+                for result in results:
+                    result.engine_id = lead.engine_id
+                    self.current_analysis = result
+                    try:
+                        self._load_graph(result)
+                        self._run_algorithm(result)
+                    except Exception as e:
+                        self._mark_failed(result, e)
+                        continue
+                    key = (result.config.target_collection, result.config.database)
+                    groups.setdefault(key, []).append(result)
+
+                for group in groups.values():
+                    self.current_analysis = group[0]
+                    jobs = [(r.job_id, r.config.result_field) for r in group]
+                    try:
+                        self._store_results(group[0], jobs)
+                    except Exception as e:
+                        for result in group:
+                            self._mark_failed(result, e)
+                        continue
+                    for result in group:
+                        result.results_stored = True
+                        result.documents_updated = group[0].documents_updated
+                        self._mark_completed(result)
+            except Exception as e:
+                for result in results:
+                    if result.status != AnalysisStatus.FAILED:
+                        self._mark_failed(result, e)
+            finally:
+                self._release_shared_engine(lead, results)
+
+        for i, result in enumerate(results, 1):
+            self._log_batch_outcome(i, len(results), result)
+        return results
+
+    def _request_timeout(self, config: AnalysisConfig):
+        """
+        Bound GAE HTTP requests inside the block by the config's timeout.
+
+        The job timeout is only checked between polls; this stops a request
+        to a server that keeps the connection open but never answers from
+        hanging the workflow. The override is per thread and scoped to the
+        block, so an injected connection keeps its configured timeout.
+        """
+        request_timeout = getattr(self.gae, "request_timeout", None)
+        if request_timeout is None:
+            return nullcontext()
+        return request_timeout(config.request_timeout_seconds)
+
+    def _new_result(
+        self, config: AnalysisConfig, engine_size: Optional[str] = None
+    ) -> AnalysisResult:
+        """Create the tracker for an analysis that is about to start."""
+        return AnalysisResult(
+            config=config,
+            status=AnalysisStatus.PENDING,
+            start_time=datetime.now(),
+            engine_size=engine_size or config.engine_size,
+            algorithm=config.algorithm,
+        )
+
+    def _mark_completed(self, result: AnalysisResult):
+        """Record a completed analysis."""
+        result.status = AnalysisStatus.COMPLETED
+        result.end_time = datetime.now()
+        result.duration_seconds = time.monotonic() - result._start_monotonic
+
+    def _mark_failed(self, result: AnalysisResult, error: Exception):
+        """Record a failed analysis."""
+        result.status = AnalysisStatus.FAILED
+        result.error_message = str(error)
+        result.end_time = datetime.now()
+        result.duration_seconds = time.monotonic() - result._start_monotonic
+        self._log(
+            "ERROR: Analysis %s failed: %s", result.config.name, error, level="ERROR"
+        )
+
+    def _release_shared_engine(
+        self, lead: AnalysisResult, results: List[AnalysisResult]
+    ):
+        """
+        Split a shared engine's cost across its analyses, clean it up and
+        record the analyses in the history.
+        """
+        if lead.engine_id:
+            engine_seconds = time.monotonic() - lead._start_monotonic
+            cost_share = engine_seconds * lead._per_second_cost / len(results)
+            for result in results:
+                result.engine_runtime_minutes = engine_seconds / 60
+                if cost_share:
+                    result.estimated_cost_usd = cost_share
+
+            try:
+                if lead.config.auto_cleanup:
+                    self._cleanup_engine(lead)
+                else:
+                    self._log(
+                        "Engine %s left running (auto_cleanup=False)",
+                        lead.engine_id,
+                        level="WARN",
+                    )
+            except Exception as e:
+                self._log("CRITICAL: Engine cleanup failed: %s", e, level="ERROR")
+                self._log(
+                    "You MUST manually delete engine: %s", lead.engine_id, level="ERROR"
+                )
+
+        self._record_history(results)
+        self.current_analysis = None
+
+    def _log_batch_outcome(self, index: int, total: int, result: AnalysisResult):
+        """Log whether one analysis of a batch completed."""
+        if result.status == AnalysisStatus.COMPLETED:
+            self._log("OK: Completed %s/%s", index, total)
+        else:
+            self._log("ERROR: Failed %s/%s: %s", index, total, result.error_message)
+
     def get_summary(self, result: AnalysisResult) -> str:
         """Get a human-readable summary of an analysis."""
         lines = [
@@ -693,14 +1234,101 @@ class GAEOrchestrator:
 
         return "\n".join(lines)
 
+    def _record_history(self, results: List[AnalysisResult]):
+        """Add finished analyses to the history and any open history stream."""
+        with self._history_lock:
+            self.analysis_history.extend(results)
+            if self._history_file is not None:
+                # A failed write must not lose the analysis itself
+                try:
+                    for result in results:
+                        self._history_file.write(_encode_history_record(result))
+                    self._history_file.flush()
+                except (TypeError, ValueError, OSError) as e:
+                    self._log("Could not write history stream: %s", e, level="WARN")
+
+    def open_history_stream(self, filepath: str = "analysis_history.ndjson"):
+        """
+        Append every finished analysis to an NDJSON file as it completes.
+
+        Each analysis is written as one JSON line (AnalysisResult.to_dict()),
+        so persisting a result costs one append instead of rewriting the
+        whole history, and a crash leaves every completed line readable.
+        Read the file back with load_history().
+
+        Args:
+            filepath: File to append to (created if missing)
+        """
+        with self._history_lock:
+            if self._history_file is not None:
+                self._history_file.close()
+            self._history_file = open(filepath, "ab")
+        self._log("Streaming history to %s", filepath)
+
+    def close_history_stream(self):
+        """Stop appending analyses to the history stream and close its file."""
+        with self._history_lock:
+            if self._history_file is not None:
+                self._history_file.close()
+                self._history_file = None
+
+    def load_history(self, filepath: str) -> List[AnalysisResult]:
+        """
+        Load analyses from an NDJSON history file into analysis_history.
+
+        The file is read line by line. Lines that cannot be parsed (e.g. a
+        record cut short by a crash) are skipped with a warning.
+
+        Args:
+            filepath: File written by open_history_stream()
+
+        Returns:
+            The loaded analyses, in file order
+        """
+        loaded = []
+        with open(filepath, "rb") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    data = (
+                        orjson.loads(line) if orjson is not None else json.loads(line)
+                    )
+                    loaded.append(AnalysisResult.from_dict(data))
+                except (ValueError, TypeError, KeyError) as e:
+                    self._log(
+                        "Skipping unreadable history line %s: %s",
+                        line_number,
+                        e,
+                        level="WARN",
+                    )
+
+        with self._history_lock:
+            self.analysis_history.extend(loaded)
+        return loaded
+
     def save_history(self, filepath: str = "analysis_history.json"):
-        """Save analysis history to JSON file."""
-        history_data = [r.to_dict() for r in self.analysis_history]
+        """
+        Save analysis history to JSON file.
 
-        with open(filepath, "w") as f:
-            json.dump(history_data, f, indent=2)
+        With orjson installed the results are serialized directly from the
+        dataclasses, without building intermediate dictionaries.
+        """
+        with self._history_lock:
+            history = list(self.analysis_history)
+
+        if orjson is not None:
+            with open(filepath, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        history, default=_json_default, option=orjson.OPT_INDENT_2
+                    )
+                )
+        else:
+            with open(filepath, "w") as f:
+                json.dump([r.to_dict() for r in history], f, indent=2)
 
-        self._log(f"History saved to {filepath}")
+        self._log("History saved to %s", filepath)
 
     def estimate_cost(
         self, config: AnalysisConfig, estimated_runtime_minutes: float = 15
@@ -715,5 +1343,5 @@ class GAEOrchestrator:
         Returns:
             Estimated cost in USD (0 for self-managed)
         """
-        hourly_cost = self.ENGINE_COSTS.get(config.engine_size, 0)
-        return (estimated_runtime_minutes / 60) * hourly_cost
+        per_second_cost = self.ENGINE_COSTS.get(config.engine_size, 0.0) / 3600.0
+        return estimated_runtime_minutes * 60 * per_second_cost
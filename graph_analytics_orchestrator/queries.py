@@ -4,12 +4,125 @@ Result Query Helpers
 Provides utilities for querying and cross-referencing GAE result collections.
 """
 
+import ast
 import logging
-from typing import Dict, List, Optional, Any
+import re
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 from arango.database import StandardDatabase
 
+from .constants import DEFAULT_CURSOR_BATCH_SIZE
+from .export import _compile_projection
+
+# pandas and pyarrow are optional: only needed for columnar return formats
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - depends on installed extras
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - depends on installed extras
+    pa = None
+
 logger = logging.getLogger(__name__)
 
+# "<var>.<path> <op> <literal>", the shape of nearly every caller filter
+_SIMPLE_FILTER_RE = re.compile(
+    r"""^\s*(?P<attribute>[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)+)
+    \s*(?P<op>==|!=|>=|<=|>|<)\s*
+    (?P<value>-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?
+      |'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"
+      |true|false|null)\s*$""",
+    re.VERBOSE,
+)
+_KEYWORD_VALUES = {"true": True, "false": False, "null": None}
+
+
+def _filter_clause(expression: Optional[str], name: str) -> Tuple[str, Dict]:
+    """
+    Build a FILTER clause, binding the comparand of simple comparisons.
+
+    "r.score >= 0.5" becomes "FILTER r.score >= @<name>" with the value
+    bound, so queries differing only in thresholds share their text (and
+    plan) and the value never reaches the AQL parser as code. Anything
+    more complex is used verbatim.
+
+    Returns:
+        Tuple of (FILTER clause or "", bind variables it needs)
+    """
+    if not expression:
+        return "", {}
+    match = _SIMPLE_FILTER_RE.match(expression)
+    if match is None:
+        return f"FILTER {expression}", {}
+
+    literal = match.group("value")
+    if literal in _KEYWORD_VALUES:
+        value = _KEYWORD_VALUES[literal]
+    elif literal[0] in "'\"":
+        value = ast.literal_eval(literal)
+    elif re.fullmatch(r"-?\d+", literal):
+        value = int(literal)
+    else:
+        value = float(literal)
+    clause = f"FILTER {match.group('attribute')} {match.group('op')} @{name}"
+    return clause, {name: value}
+
+
+def _run_query(
+    db: StandardDatabase,
+    query: str,
+    bind_vars: Optional[Dict[str, Any]] = None,
+    limit: Optional[int] = None,
+    stream: bool = False,
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    """
+    Execute a query, either collecting every row or returning the cursor.
+
+    A streaming cursor lets callers process rows as batches arrive and stop
+    early. Collected results are fetched in batches of up to the limit, so
+    small queries need a single round-trip.
+    """
+    if stream:
+        return db.aql.execute(
+            query,
+            bind_vars=bind_vars,
+            stream=True,
+            batch_size=DEFAULT_CURSOR_BATCH_SIZE,
+        )
+    batch_size = min(limit or DEFAULT_CURSOR_BATCH_SIZE, DEFAULT_CURSOR_BATCH_SIZE)
+    return list(db.aql.execute(query, bind_vars=bind_vars, batch_size=batch_size))
+
+
+def _vertex_join(
+    var: str, vertex_collection: Optional[str], keep_missing: bool = False
+) -> Tuple[str, Dict]:
+    """
+    Build the AQL that binds ``person`` to the vertex a result row refers to.
+
+    With a vertex collection the rows are joined on the primary index, which
+    the optimizer batches; DOCUMENT() is only used when ids may point into
+    several collections. Rows whose vertex is missing are skipped unless
+    keep_missing is set, in which case ``person`` is null for them.
+
+    Returns:
+        Tuple of (AQL fragment, bind variables it needs)
+    """
+    if vertex_collection is None:
+        lookup = f"LET person = DOCUMENT({var}.id)"
+        return (lookup if keep_missing else f"{lookup} FILTER person != null"), {}
+    if keep_missing:
+        return (
+            f"LET person = FIRST(FOR x IN @@vertex_coll "
+            f"FILTER x._id == {var}.id LIMIT 1 RETURN x)",
+            {"@vertex_coll": vertex_collection},
+        )
+    return (
+        f"FOR person IN @@vertex_coll FILTER person._id == {var}.id",
+        {"@vertex_coll": vertex_collection},
+    )
+
 
 def cross_reference_results(
     db: StandardDatabase,
@@ -19,25 +132,35 @@ def cross_reference_results(
     filter2: Optional[str] = None,
     join_fields: Optional[Dict[str, str]] = None,
     limit: Optional[int] = None,
-) -> List[Dict[str, Any]]:
+    stream: bool = False,
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
     """
     Cross-reference two result collections by 'id' field.
 
     Common use case: Join PageRank and WCC results to find influential
     vertices in connected components.
 
+    The collections are joined in a single pass; with a persistent index on
+    the collection2 join field (see ensure_result_collection_indexes) each
+    row of collection1 costs one index lookup.
+
     Args:
         db: ArangoDB database connection
         collection1: First result collection name
         collection2: Second result collection name
-        filter1: Optional AQL filter expression for collection1 (e.g., "r.pagerank_influence >= 0.000002")
-        filter2: Optional AQL filter expression for collection2 (e.g., "w.component_id == 'nodes/xxx'")
+        filter1: Optional AQL filter expression for collection1, whose
+                 documents are bound to ``r`` (e.g., "r.pagerank_influence >= 0.000002")
+        filter2: Optional AQL filter expression for collection2, whose
+                 documents are bound to ``w`` (e.g., "w.component_id == 'nodes/xxx'")
         join_fields: Optional dict mapping collection1 fields to collection2 fields
-                    (defaults to {'id': 'id'})
+                    (defaults to {'id': 'id'}); dotted names address
+                    nested attributes
         limit: Optional limit on number of results
+        stream: Return a server-side cursor yielding documents as they
+                arrive instead of a list
 
     Returns:
-        List of joined result documents
+        List (or cursor, if stream=True) of joined result documents
 
     Example:
         # Find top PageRank vertices in connected component
@@ -53,33 +176,42 @@ def cross_reference_results(
     if join_fields is None:
         join_fields = {"id": "id"}
 
-    # Build query
-    filter1_clause = f"FILTER {filter1}" if filter1 else ""
-    filter2_clause = f"FILTER {filter2}" if filter2 else ""
-    limit_clause = f"LIMIT {limit}" if limit else ""
-
-    # Get join key fields
+    # Get join key fields, bound as attribute paths so dotted keys such as
+    # "result_data.id" resolve to nested attributes
     key1, key2 = list(join_fields.items())[0]
+    bind_vars = {
+        "@col1": collection1,
+        "@col2": collection2,
+        "key1": key1.split("."),
+        "key2": key2.split("."),
+    }
+
+    # Build query; names and numbers are bound so the query text only
+    # changes with the filters
+    filter1_clause, filter1_vars = _filter_clause(filter1, "filter1")
+    filter2_clause, filter2_vars = _filter_clause(filter2, "filter2")
+    bind_vars.update(filter1_vars)
+    bind_vars.update(filter2_vars)
+    limit_clause = ""
+    if limit:
+        limit_clause = "LIMIT @limit"
+        bind_vars["limit"] = limit
 
     query = f"""
-    FOR r1 IN {collection1}
+    FOR r IN @@col1
       {filter1_clause}
-      LET r2 = FIRST(
-        FOR r2_inner IN {collection2}
-          FILTER r2_inner.{key2} == r1.{key1}
-          {filter2_clause}
-          RETURN r2_inner
-      )
-      FILTER r2 != null
-      RETURN {{
-        id: r1.{key1},
-        result1: r1,
-        result2: r2
-      }}
-      {limit_clause}
+      FOR w IN @@col2
+        FILTER w.@key2 == r.@key1
+        {filter2_clause}
+        {limit_clause}
+        RETURN {{
+          id: r.@key1,
+          result1: r,
+          result2: w
+        }}
     """
 
-    return list(db.aql.execute(query))
+    return _run_query(db, query, bind_vars, limit=limit, stream=stream)
 
 
 def get_top_influential_connected(
@@ -90,7 +222,7 @@ def get_top_influential_connected(
     min_influence: Optional[float] = None,
     limit: int = 100,
     include_vertex_details: bool = False,
-    vertex_collection: str = "nodes",
+    vertex_collection: Optional[str] = "nodes",
     vertex_fields: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
     """
@@ -108,29 +240,35 @@ def get_top_influential_connected(
         limit: Number of top results to return
         include_vertex_details: Whether to join with vertex collection for details
         vertex_collection: Vertex collection name if including details
+                           (None resolves each id with DOCUMENT(), for ids
+                           spanning several collections)
         vertex_fields: Optional list of vertex fields to include
 
     Returns:
         List of influential connected vertices
     """
-    # If component_id not specified, find largest component
+    # If component_id not specified, find the largest component in the same
+    # query so the lookup and the join are planned and run together
     if component_id is None:
-        largest_component_query = f"""
-        FOR r IN {wcc_collection}
-          FILTER r.component_id != null
-          COLLECT component = r.component_id WITH COUNT INTO size
-          SORT size DESC
-          LIMIT 1
-          RETURN component
-        """
-        components = list(db.aql.execute(largest_component_query))
-        if not components:
-            return []
-        component_id = components[0]
+        target_component = """
+    LET target = FIRST(
+      FOR c IN @@wcc_col
+        FILTER c.component_id != null
+        COLLECT component = c.component_id WITH COUNT INTO size
+        SORT size DESC
+        LIMIT 1
+        RETURN component
+    )
+    FILTER target != null
+    """
+        component_ref = "target"
+    else:
+        target_component = ""
+        component_ref = "@component_id"
 
     # Build filter clauses
     influence_filter = (
-        f"AND pr.pagerank_influence >= {min_influence}" if min_influence else ""
+        "FILTER pr.pagerank_influence >= @min_influence" if min_influence else ""
     )
 
     # Build vertex join if requested
@@ -138,61 +276,107 @@ def get_top_influential_connected(
         if vertex_fields is None:
             vertex_fields = ["full_name", "category", "email"]
 
-        vertex_selects = []
-        for field in vertex_fields:
-            parts = field.split(".")
-            vertex_selects.append(f"{parts[-1]}: person.{field}")
-
-        person_join = "LET person = DOCUMENT(pr.id)"
-        person_return = ", ".join(vertex_selects) + ","
+        projection = _compile_projection("person", tuple(vertex_fields))
+        # Top-ranked rows are kept even without a vertex document, with
+        # null details, so the top-N list is never shortened by the join
+        person_join, bind_vars = _vertex_join(
+            "pr", vertex_collection, keep_missing=True
+        )
+        person_return = projection + "," if projection else ""
     else:
-        person_join = ""
+        person_join, bind_vars = "", {}
         person_return = ""
+    bind_vars.update(
+        {
+            "@pagerank_col": pagerank_collection,
+            "@wcc_col": wcc_collection,
+            "limit": limit,
+        }
+    )
+    if component_id is not None:
+        bind_vars["component_id"] = component_id
+    if min_influence:
+        bind_vars["min_influence"] = min_influence
 
     query = f"""
-    FOR pr IN {pagerank_collection}
+    {target_component}
+    FOR pr IN @@pagerank_col
+      {influence_filter}
       SORT pr.pagerank_influence DESC
-      {person_join}
-      LET wcc = FIRST(
-        FOR w IN {wcc_collection}
-          FILTER w.id == pr.id AND w.component_id == @component_id
-          RETURN w
-      )
-      FILTER wcc != null {influence_filter}
-      LIMIT {limit}
-      RETURN {{
-        vertex_id: pr.id,
-        {person_return}
-        pagerank_influence: pr.pagerank_influence,
-        component_id: wcc.component_id,
-        in_connected_network: true
-      }}
+      FOR w IN @@wcc_col
+        FILTER w.id == pr.id AND w.component_id == {component_ref}
+        {person_join}
+        LIMIT @limit
+        RETURN {{
+          vertex_id: pr.id,
+          {person_return}
+          pagerank_influence: pr.pagerank_influence,
+          component_id: w.component_id,
+          in_connected_network: true
+        }}
     """
 
-    return list(db.aql.execute(query, bind_vars={"component_id": component_id}))
+    return _run_query(db, query, bind_vars, limit=limit)
+
+
+def _arrow_table(rows: Iterator[Dict[str, Any]]) -> "pa.Table":
+    """
+    Build a pyarrow Table from rows, one table per cursor batch.
+
+    Only one batch of rows is held as Python objects at a time. Each batch
+    infers its own schema and the batches are combined with type promotion,
+    so fields that are null or absent in early batches are not lost.
+    """
+    tables = []
+    while True:
+        chunk = list(islice(rows, DEFAULT_CURSOR_BATCH_SIZE))
+        if not chunk:
+            break
+        tables.append(pa.Table.from_pylist(chunk))
+    if not tables:
+        return pa.Table.from_pylist([])
+    return pa.concat_tables(tables, promote_options="default")
 
 
 def get_results_with_details(
     db: StandardDatabase,
     result_collection: str,
-    vertex_collection: str = "nodes",
+    vertex_collection: Optional[str] = "nodes",
     result_filter: Optional[str] = None,
     fields: Optional[List[str]] = None,
     limit: Optional[int] = None,
-) -> List[Dict[str, Any]]:
+    stream: bool = False,
+    return_format: str = "list",
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]], "pd.DataFrame", "pa.Table"]:
     """
     Get result collection data joined with vertex details.
 
     Args:
         db: ArangoDB database connection
         result_collection: Result collection name (e.g., 'pagerank_results')
-        vertex_collection: Vertex collection name (e.g., 'nodes')
+        vertex_collection: Vertex collection name (e.g., 'nodes'); None
+                           resolves each id with DOCUMENT(), for ids
+                           spanning several collections
         result_filter: Optional AQL filter for results (e.g., "r.pagerank_influence >= 0.000002")
         fields: Optional list of vertex fields to include (if None, includes common fields)
         limit: Optional limit on results
+        stream: Return a server-side cursor yielding documents as they
+                arrive instead of a list
+        return_format: 'list' for documents, 'pandas' for a DataFrame with
+                       result_id, vertex field and result_data columns, or
+                       'arrow' for a pyarrow Table. Both are read from a
+                       streaming cursor: pandas consumes it directly, arrow
+                       builds one record batch per cursor batch. They
+                       cannot be combined with stream=True.
 
     Returns:
-        List of result documents with vertex details
+        List (or cursor, if stream=True) of result documents with vertex
+        details, or a DataFrame / Table for the columnar return formats
+
+    Raises:
+        ValueError: If return_format is not 'list', 'pandas' or 'arrow', or
+                    a columnar format is combined with stream=True
+        ImportError: If the library for the requested format is not installed
 
     Example:
         # Get top PageRank results with vertex names
@@ -204,31 +388,57 @@ def get_results_with_details(
             limit=100
         )
     """
+    if return_format not in ("list", "pandas", "arrow"):
+        raise ValueError(
+            f"Invalid return_format: {return_format!r} "
+            "(expected 'list', 'pandas' or 'arrow')"
+        )
+    if stream and return_format != "list":
+        raise ValueError(
+            f"stream=True returns a cursor and cannot be combined with "
+            f"return_format={return_format!r}"
+        )
+    if return_format == "pandas" and pd is None:
+        raise ImportError("return_format='pandas' requires pandas: pip install pandas")
+    if return_format == "arrow" and pa is None:
+        raise ImportError("return_format='arrow' requires pyarrow: pip install pyarrow")
+
     if fields is None:
         fields = ["full_name", "category", "email"]
 
     # Build field accessors
-    field_returns = []
-    for field in fields:
-        parts = field.split(".")
-        accessor = "person." + field
-        field_returns.append(f"{parts[-1]}: {accessor}")
-
-    field_join = ", ".join(field_returns)
-    filter_clause = f"FILTER {result_filter}" if result_filter else ""
-    limit_clause = f"LIMIT {limit}" if limit else ""
+    projection = _compile_projection("person", tuple(fields))
+    field_join = projection + "," if projection else ""
+    filter_clause, filter_vars = _filter_clause(result_filter, "filter")
+    person_join, bind_vars = _vertex_join("r", vertex_collection)
+    bind_vars.update(filter_vars)
+    bind_vars["@col"] = result_collection
+    limit_clause = ""
+    if limit:
+        limit_clause = "LIMIT @limit"
+        bind_vars["limit"] = limit
 
     query = f"""
-    FOR r IN {result_collection}
+    FOR r IN @@col
       {filter_clause}
-      LET person = DOCUMENT(r.id)
-      FILTER person != null
+      {person_join}
+      {limit_clause}
       RETURN {{
         result_id: r.id,
-        {field_join},
+        {field_join}
         result_data: r
       }}
-      {limit_clause}
     """
 
-    return list(db.aql.execute(query))
+    if return_format == "pandas":
+        # Rows go from the cursor into the frame without an intermediate list
+        columns = ["result_id"]
+        columns.extend(path.rpartition(".")[2] for path in fields)
+        columns.append("result_data")
+        cursor = _run_query(db, query, bind_vars, limit=limit, stream=True)
+        return pd.DataFrame.from_records(cursor, columns=columns)
+    if return_format == "arrow":
+        cursor = _run_query(db, query, bind_vars, limit=limit, stream=True)
+        return _arrow_table(cursor)
+
+    return _run_query(db, query, bind_vars, limit=limit, stream=stream)
@@ -6,11 +6,44 @@ validation, comparison, and batch operations.
 """
 
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from arango.database import StandardDatabase
 
+from .constants import RESULT_COLLECTION_WORKERS
+from .queries import _filter_clause
+
 logger = logging.getLogger(__name__)
 
+# Summarizes a sample server-side: which expected fields any sampled
+# document lacks, plus the first document's values for the type checks
+_SCHEMA_SUMMARY_QUERY = """
+LET sample = (FOR doc IN @@col LIMIT @sample_size RETURN doc)
+RETURN {
+  count: LENGTH(@@col),
+  sample_count: LENGTH(sample),
+  missing: UNIQUE(FLATTEN(
+    FOR doc IN sample RETURN (FOR f IN @fields FILTER !HAS(doc, f) RETURN f)
+  )),
+  values: LENGTH(sample) ? KEEP(sample[0], @typed_fields) : {}
+}
+"""
+
+# Persistent indexes per result collection: 'id' for joins back to vertices,
+# plus the field the query helpers sort or filter each collection by.
+# Collections not listed here get the 'id' index only.
+_RESULT_INDEX_FIELDS = {
+    "pagerank_results": [["id"], ["pagerank_influence"]],
+    "wcc_results": [["id"], ["component_id"]],
+    "label_propagation_results": [["id"], ["community_id"]],
+}
+
+# Collection size plus one document, fetched together for structure checks
+_COUNT_AND_SAMPLE_QUERY = """
+RETURN {count: LENGTH(@@col), sample: FIRST(FOR doc IN @@col LIMIT 1 RETURN doc)}
+"""
+
 
 def ensure_result_collection_indexes(
     db: StandardDatabase,
@@ -18,11 +51,16 @@ def ensure_result_collection_indexes(
     verbose: bool = False,
 ) -> Dict[str, int]:
     """
-    Ensure indexes exist on 'id' field for result collections.
+    Ensure indexes exist on 'id' and result fields for result collections.
 
     GAE stores algorithm results with sequential numeric _key values and places
     the original vertex document ID in an 'id' field. Indexes on this field
-    significantly improve cross-collection query performance.
+    significantly improve cross-collection query performance. The default
+    result collections are also indexed on the field queries sort or filter
+    them by (pagerank_influence, component_id, community_id).
+
+    Existing collections are listed with one request, then the collections
+    are checked and indexed concurrently.
 
     Args:
         db: ArangoDB database connection
@@ -32,58 +70,70 @@ def ensure_result_collection_indexes(
 
     Returns:
         Dictionary with counts: {'created': N, 'existing': M, 'missing': K}
+        (created/existing count indexes, missing counts collections)
     """
     if collection_names is None:
-        collection_names = [
-            "pagerank_results",
-            "wcc_results",
-            "label_propagation_results",
-        ]
+        collection_names = list(_RESULT_INDEX_FIELDS)
 
-    indexes_created = 0
-    indexes_existing = 0
-    collections_missing = 0
+    existing_collections = {coll["name"] for coll in db.collections()}
 
-    for coll_name in collection_names:
+    def ensure_indexes(coll_name: str) -> List[str]:
+        """Index one collection; returns the outcome of each index."""
         try:
-            if not db.has_collection(coll_name):
+            if coll_name not in existing_collections:
                 if verbose:
                     logger.warning(
                         f"Collection '{coll_name}' does not exist (skipping)"
                     )
-                collections_missing += 1
-                continue
+                return ["missing"]
 
             coll = db.collection(coll_name)
-            existing_indexes = coll.indexes()
-
-            # Check if index on 'id' field already exists
-            has_id_index = any(
-                idx.get("type") == "persistent" and "id" in idx.get("fields", [])
-                for idx in existing_indexes
-            )
-
-            if has_id_index:
+            existing_indexes = [
+                idx.get("fields", [])
+                for idx in coll.indexes()
+                if idx.get("type") == "persistent"
+            ]
+
+            outcomes = []
+            for fields in _RESULT_INDEX_FIELDS.get(coll_name, [["id"]]):
+                label = ", ".join(fields)
+
+                # An index whose leading fields match already serves queries
+                if any(idx[: len(fields)] == fields for idx in existing_indexes):
+                    if verbose:
+                        logger.info(
+                            f"{coll_name}: Index on '{label}' field already exists"
+                        )
+                    outcomes.append("existing")
+                    continue
+
+                # Built in the background so the collection stays writable
+                # and the builds run side by side
+                index_name = f"idx_{coll_name}_{'_'.join(fields)}"
+                coll.add_persistent_index(
+                    fields=fields, unique=False, name=index_name, in_background=True
+                )
                 if verbose:
-                    logger.info(f"{coll_name}: Index on 'id' field already exists")
-                indexes_existing += 1
-            else:
-                # Create index on 'id' field
-                index_name = f"idx_{coll_name}_id"
-                coll.add_persistent_index(fields=["id"], unique=False, name=index_name)
-                if verbose:
-                    logger.info(f"{coll_name}: Created index on 'id' field")
-                indexes_created += 1
+                    logger.info(f"{coll_name}: Created index on '{label}' field")
+                outcomes.append("created")
+            return outcomes
 
         except Exception as e:
             if verbose:
                 logger.error(f"Failed to process collection '{coll_name}': {e}")
-            collections_missing += 1
+            return ["missing"]
+
+    outcomes = Counter()
+    if collection_names:
+        workers = min(RESULT_COLLECTION_WORKERS, len(collection_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for collection_outcomes in executor.map(ensure_indexes, collection_names):
+                outcomes.update(collection_outcomes)
 
     return {
-        "created": indexes_created,
-        "existing": indexes_existing,
-        "missing": collections_missing,
+        "created": outcomes["created"],
+        "existing": outcomes["existing"],
+        "missing": outcomes["missing"],
     }
 
 
@@ -101,6 +151,9 @@ def verify_result_collection(
     - Has 'id' field (if check_id_field=True)
     - Has index on 'id' field (if check_index=True)
 
+    Checks stop at the first failure: a missing or empty collection is
+    reported as invalid without sampling documents or listing indexes.
+
     Args:
         db: ArangoDB database connection
         collection_name: Name of result collection to verify
@@ -130,20 +183,32 @@ def verify_result_collection(
 
         result["exists"] = True
         coll = db.collection(collection_name)
-        result["count"] = coll.count()
-
-        if check_id_field and result["count"] > 0:
-            # Sample a document to check structure
-            sample_query = f"FOR doc IN {collection_name} LIMIT 1 RETURN doc"
-            try:
-                sample = list(db.aql.execute(sample_query))
-                if sample and "id" in sample[0]:
-                    result["has_id_field"] = True
-                    # Check format (should be document ID like "nodes/xxx")
-                    if isinstance(sample[0]["id"], str) and "/" in sample[0]["id"]:
-                        result["has_id_field"] = True
-            except Exception:
-                pass
+
+        if check_id_field:
+            # Count and sample a document to check structure in one round-trip
+            summary = next(
+                iter(
+                    db.aql.execute(
+                        _COUNT_AND_SAMPLE_QUERY,
+                        bind_vars={"@col": collection_name},
+                        batch_size=1,
+                    )
+                ),
+                None,
+            )
+            summary = summary or {}
+            result["count"] = summary.get("count") or 0
+            sample = summary.get("sample")
+            if sample and "id" in sample:
+                result["has_id_field"] = True
+        else:
+            result["count"] = coll.count()
+
+        if result["count"] == 0:
+            return result
+
+        if check_id_field and not result["has_id_field"]:
+            return result
 
         if check_index:
             indexes = coll.indexes()
@@ -153,11 +218,7 @@ def verify_result_collection(
             )
 
         # Collection is valid if it exists and has required fields/indexes
-        result["valid"] = (
-            result["exists"]
-            and (not check_id_field or result["has_id_field"])
-            and (not check_index or result["has_index"])
-        )
+        result["valid"] = not check_index or result["has_index"]
 
     except Exception as e:
         result["error"] = str(e)
@@ -176,6 +237,10 @@ def validate_result_schema(
     """
     Validate that result collection matches expected schema.
 
+    Every sampled document is checked for the required fields; field types
+    are checked on the first one. The checks run server-side, so only a
+    summary is transferred.
+
     Args:
         db: ArangoDB database connection
         result_collection: Result collection name
@@ -208,25 +273,35 @@ def validate_result_schema(
         validation["issues"].append(f"Collection '{result_collection}' does not exist")
         return validation
 
-    coll = db.collection(result_collection)
-    count = coll.count()
+    # Count, sample and check field presence in one round-trip; only the
+    # summary and the typed fields of one document come back
+    summary = next(
+        iter(
+            db.aql.execute(
+                _SCHEMA_SUMMARY_QUERY,
+                bind_vars={
+                    "@col": result_collection,
+                    "sample_size": sample_size,
+                    "fields": expected_fields,
+                    "typed_fields": list(expected_field_types or ()),
+                },
+            )
+        )
+    )
 
-    if count == 0:
+    if summary["count"] == 0:
         validation["issues"].append("Collection is empty")
         return validation
 
-    # Sample documents
-    query = f"FOR doc IN {result_collection} LIMIT {sample_size} RETURN doc"
-    samples = list(db.aql.execute(query))
-    validation["sample_count"] = len(samples)
-
-    if not samples:
+    validation["sample_count"] = summary["sample_count"]
+    if not summary["sample_count"]:
         validation["issues"].append("Could not sample any documents")
         return validation
 
     # Check required fields
-    sample = samples[0]
-    missing_fields = [f for f in expected_fields if f not in sample]
+    sample = summary["values"]
+    missing = set(summary["missing"])
+    missing_fields = [f for f in expected_fields if f in missing]
     if missing_fields:
         validation["issues"].append(f"Missing required fields: {missing_fields}")
         validation["has_required_fields"] = False
@@ -297,30 +372,45 @@ def compare_result_collections(
         "field_differences": {},
     }
 
-    # Get counts
-    if db.has_collection(collection1):
-        comparison["collection1_count"] = db.collection(collection1).count()
+    # Get counts; when both collections exist, fetch them in one round-trip
+    has_collection1 = db.has_collection(collection1)
+    has_collection2 = db.has_collection(collection2)
+    if not (has_collection1 and has_collection2):
+        if has_collection1:
+            comparison["collection1_count"] = db.collection(collection1).count()
+        if has_collection2:
+            comparison["collection2_count"] = db.collection(collection2).count()
+        return comparison
 
-    if db.has_collection(collection2):
-        comparison["collection2_count"] = db.collection(collection2).count()
+    collections = {"@col1": collection1, "@col2": collection2}
+    counts = next(
+        iter(
+            db.aql.execute(
+                "RETURN [LENGTH(@@col1), LENGTH(@@col2)]",
+                bind_vars=collections,
+                batch_size=1,
+            )
+        ),
+        None,
+    )
+    if counts:
+        comparison["collection1_count"], comparison["collection2_count"] = counts
 
     if comparison["collection1_count"] == 0 or comparison["collection2_count"] == 0:
         return comparison
 
-    # Count overlap
-    overlap_query = f"""
-    LET ids1 = (
-      FOR r IN {collection1}
-        RETURN r.id
-    )
-    LET ids2 = (
-      FOR r IN {collection2}
-        RETURN r.id
-    )
-    RETURN LENGTH(INTERSECTION(ids1, ids2))
+    # Count overlap with an indexed join, without building either id list
+    overlap_query = """
+    FOR r1 IN @@col1
+      FOR r2 IN @@col2
+        FILTER r2.id == r1.id
+        COLLECT WITH COUNT INTO overlap
+        RETURN overlap
     """
 
-    overlap_result = list(db.aql.execute(overlap_query))
+    overlap_result = list(
+        db.aql.execute(overlap_query, bind_vars=collections, batch_size=1)
+    )
     comparison["overlap_count"] = overlap_result[0] if overlap_result else 0
 
     # Calculate percentages
@@ -337,17 +427,28 @@ def compare_result_collections(
             comparison["collection2_count"] - comparison["overlap_count"]
         )
 
-    # Compare field values if specified
+    # Compare field values if specified, counting every field in one pass
     if compare_fields:
-        for field in compare_fields:
-            diff_query = f"""
-            FOR r1 IN {collection1}
-              LET r2 = FIRST(FOR r2_inner IN {collection2} FILTER r2_inner.id == r1.id RETURN r2_inner)
-              FILTER r2 != null AND r1.{field} != r2.{field}
-              RETURN 1
-            """
-            differences = list(db.aql.execute(diff_query))
-            comparison["field_differences"][field] = len(differences)
+        aggregates = ", ".join(
+            f"diff{i} = SUM(r1.{field} != r2.{field} ? 1 : 0)"
+            for i, field in enumerate(compare_fields)
+        )
+        diff_values = ", ".join(f"diff{i}" for i in range(len(compare_fields)))
+        diff_query = f"""
+        FOR r1 IN @@col1
+          FOR r2 IN @@col2
+            FILTER r2.id == r1.id
+            COLLECT AGGREGATE {aggregates}
+            RETURN [{diff_values}]
+        """
+        diff_result = list(
+            db.aql.execute(diff_query, bind_vars=collections, batch_size=1)
+        )
+        differences = diff_result[0] if diff_result else []
+        for i, field in enumerate(compare_fields):
+            # SUM over no joined rows is null
+            count = differences[i] if i < len(differences) else None
+            comparison["field_differences"][field] = count or 0
 
     return comparison
 
@@ -362,6 +463,11 @@ def bulk_update_result_metadata(
     """
     Add metadata fields to all results in a collection.
 
+    Each batch is updated server-side by a single AQL UPDATE that only
+    returns the updated keys. Batches are paged by _key, so each one seeks
+    straight to where the previous batch ended. Top-level metadata fields
+    replace existing values, nested objects included.
+
     Args:
         db: ArangoDB database connection
         result_collection: Result collection name
@@ -372,36 +478,41 @@ def bulk_update_result_metadata(
     Returns:
         Number of documents updated
     """
-    coll = db.collection(result_collection)
-
     # Build filter
-    filter_clause = f"FILTER {filter_query}" if filter_query else ""
+    filter_clause, filter_vars = _filter_clause(filter_query, "filter")
+
+    # Every batch reuses the same query text; only the last key changes
+    query = f"""
+    FOR r IN @@col
+      FILTER r._key > @last_key
+      {filter_clause}
+      SORT r._key
+      LIMIT @batch_size
+      UPDATE r WITH @metadata IN @@col
+        OPTIONS {{ ignoreRevs: true, mergeObjects: false }}
+      RETURN r._key
+    """
+    bind_vars = {
+        "@col": result_collection,
+        "batch_size": batch_size,
+        "metadata": metadata,
+        **filter_vars,
+    }
 
     # Update in batches
     updated_count = 0
-    offset = 0
+    last_key = None  # null sorts before every key
 
     while True:
-        query = f"""
-        FOR r IN {result_collection}
-          {filter_clause}
-          LIMIT {offset}, {batch_size}
-          RETURN r._key
-        """
+        keys = list(
+            db.aql.execute(query, bind_vars={**bind_vars, "last_key": last_key})
+        )
+        updated_count += len(keys)
 
-        keys = list(db.aql.execute(query))
-        if not keys:
+        # A short batch means the filter is exhausted
+        if len(keys) < batch_size:
             break
-
-        # Update batch
-        for key in keys:
-            doc = coll.get(key)
-            if doc:
-                doc.update(metadata)
-                coll.update(doc)
-
-        updated_count += len(keys)
-        offset += batch_size
+        last_key = keys[-1]
 
     return updated_count
 
@@ -417,6 +528,11 @@ def copy_results(
     """
     Copy results from one collection to another with optional filtering/transformation.
 
+    Each batch is inserted server-side by a single AQL INSERT that only
+    returns the copied source keys, so documents never travel to the
+    client. Batches are paged by source _key, so each one seeks straight to
+    where the previous batch ended.
+
     Args:
         db: ArangoDB database connection
         source_collection: Source result collection name
@@ -432,32 +548,40 @@ def copy_results(
     if not db.has_collection(target_collection):
         db.create_collection(target_collection)
 
-    target_coll = db.collection(target_collection)
-
-    filter_clause = f"FILTER {filter_query}" if filter_query else ""
+    filter_clause, filter_vars = _filter_clause(filter_query, "filter")
     transform_clause = transform if transform else "r"
 
+    # Every batch reuses the same query text; only the last key changes
+    query = f"""
+    FOR r IN @@col
+      FILTER r._key > @last_key
+      {filter_clause}
+      SORT r._key
+      LIMIT @batch_size
+      INSERT {transform_clause} INTO @@target
+      RETURN r._key
+    """
+    bind_vars = {
+        "@col": source_collection,
+        "@target": target_collection,
+        "batch_size": batch_size,
+        **filter_vars,
+    }
+
     # Copy in batches
     copied_count = 0
-    offset = 0
+    last_key = None  # null sorts before every key
 
     while True:
-        query = f"""
-        FOR r IN {source_collection}
-          {filter_clause}
-          LIMIT {offset}, {batch_size}
-          RETURN {transform_clause}
-        """
+        keys = list(
+            db.aql.execute(query, bind_vars={**bind_vars, "last_key": last_key})
+        )
+        copied_count += len(keys)
 
-        batch = list(db.aql.execute(query))
-        if not batch:
+        # A short batch means the filter is exhausted
+        if len(keys) < batch_size:
             break
-
-        # Insert batch
-        target_coll.import_bulk(batch)
-
-        copied_count += len(batch)
-        offset += batch_size
+        last_key = keys[-1]
 
     return copied_count
 
@@ -471,6 +595,10 @@ def delete_results_by_filter(
     """
     Delete results matching a filter query.
 
+    Each batch is removed server-side by a single AQL REMOVE that only
+    returns the removed keys. Batches are paged by _key, so documents the
+    filter rejects are scanned once rather than once per batch.
+
     Args:
         db: ArangoDB database connection
         result_collection: Result collection name
@@ -480,28 +608,36 @@ def delete_results_by_filter(
     Returns:
         Number of documents deleted
     """
-    coll = db.collection(result_collection)
+    filter_clause, filter_vars = _filter_clause(filter_query, "filter")
+
+    # Every batch reuses the same query text; only the last key changes
+    query = f"""
+    FOR r IN @@col
+      FILTER r._key > @last_key
+      {filter_clause}
+      SORT r._key
+      LIMIT @batch_size
+      REMOVE r._key IN @@col OPTIONS {{ ignoreRevs: true }}
+      RETURN r._key
+    """
+    bind_vars = {
+        "@col": result_collection,
+        "batch_size": batch_size,
+        **filter_vars,
+    }
 
     deleted_count = 0
-    offset = 0
+    last_key = None  # null sorts before every key
 
     while True:
-        query = f"""
-        FOR r IN {result_collection}
-          FILTER {filter_query}
-          LIMIT {offset}, {batch_size}
-          RETURN r._key
-        """
+        keys = list(
+            db.aql.execute(query, bind_vars={**bind_vars, "last_key": last_key})
+        )
+        deleted_count += len(keys)
 
-        keys = list(db.aql.execute(query))
-        if not keys:
+        # A short batch means the filter is exhausted
+        if len(keys) < batch_size:
             break
-
-        # Delete batch
-        for key in keys:
-            coll.delete(key)
-
-        deleted_count += len(keys)
-        offset += batch_size
+        last_key = keys[-1]
 
     return deleted_count
@@ -5,7 +5,12 @@ Based on lessons learned from real-world customer deployment issues.
 """
 
 import os
+import re
 from typing import Dict, List, Tuple, Optional
+from urllib.parse import urlsplit
+
+# A password wrapped in matching quotes (often copied from documentation)
+_QUOTED_RE = re.compile(r"^(['\"])(.*\1)?$", re.DOTALL)
 
 
 def validate_endpoint_format(endpoint: str) -> Tuple[bool, Optional[str]]:
@@ -21,41 +26,35 @@ def validate_endpoint_format(endpoint: str) -> Tuple[bool, Optional[str]]:
     if not endpoint:
         return False, "Endpoint is empty"
 
+    try:
+        parts = urlsplit(endpoint)
+    except ValueError as e:
+        return False, f"Invalid endpoint format: {e}"
+
     # Check for protocol
-    if not endpoint.startswith(("http://", "https://")):
+    if parts.scheme not in ("http", "https") or not parts.netloc:
         return False, "Endpoint must start with http:// or https://"
 
-    # Extract hostname part
-    try:
-        parts = endpoint.split("://", 1)
-        if len(parts) != 2:
-            return False, "Invalid endpoint format"
-
-        host_part = parts[1].split("/", 1)[0]
-
-        # Check for port
-        if ":" not in host_part:
-            return False, (
-                f"Endpoint is missing port number.\n"
-                f"  Current: {endpoint}\n"
-                f"  Should be: {endpoint}:8529\n"
-                f"  This is the #1 cause of 401 errors!"
-            )
-
-        # Check port is 8529 (ArangoDB default)
-        host, port = host_part.rsplit(":", 1)
-        if port != "8529":
-            return False, (
-                f"Endpoint has non-standard port: {port}\n"
-                f"  ArangoDB typically uses port 8529\n"
-                f"  Current: {endpoint}\n"
-                f"  Expected: {parts[0]}://{host}:8529"
-            )
-
-        return True, None
+    # Check for port (a colon inside IPv6 brackets isn't a port separator)
+    host, sep, port = parts.netloc.rpartition(":")
+    if not sep or "]" in port:
+        return False, (
+            f"Endpoint is missing port number.\n"
+            f"  Current: {endpoint}\n"
+            f"  Should be: {endpoint}:8529\n"
+            f"  This is the #1 cause of 401 errors!"
+        )
 
-    except Exception as e:
-        return False, f"Error parsing endpoint: {e}"
+    # Check port is 8529 (ArangoDB default)
+    if port != "8529":
+        return False, (
+            f"Endpoint has non-standard port: {port}\n"
+            f"  ArangoDB typically uses port 8529\n"
+            f"  Current: {endpoint}\n"
+            f"  Expected: {parts.scheme}://{host}:8529"
+        )
+
+    return True, None
 
 
 def check_password_format(password: str) -> Tuple[bool, List[str]]:
@@ -83,11 +82,12 @@ def check_password_format(password: str) -> Tuple[bool, List[str]]:
         issues.append("Password has trailing space(s)")
 
     # Check for quotes (sometimes copied from documentation)
-    if password.startswith('"') and password.endswith('"'):
-        issues.append("Password appears to be wrapped in quotes")
-
-    if password.startswith("'") and password.endswith("'"):
-        issues.append("Password appears to be wrapped in single quotes")
+    quoted = _QUOTED_RE.match(password)
+    if quoted:
+        if quoted.group(1) == '"':
+            issues.append("Password appears to be wrapped in quotes")
+        else:
+            issues.append("Password appears to be wrapped in single quotes")
 
     return len(issues) == 0, issues
 
@@ -26,6 +26,15 @@ setup(
         "python-dotenv>=0.19.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.6.0",
+        ],
+        "pandas": [
+            "pandas>=1.3.0",
+        ],
+        "arrow": [
+            "pyarrow>=14.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -2,8 +2,93 @@
 
 import os
 import pytest
+from collections import Counter
 from unittest.mock import patch, MagicMock
 
+from graph_analytics_orchestrator.config import clear_config_cache
+from graph_analytics_orchestrator.db_connection import clear_db_connection_cache
+
+
+class StubAQL:
+    """AQL API stand-in returning canned results and recording each call."""
+
+    def __init__(self, results=()):
+        self.results = results
+        self.calls = []
+
+    def execute(self, query, **kwargs):
+        self.calls.append((query, kwargs))
+        return self.results
+
+    @property
+    def last_query(self):
+        return self.calls[-1][0]
+
+    @property
+    def last_kwargs(self):
+        return self.calls[-1][1]
+
+
+class StubDB:
+    """
+    Lightweight StandardDatabase stand-in.
+
+    Plain attributes instead of MagicMock's synthesized children: results
+    are returned by aql.execute(), and ``error`` (if set) is raised by the
+    version() and properties() connection probes.
+    """
+
+    def __init__(self, results=(), databases=("_system", "testdb"), error=None):
+        self.aql = StubAQL(results)
+        self.error = error
+        self.calls = Counter()
+        self._databases = list(databases)
+
+    def _probe(self, name):
+        self.calls[name] += 1
+        if self.error is not None:
+            raise self.error
+
+    def version(self):
+        self._probe("version")
+        return {"version": "3.10.0"}
+
+    def properties(self):
+        self._probe("properties")
+        return {"name": "testdb"}
+
+    def databases(self):
+        self.calls["databases"] += 1
+        return self._databases
+
+
+class StubArangoClient:
+    """ArangoClient stand-in handing out one StubDB for every database."""
+
+    def __init__(self, db):
+        self._db = db
+        self.opened = []
+
+    def db(self, name, **kwargs):
+        self.opened.append(name)
+        return self._db
+
+
+@pytest.fixture(autouse=True)
+def reset_db_connection_cache():
+    """Ensure cached database connections never leak between tests."""
+    clear_db_connection_cache()
+    yield
+    clear_db_connection_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_config_cache():
+    """Ensure cached configs never leak between tests."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
 
 @pytest.fixture
 def mock_env_amp():
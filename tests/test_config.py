@@ -9,11 +9,16 @@ from graph_analytics_orchestrator.config import (
     GAEConfig,
     DeploymentMode,
     get_arango_config,
+    get_default_database,
     get_gae_config,
+    parse_bool,
     parse_ssl_verify,
     _extract_deployment_url,
     get_required_env,
     validate_required_env_vars,
+    load_env_vars,
+    get_project_root,
+    clear_config_cache,
 )
 
 
@@ -66,6 +71,42 @@ class TestArangoConfig:
 
         assert result["password"] == "testpass"
 
+    def test_skip_db_listing_env_override(self, mock_env_amp):
+        """Test ARANGO_SKIP_DB_LISTING defaults to true and can be disabled."""
+        assert ArangoConfig().skip_db_listing is True
+
+        with patch.dict(os.environ, {"ARANGO_SKIP_DB_LISTING": "false"}):
+            assert ArangoConfig().to_dict()["skip_db_listing"] is False
+
+    def test_parsed_config_cached_until_env_changes(self, mock_env_amp):
+        """Test configs are re-parsed only when their variables change."""
+        # Each parse reads the three required variables
+        with patch(
+            "graph_analytics_orchestrator.config.get_required_env",
+            wraps=get_required_env,
+        ) as required_env:
+            first = ArangoConfig()
+            second = ArangoConfig()
+            assert required_env.call_count == 3
+            assert second is not first
+            assert second.to_dict(mask_secrets=False) == first.to_dict(
+                mask_secrets=False
+            )
+
+            with patch.dict(os.environ, {"ARANGO_DATABASE": "otherdb"}):
+                assert ArangoConfig().database == "otherdb"
+            assert required_env.call_count == 6
+
+            clear_config_cache()
+            ArangoConfig()
+            assert required_env.call_count == 9
+
+    def test_cached_config_still_warns_without_ssl(self, mock_env_self_managed):
+        """Test the insecure SSL warning is raised on every construction."""
+        ArangoConfig()
+        with pytest.warns(UserWarning, match="SSL verification is disabled"):
+            ArangoConfig()
+
 
 class TestGAEConfig:
     """Tests for GAEConfig class."""
@@ -146,6 +187,22 @@ class TestHelperFunctions:
         url = _extract_deployment_url("https://test.arangodb.cloud:8529/path")
         assert url == "https://test.arangodb.cloud"
 
+    def test_extract_deployment_url_ipv6(self):
+        """Test extracting deployment URL from an IPv6 endpoint."""
+        url = _extract_deployment_url("https://[::1]:8529")
+        assert url == "https://[::1]"
+
+    def test_parse_bool(self):
+        """Test parse_bool() reads flag strings and passes booleans through."""
+        assert parse_bool("true") is True
+        assert parse_bool("Yes") is True
+        assert parse_bool("1") is True
+        assert parse_bool("false") is False
+        assert parse_bool("off") is False
+        assert parse_bool("") is False
+        assert parse_bool(True) is True
+        assert parse_bool(False) is False
+
     def test_parse_ssl_verify_true(self):
         """Test parsing SSL verify as True."""
         assert parse_ssl_verify("true") is True
@@ -217,6 +274,13 @@ class TestHelperFunctions:
         config_masked = get_arango_config(mask_secrets=True)
         assert config_masked["password"] == "***MASKED***"
 
+    def test_get_default_database(self, mock_env_amp):
+        """Test get_default_database follows ARANGO_DATABASE."""
+        assert get_default_database() == "testdb"
+
+        with patch.dict(os.environ, {"ARANGO_DATABASE": "otherdb"}):
+            assert get_default_database() == "otherdb"
+
     def test_get_gae_config(self, mock_env_amp):
         """Test get_gae_config function returns unmasked values for internal use."""
         config = get_gae_config()
@@ -228,6 +292,30 @@ class TestHelperFunctions:
         assert len(config["api_key_id"]) > 0
         assert len(config["api_key_secret"]) > 0
 
+    def test_load_env_vars_runs_once(self, mock_env_amp):
+        """Test that env resolution is cached after the first call."""
+        with patch("graph_analytics_orchestrator.config._env_loaded", False), patch(
+            "graph_analytics_orchestrator.config.load_dotenv"
+        ) as mock_load_dotenv:
+            os.environ.pop("ARANGO_DATABASE")
+            load_env_vars()
+            calls_after_first = mock_load_dotenv.call_count
+            assert calls_after_first >= 1
+
+            load_env_vars()
+            assert mock_load_dotenv.call_count == calls_after_first
+
+            load_env_vars(force=True)
+            assert mock_load_dotenv.call_count > calls_after_first
+
+    def test_get_project_root_finds_setup_py(self):
+        """Test that the project root is the directory containing setup.py."""
+        get_project_root.cache_clear()
+        root = get_project_root()
+
+        assert (root / "setup.py").exists() or (root / ".env").exists()
+        assert get_project_root() is root  # Cached
+
     @pytest.mark.skip(reason="Permission error in sandbox environment")
     def test_load_env_vars_prioritizes_cwd(self, tmp_path, monkeypatch):
         """Test that .env in current working directory is loaded first."""
@@ -241,8 +329,8 @@ class TestHelperFunctions:
         # Change to temp directory
         monkeypatch.chdir(tmp_path)
 
-        # Load env vars
-        load_env_vars()
+        # Load env vars (force: resolution is cached per process)
+        load_env_vars(force=True)
 
         # Verify it loaded from CWD
         assert os.getenv("TEST_VAR") == "from_cwd"
@@ -6,6 +6,8 @@ import csv
 from unittest.mock import MagicMock, mock_open, patch
 from pathlib import Path
 
+from .conftest import StubDB
+
 from graph_analytics_orchestrator.export import (
     export_results_to_csv,
     export_results_to_json,
@@ -15,30 +17,25 @@ from graph_analytics_orchestrator.export import (
 class TestExportResultsToCSV:
     """Tests for export_results_to_csv function."""
 
-    def test_export_csv_success(self):
+    def test_export_csv_success(self, tmp_path):
         """Test successful CSV export."""
-        mock_db = MagicMock()
-
-        # Mock query results
         mock_results = [
             {"id": "nodes/1", "pagerank_influence": 0.5},
             {"id": "nodes/2", "pagerank_influence": 0.3},
         ]
-        mock_db.aql.execute.return_value = mock_results
+        mock_db = StubDB(mock_results)
 
-        output_path = Path("/tmp/test_output.csv")
+        output_path = tmp_path / "test_output.csv"
 
-        with patch("builtins.open", mock_open()) as mock_file:
-            result = export_results_to_csv(mock_db, "pagerank_results", output_path)
+        result = export_results_to_csv(mock_db, "pagerank_results", output_path)
 
         assert result == 2
-        mock_db.aql.execute.assert_called_once()
-        mock_file.assert_called_once()
+        assert len(mock_db.aql.calls) == 1
+        assert output_path.exists()
 
     def test_export_csv_with_custom_query(self):
         """Test CSV export with custom query."""
-        mock_db = MagicMock()
-        mock_db.aql.execute.return_value = []
+        mock_db = StubDB([])
 
         output_path = Path("/tmp/test_output.csv")
 
@@ -51,13 +48,12 @@ class TestExportResultsToCSV:
             )
 
         # Verify custom query was used
-        call_args = mock_db.aql.execute.call_args[0][0]
-        assert "FILTER r.value > 0.5" in call_args
+        executed_query = mock_db.aql.last_query
+        assert "FILTER r.value > 0.5" in executed_query
 
     def test_export_csv_with_vertex_join(self):
         """Test CSV export with vertex join."""
-        mock_db = MagicMock()
-        mock_db.aql.execute.return_value = []
+        mock_db = StubDB([])
 
         output_path = Path("/tmp/test_output.csv")
 
@@ -70,14 +66,45 @@ class TestExportResultsToCSV:
                 vertex_fields=["full_name"],
             )
 
-        executed_query = mock_db.aql.execute.call_args[0][0]
+        executed_query = mock_db.aql.last_query
         assert "LET person = DOCUMENT(r.id)" in executed_query
         assert "full_name: person.full_name" in executed_query
 
+    def test_export_csv_projects_fields_server_side(self):
+        """Test CSV export pushes field projection and collection into AQL."""
+        mock_db = StubDB([])
+
+        export_results_to_csv(
+            mock_db,
+            "pagerank_results",
+            Path("/tmp/test_output.csv"),
+            fields=["id", "pagerank_influence"],
+        )
+
+        executed_query = mock_db.aql.last_query
+        assert executed_query == (
+            "FOR r IN @@col RETURN { id: r.id, pagerank_influence: r.pagerank_influence }"
+        )
+        bind_vars = mock_db.aql.last_kwargs["bind_vars"]
+        assert bind_vars == {"@col": "pagerank_results"}
+
+    def test_export_csv_rejects_invalid_field_names(self):
+        """Test CSV export refuses field names that could inject AQL."""
+        mock_db = StubDB()
+
+        with pytest.raises(ValueError, match="Invalid field name"):
+            export_results_to_csv(
+                mock_db,
+                "pagerank_results",
+                Path("/tmp/test_output.csv"),
+                fields=["id } REMOVE r IN pagerank_results RETURN {"],
+            )
+
+        assert mock_db.aql.calls == []
+
     def test_export_csv_no_results(self):
         """Test CSV export when no results."""
-        mock_db = MagicMock()
-        mock_db.aql.execute.return_value = []
+        mock_db = StubDB([])
 
         output_path = Path("/tmp/test_output.csv")
 
@@ -85,26 +112,53 @@ class TestExportResultsToCSV:
 
         assert result == 0
 
-    def test_export_csv_no_headers(self):
+    def test_export_csv_no_headers(self, tmp_path):
         """Test CSV export without headers."""
-        mock_db = MagicMock()
         mock_results = [{"id": "nodes/1", "value": 0.5}]
-        mock_db.aql.execute.return_value = mock_results
+        mock_db = StubDB(mock_results)
 
-        output_path = Path("/tmp/test_output.csv")
+        output_path = tmp_path / "test_output.csv"
 
-        with patch("builtins.open", mock_open()) as mock_file:
-            export_results_to_csv(
-                mock_db, "pagerank_results", output_path, include_headers=False
-            )
+        export_results_to_csv(
+            mock_db, "pagerank_results", output_path, include_headers=False
+        )
+
+        # Only the data row is written
+        with open(output_path, newline="") as f:
+            assert list(csv.reader(f)) == [["nodes/1", "0.5"]]
 
-        # Verify file was opened for writing
-        mock_file.assert_called_once()
+    def test_export_csv_streams_cursor(self, tmp_path):
+        """Test CSV export consumes the cursor lazily with streaming enabled."""
+        mock_db = StubDB(({"id": f"nodes/{i}", "value": i} for i in range(3)))
+
+        output_path = tmp_path / "out.csv"
+        result = export_results_to_csv(mock_db, "pagerank_results", output_path)
+
+        assert result == 3
+        assert mock_db.aql.last_kwargs["stream"] is True
+        with open(output_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [r["id"] for r in rows] == ["nodes/0", "nodes/1", "nodes/2"]
+
+    def test_export_csv_scalar_rows(self, tmp_path):
+        """Test scalar query results become single-column rows, no header."""
+        mock_db = StubDB(iter(["nodes/1", "nodes/22"]))
+        output_path = tmp_path / "out.csv"
+
+        result = export_results_to_csv(
+            mock_db,
+            "pagerank_results",
+            output_path,
+            query="FOR r IN pagerank_results RETURN r.id",
+        )
+
+        assert result == 2
+        with open(output_path, newline="") as f:
+            assert list(csv.reader(f)) == [["nodes/1"], ["nodes/22"]]
 
     def test_export_csv_write_error(self):
         """Test CSV export with write error."""
-        mock_db = MagicMock()
-        mock_db.aql.execute.return_value = [{"id": "nodes/1"}]
+        mock_db = StubDB([{"id": "nodes/1"}])
 
         output_path = Path("/tmp/test_output.csv")
 
@@ -116,63 +170,87 @@ class TestExportResultsToCSV:
 class TestExportResultsToJSON:
     """Tests for export_results_to_json function."""
 
-    def test_export_json_success(self):
+    def test_export_json_success(self, tmp_path):
         """Test successful JSON export."""
-        mock_db = MagicMock()
-
         mock_results = [
             {"id": "nodes/1", "pagerank_influence": 0.5},
             {"id": "nodes/2", "pagerank_influence": 0.3},
         ]
-        mock_db.aql.execute.return_value = mock_results
+        mock_db = StubDB(mock_results)
 
-        output_path = Path("/tmp/test_output.json")
+        output_path = tmp_path / "test_output.json"
 
-        with patch("builtins.open", mock_open()) as mock_file:
-            result = export_results_to_json(mock_db, "pagerank_results", output_path)
+        result = export_results_to_json(mock_db, "pagerank_results", output_path)
 
         assert result == 2
-        mock_db.aql.execute.assert_called_once()
-        mock_file.assert_called_once()
+        assert len(mock_db.aql.calls) == 1
+        assert output_path.exists()
 
-    def test_export_json_pretty_print(self):
+    def test_export_json_pretty_print(self, tmp_path):
         """Test JSON export with pretty printing."""
-        mock_db = MagicMock()
-        mock_db.aql.execute.return_value = [{"id": "nodes/1"}]
+        mock_db = StubDB([{"id": "nodes/1", "score": {"value": 0.5}}])
+        output_path = tmp_path / "test_output.json"
 
-        output_path = Path("/tmp/test_output.json")
-
-        with patch("builtins.open", mock_open()) as mock_file:
-            with patch("json.dump") as mock_json_dump:
-                export_results_to_json(
-                    mock_db, "pagerank_results", output_path, pretty=True
-                )
+        with patch("graph_analytics_orchestrator.export.orjson", None):
+            export_results_to_json(
+                mock_db, "pagerank_results", output_path, pretty=True
+            )
 
-        # Verify json.dump was called with indent=2
-        call_args = mock_json_dump.call_args
-        assert call_args[1]["indent"] == 2
+        # Documents are written with indent=2
+        text = output_path.read_text(encoding="utf-8")
+        assert '\n  "id": "nodes/1"' in text
+        assert '\n    "value": 0.5' in text
+        assert json.loads(text) == [{"id": "nodes/1", "score": {"value": 0.5}}]
 
-    def test_export_json_no_pretty_print(self):
+    def test_export_json_no_pretty_print(self, tmp_path):
         """Test JSON export without pretty printing."""
-        mock_db = MagicMock()
-        mock_db.aql.execute.return_value = [{"id": "nodes/1"}]
+        mock_db = StubDB([{"id": "nodes/1", "score": {"value": 0.5}}])
+        output_path = tmp_path / "test_output.json"
 
-        output_path = Path("/tmp/test_output.json")
+        with patch("graph_analytics_orchestrator.export.orjson", None):
+            export_results_to_json(
+                mock_db,
+                "pagerank_results",
+                output_path,
+                query="FOR r IN pagerank_results RETURN r",
+                pretty=False,
+            )
+
+        # Documents are written on one line each, without indentation
+        text = output_path.read_text(encoding="utf-8")
+        assert text == '[{"id": "nodes/1", "score": {"value": 0.5}}]'
+
+    def test_export_json_uses_orjson_when_available(self):
+        """Test JSON export prefers orjson and passes the indent option."""
+        mock_db = StubDB([{"id": "nodes/1"}])
+
+        mock_orjson = MagicMock()
+        mock_orjson.OPT_INDENT_2 = 1
+        mock_orjson.OPT_NON_STR_KEYS = 4
+        mock_orjson.dumps.return_value = b"{}"
 
         with patch("builtins.open", mock_open()):
-            with patch("json.dump") as mock_json_dump:
+            with patch("graph_analytics_orchestrator.export.orjson", mock_orjson):
                 export_results_to_json(
-                    mock_db, "pagerank_results", output_path, pretty=False
+                    mock_db, "pagerank_results", Path("/tmp/out.json"), pretty=True
                 )
 
-        # Verify json.dump was called with indent=None
-        call_args = mock_json_dump.call_args
-        assert call_args[1]["indent"] is None
+        assert mock_orjson.dumps.call_args[1]["option"] == 5
+
+    def test_export_json_pretty_accepts_non_string_keys(self, tmp_path):
+        """Test pretty JSON export coerces non-string keys like stdlib json."""
+        mock_db = StubDB([{"id": "nodes/1", "hist": {1: 2}}])
+        output_path = tmp_path / "out.json"
+
+        export_results_to_json(mock_db, "pagerank_results", output_path, pretty=True)
+
+        with open(output_path, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data == [{"id": "nodes/1", "hist": {"1": 2}}]
 
     def test_export_json_with_vertex_join(self):
         """Test JSON export with vertex join."""
-        mock_db = MagicMock()
-        mock_db.aql.execute.return_value = []
+        mock_db = StubDB([])
 
         output_path = Path("/tmp/test_output.json")
 
@@ -185,13 +263,30 @@ class TestExportResultsToJSON:
                 vertex_fields=["full_name"],
             )
 
-        executed_query = mock_db.aql.execute.call_args[0][0]
+        executed_query = mock_db.aql.last_query
         assert "LET person = DOCUMENT(r.id)" in executed_query
 
+    def test_export_json_projects_fields_with_vertex_join(self):
+        """Test JSON export projects result and vertex fields explicitly."""
+        mock_db = StubDB([])
+
+        export_results_to_json(
+            mock_db,
+            "pagerank_results",
+            Path("/tmp/test_output.json"),
+            join_vertex=True,
+            vertex_fields=["profile.name"],
+            fields=["pagerank_influence"],
+        )
+
+        executed_query = mock_db.aql.last_query
+        assert "pagerank_influence: r.pagerank_influence" in executed_query
+        assert "name: person.profile.name" in executed_query
+        assert "result: r" not in executed_query
+
     def test_export_json_no_results(self):
         """Test JSON export when no results."""
-        mock_db = MagicMock()
-        mock_db.aql.execute.return_value = []
+        mock_db = StubDB([])
 
         output_path = Path("/tmp/test_output.json")
 
@@ -201,8 +296,7 @@ class TestExportResultsToJSON:
 
     def test_export_json_write_error(self):
         """Test JSON export with write error."""
-        mock_db = MagicMock()
-        mock_db.aql.execute.return_value = [{"id": "nodes/1"}]
+        mock_db = StubDB([{"id": "nodes/1"}])
 
         output_path = Path("/tmp/test_output.json")
 
@@ -210,10 +304,73 @@ class TestExportResultsToJSON:
             with pytest.raises(IOError):
                 export_results_to_json(mock_db, "pagerank_results", output_path)
 
+    def test_export_json_streams_cursor(self, tmp_path):
+        """Test JSON export writes a valid array from a streaming cursor."""
+        mock_db = StubDB(iter([{"id": "nodes/1", "name": "Zoë"}, {"id": "nodes/2"}]))
+        output_path = tmp_path / "out.json"
+
+        result = export_results_to_json(
+            mock_db, "pagerank_results", output_path, pretty=True
+        )
+
+        assert result == 2
+        with open(output_path, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data == [{"id": "nodes/1", "name": "Zoë"}, {"id": "nodes/2"}]
+
+    def test_export_json_compact_writes_server_serialized_rows(self, tmp_path):
+        """Test compact JSON export writes JSON_STRINGIFY rows through as-is."""
+        mock_db = StubDB(iter(['{"id":"nodes/1","name":"Zoë"}', '{"id":"nodes/2"}']))
+        output_path = tmp_path / "out.json"
+
+        result = export_results_to_json(
+            mock_db, "pagerank_results", output_path, pretty=False
+        )
+
+        assert result == 2
+        executed_query = mock_db.aql.last_query
+        assert executed_query == "FOR r IN @@col RETURN JSON_STRINGIFY(r)"
+        with open(output_path, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data == [{"id": "nodes/1", "name": "Zoë"}, {"id": "nodes/2"}]
+
+    def test_export_json_ndjson_format(self, tmp_path):
+        """Test NDJSON export writes one compact document per line."""
+        mock_db = StubDB(
+            iter([{"id": "nodes/1", "value": 0.5}, {"id": "nodes/2", "value": 0.3}])
+        )
+        output_path = tmp_path / "out.ndjson"
+
+        result = export_results_to_json(
+            mock_db,
+            "pagerank_results",
+            output_path,
+            query="FOR r IN pagerank_results RETURN r",
+            format="ndjson",
+        )
+
+        assert result == 2
+        with open(output_path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"id": "nodes/1", "value": 0.5},
+            {"id": "nodes/2", "value": 0.3},
+        ]
+
+    def test_export_json_rejects_unknown_format(self):
+        """Test JSON export rejects unsupported formats before querying."""
+        mock_db = StubDB()
+
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            export_results_to_json(
+                mock_db, "pagerank_results", Path("/tmp/out.json"), format="xml"
+            )
+
+        assert mock_db.aql.calls == []
+
     def test_export_json_custom_query(self):
         """Test JSON export with custom query."""
-        mock_db = MagicMock()
-        mock_db.aql.execute.return_value = []
+        mock_db = StubDB([])
 
         output_path = Path("/tmp/test_output.json")
 
@@ -226,5 +383,5 @@ class TestExportResultsToJSON:
             )
 
         # Verify custom query was used
-        call_args = mock_db.aql.execute.call_args[0][0]
-        assert "FILTER r.value > 0.5" in call_args
+        executed_query = mock_db.aql.last_query
+        assert "FILTER r.value > 0.5" in executed_query
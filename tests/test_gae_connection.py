@@ -1,5 +1,11 @@
 """Tests for GAE connection module."""
 
+import asyncio
+import base64
+import json
+import subprocess
+import warnings
+import requests
 import pytest
 from unittest.mock import patch, MagicMock, Mock
 from datetime import datetime, timedelta
@@ -12,6 +18,10 @@ from graph_analytics_orchestrator.gae_connection import (
     GAEConnectionBase,
 )
 from graph_analytics_orchestrator.config import DeploymentMode
+from graph_analytics_orchestrator.constants import (
+    DEFAULT_BATCH_CONCURRENCY,
+    GAE_HTTP_POOL_MAXSIZE,
+)
 
 
 class TestGAEManager:
@@ -96,6 +106,43 @@ class TestGAEManager:
         with pytest.raises(ValueError, match="invalid characters"):
             GAEManager()
 
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    @patch("graph_analytics_orchestrator.gae_connection.subprocess.run")
+    def test_refresh_token_invalid_secret_chars(self, mock_subprocess, mock_get_config):
+        """Test token refresh rejects shell metacharacters in the secret."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key",
+            "api_key_secret": "secret$(whoami)",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "",
+        }
+
+        with pytest.raises(ValueError, match="secret contains invalid characters"):
+            GAEManager()
+        mock_subprocess.assert_not_called()
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    @patch("graph_analytics_orchestrator.gae_connection.subprocess.run")
+    def test_refresh_token_timeout(self, mock_subprocess, mock_get_config):
+        """Test a hung oasisctl is bounded and reported as RuntimeError."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key-id",
+            "api_key_secret": "test-key-secret",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "",
+        }
+        mock_subprocess.side_effect = subprocess.TimeoutExpired("oasisctl", 30)
+
+        with pytest.raises(RuntimeError, match="did not return a token"):
+            GAEManager()
+        kwargs = mock_subprocess.call_args.kwargs
+        assert kwargs["stdin"] is subprocess.DEVNULL
+        assert kwargs["timeout"] == 30
+
     @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
     def test_is_token_expired(self, mock_get_config, mock_env_amp):
         """Test token expiration check."""
@@ -118,6 +165,291 @@ class TestGAEManager:
         manager.token_created_at = datetime.now() - timedelta(hours=25)
         assert manager._is_token_expired() is True
 
+        # Expiry follows the monotonic clock, not wall-clock adjustments
+        manager.token_created_at = datetime.now()
+        with patch(
+            "graph_analytics_orchestrator.gae_connection.time.monotonic",
+            return_value=time.monotonic() + 23 * 3600,
+        ):
+            assert manager._is_token_expired() is True
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    def test_requests_reuse_session(self, mock_get_config, mock_env_amp):
+        """Test API calls go through one keep-alive session."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key-id",
+            "api_key_secret": "test-key-secret",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "test-token",
+        }
+        manager = GAEManager(timeout=15)
+
+        mock_response = MagicMock()
+        mock_response.content = b'{"items": []}'
+        with patch.object(
+            manager._session, "request", return_value=mock_response
+        ) as request:
+            manager.list_engines()
+            manager.list_engine_sizes()
+
+        assert request.call_count == 2
+        assert all(call.args[0] == "GET" for call in request.call_args_list)
+        assert all(call.kwargs["timeout"] == 15 for call in request.call_args_list)
+
+        # A per-workflow override applies inside the block only
+        with patch.object(
+            manager._session, "request", return_value=mock_response
+        ) as request:
+            with manager.request_timeout(5):
+                manager.list_engines()
+            manager.list_engines()
+
+        assert [call.kwargs["timeout"] for call in request.call_args_list] == [5, 15]
+        assert manager.timeout == 15
+        adapter = manager._session.get_adapter("https://test.arangodb.cloud")
+        assert adapter._pool_maxsize == GAE_HTTP_POOL_MAXSIZE
+        assert adapter.max_retries.total > 0
+        assert "POST" not in adapter.max_retries.allowed_methods
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    def test_wait_for_engine_ready_backs_off(self, mock_get_config, mock_env_amp):
+        """Test engine readiness polling starts fast and backs off."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key-id",
+            "api_key_secret": "test-key-secret",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "test-token",
+        }
+        manager = GAEManager()
+        not_ready = {"status": {"is_started": False}}
+        ready = {"status": {"is_started": True, "succeeded": True}}
+        manager.get_engine = Mock(side_effect=[not_ready, not_ready, not_ready, ready])
+
+        with patch(
+            "graph_analytics_orchestrator.gae_connection.time.sleep"
+        ) as mock_sleep:
+            engine = manager._wait_for_engine_ready("engine-1")
+
+        assert engine == ready
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        assert delays[0] < 0.5
+        assert delays[0] < delays[1] < delays[2] <= 2.0 * 1.1
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    def test_headers_cached_until_token_changes(self, mock_get_config, mock_env_amp):
+        """Test request headers are reused and follow token refreshes."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key-id",
+            "api_key_secret": "test-key-secret",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "test-token",
+        }
+        manager = GAEManager()
+
+        headers = manager._management_headers()
+        assert headers is manager._engine_headers()
+        assert headers["Authorization"] == "bearer test-token"
+
+        manager.access_token = "new-token"
+        assert manager._management_headers() is headers
+        assert headers["Authorization"] == "bearer new-token"
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    def test_submit_all_runs_algorithms_concurrently(
+        self, mock_get_config, mock_env_amp
+    ):
+        """Test submit_all submits each algorithm and keeps the input order."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key-id",
+            "api_key_secret": "test-key-secret",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "test-token",
+        }
+        manager = GAEManager()
+        manager._request = Mock(
+            side_effect=lambda method, endpoint, **kwargs: {
+                "job_id": endpoint.rsplit("/", 1)[-1]
+            }
+        )
+
+        jobs = asyncio.run(manager.submit_all("graph-1"))
+
+        assert [job["id"] for job in jobs] == ["pagerank", "wcc", "scc"]
+        assert manager._request.call_count == 3
+
+        with pytest.raises(ValueError, match="Unsupported algorithm"):
+            asyncio.run(manager.submit_all("graph-1", algorithms=["bfs"]))
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    def test_get_jobs_preserves_order(self, mock_get_config, mock_env_amp):
+        """Test get_jobs fetches every job and returns them in input order."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key-id",
+            "api_key_secret": "test-key-secret",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "test-token",
+        }
+        manager = GAEManager()
+        manager.get_job = Mock(side_effect=lambda job_id: {"id": job_id})
+
+        jobs = manager.get_jobs(["a", "b", "c"])
+
+        assert [job["id"] for job in jobs] == ["a", "b", "c"]
+        assert manager.get_jobs([]) == []
+
+    def test_decode_json_falls_back_to_stdlib(self):
+        """Test response decoding works without orjson and on empty bodies."""
+        from graph_analytics_orchestrator.gae_connection import _decode_json
+
+        response = Mock(content=b'{"id": "job-1"}')
+        with patch("graph_analytics_orchestrator.gae_connection.orjson", None):
+            assert _decode_json(response) == {"id": "job-1"}
+        assert _decode_json(Mock(content=b"")) == {}
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    def test_progress_goes_to_logger_unless_verbose(
+        self, mock_get_config, mock_env_amp, capsys, caplog
+    ):
+        """Test progress messages are logged and only printed when verbose."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key-id",
+            "api_key_secret": "test-key-secret",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "test-token",
+        }
+        manager = GAEManager()
+        manager._request = Mock(return_value={"job_id": "job-1"})
+
+        with caplog.at_level("INFO", logger="graph_analytics_orchestrator"):
+            manager.run_wcc("graph-1")
+        assert "Running WCC on graph graph-1" in caplog.text
+        assert capsys.readouterr().out == ""
+
+        manager.verbose = True
+        manager.run_wcc("graph-1")
+        assert "Running WCC on graph graph-1" in capsys.readouterr().out
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    def test_engine_sizes_cached(self, mock_get_config, mock_env_amp):
+        """Test engine sizes are fetched once within the cache TTL."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key-id",
+            "api_key_secret": "test-key-secret",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "test-token",
+        }
+        manager = GAEManager()
+        manager._request_mgmt = Mock(return_value={"items": [{"id": "e8"}]})
+
+        assert manager.list_engine_sizes() == [{"id": "e8"}]
+        assert manager.list_engine_sizes() == [{"id": "e8"}]
+        assert manager._request_mgmt.call_count == 1
+
+        manager._response_cache.clear()
+        manager.list_engine_sizes()
+        assert manager._request_mgmt.call_count == 2
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    def test_requests_route_to_management_or_engine_api(
+        self, mock_get_config, mock_env_amp
+    ):
+        """Test management and engine calls are sent to their own base URLs."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key-id",
+            "api_key_secret": "test-key-secret",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "test-token",
+        }
+        manager = GAEManager()
+        manager.current_engine_url = "https://engine.test"
+        manager._call = Mock(return_value={})
+
+        manager.get_engine("engine-1")
+        manager.get_job("job-1")
+
+        urls = [c[0][1] for c in manager._call.call_args_list]
+        assert urls == [
+            f"{manager.base_url}/engines/engine-1",
+            "https://engine.test/v1/jobs/job-1",
+        ]
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    def test_submit_batch_passes_parameters(self, mock_get_config, mock_env_amp):
+        """Test submit_batch submits each job with its own parameters."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key-id",
+            "api_key_secret": "test-key-secret",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "test-token",
+        }
+        manager = GAEManager()
+        manager._request = Mock(
+            side_effect=lambda method, endpoint, payload=None, **kwargs: {
+                "job_id": endpoint.rsplit("/", 1)[-1],
+                "payload": payload,
+            }
+        )
+
+        jobs = manager.submit_batch(
+            "graph-1",
+            [{"algorithm": "pagerank", "damping_factor": 0.9}, {"algorithm": "wcc"}],
+        )
+
+        assert [job["id"] for job in jobs] == ["pagerank", "wcc"]
+        assert jobs[0]["payload"]["damping_factor"] == 0.9
+        with pytest.raises(ValueError, match="Unsupported algorithm"):
+            manager.submit_batch("graph-1", [{"algorithm": "bfs"}])
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_gae_config")
+    def test_pooled_requests_keep_request_timeout(self, mock_get_config, mock_env_amp):
+        """Test a request_timeout block reaches requests run on worker threads."""
+        mock_get_config.return_value = {
+            "deployment_mode": "amp",
+            "api_key_id": "test-key-id",
+            "api_key_secret": "test-key-secret",
+            "deployment_url": "https://test.arangodb.cloud",
+            "gae_port": "8829",
+            "access_token": "test-token",
+        }
+        manager = GAEManager(timeout=15)
+        manager._request = Mock(
+            side_effect=lambda method, endpoint, payload=None, **kwargs: {
+                "job_id": endpoint.rsplit("/", 1)[-1],
+                "timeout": manager._request_timeout(),
+            }
+        )
+        manager.get_job = Mock(side_effect=lambda job_id: manager._request_timeout())
+
+        with manager.request_timeout(5):
+            jobs = manager.submit_batch(
+                "graph-1", [{"algorithm": "pagerank"}, {"algorithm": "wcc"}]
+            )
+            timeouts = manager.get_jobs(["job-1", "job-2"])
+
+        assert [job["timeout"] for job in jobs] == [5, 5]
+        assert timeouts == [5, 5]
+        # Outside the block the workers use the connection default again
+        assert manager.get_jobs(["job-1", "job-2"]) == [15, 15]
+
 
 class TestGenAIGAEConnection:
     """Tests for GenAIGAEConnection class."""
@@ -138,6 +470,10 @@ class TestGenAIGAEConnection:
         assert connection.db_endpoint == "https://test.local:8529"
         assert connection.db_name == "testdb"
         assert connection.db_user == "root"
+        # Keep-alive pool large enough for a default-size parallel batch
+        adapter = connection._session.get_adapter("https://test.local:8529")
+        assert adapter._pool_maxsize == GAE_HTTP_POOL_MAXSIZE
+        assert GAE_HTTP_POOL_MAXSIZE >= DEFAULT_BATCH_CONCURRENCY
 
     @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
     def test_init_missing_credentials(self, mock_get_config):
@@ -154,7 +490,7 @@ class TestGenAIGAEConnection:
             GenAIGAEConnection()
 
     @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
-    @patch("graph_analytics_orchestrator.gae_connection.requests.post")
+    @patch("graph_analytics_orchestrator.gae_connection.requests.Session.post")
     def test_get_jwt_token_success(
         self, mock_post, mock_get_config, mock_env_self_managed
     ):
@@ -168,7 +504,7 @@ class TestGenAIGAEConnection:
         mock_get_config.return_value = mock_config
 
         mock_response = MagicMock()
-        mock_response.json.return_value = {"jwt": "test-jwt-token"}
+        mock_response.content = b'{"jwt": "test-jwt-token"}'
         mock_response.raise_for_status = Mock()
         mock_post.return_value = mock_response
 
@@ -178,6 +514,145 @@ class TestGenAIGAEConnection:
         assert token == "test-jwt-token"
         assert connection.jwt_token == "test-jwt-token"
 
+    @pytest.mark.parametrize(
+        "endpoint,warns",
+        [
+            ("https://test.example.com:8529", False),
+            ("https://[::1]:8529/", False),
+            ("https://test.example.com", True),
+            ("https://test.example.com/db:8529", True),
+        ],
+    )
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_init_warns_when_port_missing(
+        self, mock_get_config, endpoint, warns, mock_env_self_managed
+    ):
+        """Test the missing-port warning only fires for endpoints without a port."""
+        mock_get_config.return_value = {
+            "endpoint": endpoint,
+            "user": "root",
+            "password": "test-password",
+            "database": "test_db",
+        }
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            GenAIGAEConnection()
+
+        port_warnings = [w for w in caught if "missing the port" in str(w.message)]
+        assert bool(port_warnings) is warns
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_get_jwt_token_401_logs_once(
+        self, mock_get_config, mock_env_self_managed, caplog
+    ):
+        """Test 401 troubleshooting hints are emitted as one log record."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.example.com",
+            "user": "root",
+            "password": "test-password",
+            "database": "test_db",
+        }
+        gae = GenAIGAEConnection()
+
+        unauthorized = Mock(status_code=401)
+        unauthorized.raise_for_status.side_effect = requests.HTTPError(
+            response=unauthorized
+        )
+
+        with patch.object(gae._session, "post", return_value=unauthorized):
+            with caplog.at_level(
+                "WARNING", logger="graph_analytics_orchestrator.gae_connection"
+            ):
+                with pytest.raises(requests.HTTPError):
+                    gae._get_jwt_token()
+
+        assert len(caplog.records) == 1
+        message = caplog.records[0].getMessage()
+        assert "Authentication failed (401 Unauthorized)" in message
+        assert "missing port :8529" in message
+        assert "Troubleshooting steps:" in message
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_get_headers_refreshes_stale_jwt(
+        self, mock_get_config, mock_env_self_managed
+    ):
+        """Test the JWT is re-fetched once it is older than the refresh window."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.example.com:8529",
+            "user": "root",
+            "password": "test-password",
+            "database": "test_db",
+        }
+        gae = GenAIGAEConnection()
+
+        def fetch_token():
+            gae.jwt_token = "fresh-jwt"
+            gae._jwt_created_at = datetime.now()
+            return gae.jwt_token
+
+        with patch.object(gae, "_get_jwt_token", side_effect=fetch_token) as mock_jwt:
+            gae.jwt_token = "old-jwt"
+            gae._jwt_created_at = datetime.now() - timedelta(minutes=5)
+            assert gae._get_headers()["Authorization"].endswith("old-jwt")
+            mock_jwt.assert_not_called()
+
+            gae._jwt_created_at = datetime.now() - timedelta(minutes=55)
+            assert gae._get_headers()["Authorization"].endswith("fresh-jwt")
+            mock_jwt.assert_called_once()
+
+    def test_full_jitter_delays_are_capped(self):
+        """Test backoff ceilings double per attempt and stop at the cap."""
+        from graph_analytics_orchestrator.gae_connection import _full_jitter_delays
+
+        with patch(
+            "graph_analytics_orchestrator.gae_connection.random.uniform",
+            side_effect=lambda low, high: high,
+        ):
+            delays = _full_jitter_delays(2, cap=30)
+            assert [next(delays) for _ in range(6)] == [2, 4, 8, 16, 30, 30]
+
+    def test_jwt_expiry_reads_exp_claim(self):
+        """Test the exp claim is decoded and malformed tokens are tolerated."""
+        from graph_analytics_orchestrator.gae_connection import _jwt_expiry
+
+        claims = base64.urlsafe_b64encode(b'{"exp": 1700000000}').rstrip(b"=")
+        token = "header." + claims.decode() + ".signature"
+
+        assert _jwt_expiry(token) == datetime.fromtimestamp(1700000000)
+        assert _jwt_expiry("not-a-jwt") is None
+        assert _jwt_expiry("a.!!!.c") is None
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_stop_engine_retries_after_401(
+        self, mock_get_config, mock_env_self_managed
+    ):
+        """Test a rejected JWT is replaced and the request retried once."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.example.com:8529",
+            "user": "root",
+            "password": "test-password",
+            "database": "test_db",
+        }
+        gae = GenAIGAEConnection()
+        gae.jwt_token = "revoked-jwt"
+
+        unauthorized = Mock(status_code=401)
+        unauthorized.raise_for_status.side_effect = requests.HTTPError(
+            response=unauthorized
+        )
+        ok = Mock(status_code=200)
+
+        with patch.object(
+            gae._session, "request", side_effect=[unauthorized, ok]
+        ) as mock_request, patch.object(
+            gae, "_get_jwt_token", side_effect=lambda: setattr(gae, "jwt_token", "new")
+        ):
+            assert gae.stop_engine("arangodb-gral-abc") is True
+
+        assert mock_request.call_count == 2
+        assert gae._session.headers["Authorization"].endswith("new")
+
     @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
     def test_ensure_service_reuses_existing(
         self, mock_get_config, mock_env_self_managed
@@ -371,16 +846,16 @@ class TestGenAIGAEConnectionNewMethods:
         gae = GenAIGAEConnection()
         gae.jwt_token = "test-token"
 
-        with patch(
-            "graph_analytics_orchestrator.gae_connection.requests.post"
-        ) as mock_post:
+        with patch.object(gae._session, "request") as mock_post:
             mock_response = MagicMock()
-            mock_response.json.return_value = {
-                "services": [
-                    {"serviceId": "arangodb-gral-abc123", "status": "running"},
-                    {"serviceId": "arangodb-gral-def456", "status": "running"},
-                ]
-            }
+            mock_response.content = json.dumps(
+                {
+                    "services": [
+                        {"serviceId": "arangodb-gral-abc123", "status": "running"},
+                        {"serviceId": "arangodb-gral-def456", "status": "running"},
+                    ]
+                }
+            ).encode()
             mock_response.raise_for_status = Mock()
             mock_post.return_value = mock_response
 
@@ -390,6 +865,159 @@ class TestGenAIGAEConnectionNewMethods:
             assert services[0]["serviceId"] == "arangodb-gral-abc123"
             mock_post.assert_called_once()
 
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_engine_url_follows_engine_id(self, mock_get_config, mock_env_self_managed):
+        """Test the engine URL is derived once per engine_id assignment."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.com:8529",
+            "database": "testdb",
+            "user": "testuser",
+            "password": "testpass",
+        }
+        gae = GenAIGAEConnection()
+
+        gae.engine_id = "arangodb-gral-hkhti"
+        assert gae._get_engine_url() == "https://test.com:8529/gral/hkhti"
+
+        gae.engine_id = None
+        with pytest.raises(ValueError, match="No engine running"):
+            gae._get_engine_url()
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_list_services_cached_until_invalidated(
+        self, mock_get_config, mock_env_self_managed
+    ):
+        """Test service listings are cached, forceable and dropped on stop."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.com:8529",
+            "database": "testdb",
+            "user": "testuser",
+            "password": "testpass",
+        }
+        gae = GenAIGAEConnection()
+        gae.jwt_token = "test-token"
+
+        mock_response = MagicMock()
+        mock_response.content = b'{"services": [{"serviceId": "s1"}]}'
+        with patch.object(
+            gae._session, "request", return_value=mock_response
+        ) as mock_request:
+            gae.list_services()
+            gae.list_services()
+            assert mock_request.call_count == 1
+
+            gae.list_services(force=True)
+            assert mock_request.call_count == 2
+
+            gae.stop_engine("s1")  # DELETE, then the cache is dropped
+            gae.list_services()
+            assert mock_request.call_count == 4
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_post_bodies_sent_as_encoded_json(
+        self, mock_get_config, mock_env_self_managed
+    ):
+        """Test POST payloads are pre-encoded and GET requests carry no body."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.com:8529",
+            "database": "testdb",
+            "user": "testuser",
+            "password": "testpass",
+        }
+        gae = GenAIGAEConnection()
+        gae.jwt_token = "test-token"
+        gae.engine_id = "arangodb-gral-abc123"
+
+        mock_response = MagicMock()
+        mock_response.content = b'{"job_id": 7}'
+        with patch.object(
+            gae._session, "request", return_value=mock_response
+        ) as mock_request:
+            result = gae._request("POST", "v1/pagerank", payload={"graph_id": "g"})
+            gae._request("GET", "v1/jobs")
+
+        assert result == {"job_id": 7}
+        post_call, get_call = mock_request.call_args_list
+        assert json.loads(post_call.kwargs["data"]) == {"graph_id": "g"}
+        assert "data" not in get_call.kwargs
+        assert gae._session.headers["Content-Type"] == "application/json"
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_request_reresolves_engine_after_404(
+        self, mock_get_config, mock_env_self_managed
+    ):
+        """Test a vanished engine is replaced once; a plain 404 is raised."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.com:8529",
+            "database": "testdb",
+            "user": "testuser",
+            "password": "testpass",
+        }
+        gae = GenAIGAEConnection()
+        gae.engine_id = "arangodb-gral-old"
+
+        not_found = Mock(status_code=404, text="")
+        error = requests.HTTPError(response=not_found)
+        ok = Mock(content=b'{"graphs": []}')
+
+        def ensure_service():
+            gae.engine_id = "arangodb-gral-new"
+
+        with patch.object(
+            gae, "_genai_request_with_retry", side_effect=[error, ok]
+        ) as mock_send, patch.object(
+            gae, "list_services", return_value=[]
+        ), patch.object(
+            gae, "ensure_service", side_effect=ensure_service
+        ):
+            assert gae._request("GET", "v1/graphs") == {"graphs": []}
+
+        assert mock_send.call_args.args[1] == "https://test.com:8529/gral/new/v1/graphs"
+
+        deployed = [{"serviceId": "arangodb-gral-new", "status": "DEPLOYED"}]
+        with patch.object(
+            gae, "_genai_request_with_retry", side_effect=error
+        ) as mock_send, patch.object(gae, "list_services", return_value=deployed):
+            with pytest.raises(requests.HTTPError):
+                gae._request("GET", "v1/jobs/missing")
+        assert mock_send.call_count == 1
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_context_manager_closes_session(
+        self, mock_get_config, mock_env_self_managed
+    ):
+        """Test leaving the with-block closes the pooled session."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.com:8529",
+            "database": "testdb",
+            "user": "testuser",
+            "password": "testpass",
+        }
+
+        with GenAIGAEConnection() as gae:
+            assert gae._session.verify is gae.verify_ssl
+            mock_close = patch.object(gae._session, "close").start()
+        patch.stopall()
+
+        mock_close.assert_called_once()
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_db_connection")
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_get_db_reuses_connection(
+        self, mock_get_config, mock_get_db, mock_env_self_managed
+    ):
+        """Test result helpers share one database handle per instance."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.com:8529",
+            "database": "testdb",
+            "user": "testuser",
+            "password": "testpass",
+        }
+        gae = GenAIGAEConnection()
+
+        assert gae.get_db() is gae.get_db()
+        mock_get_db.assert_called_once()
+
     @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
     def test_list_graphs(self, mock_get_config, mock_env_self_managed):
         """Test list_graphs() method."""
@@ -475,6 +1103,145 @@ class TestGenAIGAEConnectionNewMethods:
             assert result["state"] == "completed"
             assert mock_get_job.called
 
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_wait_for_job_logs_instead_of_printing(
+        self, mock_get_config, mock_env_self_managed, capsys, caplog
+    ):
+        """Test polling progress goes to the logger unless verbose is set."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.com:8529",
+            "database": "testdb",
+            "user": "testuser",
+            "password": "testpass",
+        }
+        done = {"state": "completed"}
+
+        gae = GenAIGAEConnection()
+        with patch.object(gae, "get_job", return_value=done):
+            with caplog.at_level("INFO", logger="graph_analytics_orchestrator"):
+                gae.wait_for_job("job1")
+        assert "Job job1 completed" in caplog.text
+        assert capsys.readouterr().out == ""
+
+        gae = GenAIGAEConnection(verbose=True)
+        with patch.object(gae, "get_job", return_value=done):
+            gae.wait_for_job("job1")
+        assert "Job job1 completed" in capsys.readouterr().out
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_wait_for_job_adapts_to_progress(
+        self, mock_get_config, mock_env_self_managed
+    ):
+        """Test polling speeds up while a job progresses and backs off on stalls."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.com:8529",
+            "database": "testdb",
+            "user": "testuser",
+            "password": "testpass",
+        }
+        gae = GenAIGAEConnection()
+        gae.engine_id = "arangodb-gral-abc123"
+
+        progress = [0, 10, 10, 10, 100]
+        with patch.object(
+            gae,
+            "get_job",
+            side_effect=[{"progress": p, "total": 100} for p in progress],
+        ), patch(
+            "graph_analytics_orchestrator.gae_connection.time.sleep"
+        ) as mock_sleep:
+            gae.wait_for_job("job1", poll_interval=1, max_wait=60)
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        # First poll has no rate yet; then fast progress, then two stalls
+        assert delays[1:] == [1, 2, 4]
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_wait_for_jobs_polls_pending_together(
+        self, mock_get_config, mock_env_self_managed
+    ):
+        """Test wait_for_jobs only re-polls unfinished jobs and keys results."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.com:8529",
+            "database": "testdb",
+            "user": "testuser",
+            "password": "testpass",
+        }
+        gae = GenAIGAEConnection()
+        gae.engine_id = "arangodb-gral-abc123"
+
+        polls = []
+        states = {"job1": ["done"], "job2": ["running", "done"]}
+
+        def get_jobs_by_id(job_ids):
+            polls.append(list(job_ids))
+            return {j: {"id": j, "state": states[j].pop(0)} for j in job_ids}
+
+        with patch.object(gae, "list_jobs", return_value=[]), patch.object(
+            gae, "get_jobs_by_id", side_effect=get_jobs_by_id
+        ), patch("graph_analytics_orchestrator.gae_connection.time.sleep"):
+            results = gae.wait_for_jobs(["job2", "job1"], max_wait=60)
+
+        assert polls == [["job2", "job1"], ["job2"]]
+        assert list(results) == ["job2", "job1"]
+        assert results["job2"]["state"] == "done"
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_wait_for_jobs_uses_job_listing(
+        self, mock_get_config, mock_env_self_managed
+    ):
+        """Test one list_jobs() call per poll covers every listed job."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.com:8529",
+            "database": "testdb",
+            "user": "testuser",
+            "password": "testpass",
+        }
+        gae = GenAIGAEConnection()
+        gae.engine_id = "arangodb-gral-abc123"
+
+        listing = [
+            {"job_id": 1, "state": "done"},
+            {"job_id": 2, "state": "finished"},
+        ]
+        with patch.object(
+            gae, "list_jobs", return_value=listing
+        ) as mock_list, patch.object(
+            gae, "get_jobs_by_id", return_value={"3": {"state": "done"}}
+        ) as mock_fallback:
+            results = gae.wait_for_jobs(["1", "2", "3"], max_wait=60)
+
+        mock_list.assert_called_once()
+        mock_fallback.assert_called_once_with(["3"])
+        assert [job["state"] for job in results.values()] == [
+            "done",
+            "finished",
+            "done",
+        ]
+
+    @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
+    def test_await_jobs_preserves_order(self, mock_get_config, mock_env_self_managed):
+        """Test await_jobs waits on every job and keeps the input order."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test.com:8529",
+            "database": "testdb",
+            "user": "testuser",
+            "password": "testpass",
+        }
+        gae = GenAIGAEConnection()
+
+        with patch.object(
+            gae,
+            "wait_for_job",
+            side_effect=lambda job_id, **kwargs: {"id": job_id, **kwargs},
+        ):
+            results = asyncio.run(gae.await_jobs(["job1", "job2"], max_wait=5))
+
+        assert results == [
+            {"id": "job1", "max_wait": 5},
+            {"id": "job2", "max_wait": 5},
+        ]
+
     @patch("graph_analytics_orchestrator.gae_connection.get_arango_config")
     def test_test_connection_success(self, mock_get_config, mock_env_self_managed):
         """Test test_connection() with successful connection."""
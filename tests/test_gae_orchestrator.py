@@ -1,5 +1,8 @@
 """Tests for GAE orchestrator module."""
 
+import json
+import sys
+import logging
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime
@@ -57,6 +60,22 @@ class TestAnalysisConfig:
         assert "damping_factor" in config.algorithm_params
         assert config.algorithm_params["damping_factor"] == 0.85
 
+    def test_default_algorithm_params_not_shared(self, mock_env_amp):
+        """Test each config gets its own copy of the defaults."""
+        first, second = (
+            AnalysisConfig(
+                name=name,
+                vertex_collections=["v1"],
+                edge_collections=["e1"],
+                algorithm="pagerank",
+            )
+            for name in ("first", "second")
+        )
+
+        first.algorithm_params["damping_factor"] = 0.5
+
+        assert second.algorithm_params["damping_factor"] == 0.85
+
 
 class TestGAEOrchestrator:
     """Tests for GAEOrchestrator class."""
@@ -91,6 +110,7 @@ class TestGAEOrchestrator:
         # Non-retryable errors
         assert orchestrator._is_retryable_error("ARANGO_GRAPH_TOKEN not set") is False
         assert orchestrator._is_retryable_error("Configuration error") is False
+        assert orchestrator._is_retryable_error("INVALID CONFIGURATION: x") is False
 
         # Retryable errors
         assert orchestrator._is_retryable_error("Connection timeout") is True
@@ -181,6 +201,7 @@ class TestGAEOrchestrator:
             vertex_collections=["v1"],
             edge_collections=["e1"],
             algorithm="pagerank",
+            count_stored_documents=True,
         )
 
         result = orchestrator.run_analysis(config)
@@ -200,10 +221,22 @@ class TestGAEOrchestrator:
         mock_gae.run_pagerank.assert_called_once()
         mock_gae.store_results.assert_called_once()
         mock_gae.delete_engine.assert_called_once_with("engine123")
+        # e16 engines are billed at $0.40/hour for the analysis' duration
+        assert result.estimated_cost_usd == pytest.approx(
+            result.duration_seconds * 0.40 / 3600
+        )
+        assert "_per_second_cost" not in result.to_dict()
+        # Every GAE request is bounded by the per-request timeout, scoped to
+        # the workflow rather than written onto the connection
+        mock_gae.request_timeout.assert_called_once_with(config.request_timeout_seconds)
+        mock_gae.request_timeout.return_value.__exit__.assert_called_once()
 
+    @patch("graph_analytics_orchestrator.gae_orchestrator.time.sleep")
     @patch("graph_analytics_orchestrator.gae_orchestrator.get_gae_connection")
     @patch("graph_analytics_orchestrator.gae_orchestrator.get_db_connection")
-    def test_run_analysis_retry_success(self, mock_get_db, mock_get_gae, mock_env_amp):
+    def test_run_analysis_retry_success(
+        self, mock_get_db, mock_get_gae, mock_sleep, mock_env_amp
+    ):
         """Test analysis run that succeeds after a retry."""
         mock_gae = MagicMock()
         mock_get_gae.return_value = mock_gae
@@ -238,6 +271,9 @@ class TestGAEOrchestrator:
         assert result.status == AnalysisStatus.COMPLETED
         assert result.retry_count == 1
         assert mock_gae.deploy_engine.call_count == 2
+        # One backoff before the retry: base * 2**1 plus up to base of jitter
+        retry_delay = mock_sleep.call_args_list[0].args[0]
+        assert 2.0 <= retry_delay <= 3.0
 
     @patch("graph_analytics_orchestrator.gae_orchestrator.get_gae_connection")
     @patch("graph_analytics_orchestrator.gae_orchestrator.get_db_connection")
@@ -271,3 +307,403 @@ class TestGAEOrchestrator:
         assert result.status == AnalysisStatus.FAILED
         assert result.retry_count == 0
         assert mock_gae.deploy_engine.call_count == 1
+
+    @patch("graph_analytics_orchestrator.gae_orchestrator.time.sleep")
+    def test_wait_for_job_backs_off_to_poll_interval(self, mock_sleep, mock_env_amp):
+        """Test job polling starts fast and backs off to the poll interval."""
+        orchestrator = GAEOrchestrator(verbose=False)
+        orchestrator.gae = MagicMock()
+        orchestrator.gae.get_job.side_effect = [{"status": "running"}] * 12 + [
+            {"status": "succeeded"}
+        ]
+
+        job = orchestrator._wait_for_job("job1", "Test job", poll_interval=2)
+
+        assert job == {"status": "succeeded"}
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 12
+        assert 0.1 <= delays[0] <= 0.11
+        assert all(d <= 2 * 1.1 for d in delays)
+        assert delays[-1] >= 2
+
+    @staticmethod
+    def _mock_gae(engine_id):
+        """Build a GAE connection mock whose jobs succeed immediately."""
+        gae = MagicMock()
+        gae.list_engines.return_value = []
+        gae.deploy_engine.return_value = {"id": engine_id}
+        gae.load_graph.return_value = {"job_id": "load", "graph_id": "graph"}
+        gae.get_graph.return_value = {"vertex_count": 1, "edge_count": 1}
+        gae.run_pagerank.return_value = {"job_id": "algo"}
+        gae.store_results.return_value = {"job_id": "store"}
+        gae.get_job.return_value = {"status": "succeeded"}
+        return gae
+
+    @patch("graph_analytics_orchestrator.gae_orchestrator.get_gae_connection")
+    @patch("graph_analytics_orchestrator.gae_orchestrator.get_db_connection")
+    def test_run_batch_parallel(self, mock_get_db, mock_get_gae, mock_env_amp):
+        """Test a parallel batch uses one connection per worker thread."""
+        shared = self._mock_gae("shared-engine")
+        workers = [self._mock_gae(f"engine{i}") for i in range(3)]
+        mock_get_gae.side_effect = [shared] + workers
+
+        orchestrator = GAEOrchestrator(verbose=False)
+        configs = [
+            AnalysisConfig(
+                name=f"a{i}", vertex_collections=[f"v{i}"], edge_collections=["e1"]
+            )
+            for i in range(3)
+        ]
+
+        results = orchestrator.run_batch(configs, max_concurrency=3)
+
+        assert [r.config.name for r in results] == ["a0", "a1", "a2"]
+        assert all(r.status == AnalysisStatus.COMPLETED for r in results)
+        assert len(orchestrator.analysis_history) == 3
+        assert orchestrator.current_analysis is None
+        # Counting stored documents is opt-in
+        assert all(r.documents_updated is None for r in results)
+        for gae in [shared] + workers:
+            gae.collection.assert_not_called()
+        # The existing-engine check runs once, on the caller's connection
+        shared.list_engines.assert_called_once()
+        shared.deploy_engine.assert_not_called()
+        deployed = sum(gae.deploy_engine.call_count for gae in workers)
+        assert deployed == 3
+        for gae in workers:
+            if gae.deploy_engine.called:
+                gae.close.assert_called_once()
+
+    def test_run_batch_injected_connection_runs_sequentially(self, mock_env_amp):
+        """Test a batch on a caller-provided connection runs one at a time."""
+        gae = self._mock_gae("engine1")
+        orchestrator = GAEOrchestrator(verbose=False, gae_connection=gae)
+        orchestrator.db = MagicMock()
+        configs = [
+            AnalysisConfig(
+                name=f"a{i}", vertex_collections=[f"v{i}"], edge_collections=["e1"]
+            )
+            for i in range(2)
+        ]
+
+        with patch(
+            "graph_analytics_orchestrator.gae_orchestrator.get_gae_connection"
+        ) as mock_get_gae:
+            results = orchestrator.run_batch(configs, max_concurrency=4)
+
+        mock_get_gae.assert_not_called()
+        assert all(r.status == AnalysisStatus.COMPLETED for r in results)
+        assert gae.deploy_engine.call_count == 2
+        gae.close.assert_not_called()
+
+    def test_run_batch_shared_storage_groups_by_target(self, mock_env_amp):
+        """Test one engine runs the batch and storage is grouped by target."""
+        gae = self._mock_gae("engine1")
+        gae.run_pagerank.side_effect = [{"job_id": f"algo{i}"} for i in range(3)]
+        orchestrator = GAEOrchestrator(verbose=False, gae_connection=gae)
+        orchestrator.db = MagicMock()
+        configs = [
+            AnalysisConfig(
+                name=f"a{i}",
+                vertex_collections=["v1"],
+                edge_collections=["e1"],
+                target_collection=target,
+            )
+            for i, target in enumerate(["results", "other", "results"])
+        ]
+
+        results = orchestrator.run_batch_shared_storage(configs)
+
+        assert all(r.status == AnalysisStatus.COMPLETED for r in results)
+        assert all(r.engine_id == "engine1" for r in results)
+        gae.deploy_engine.assert_called_once()
+        gae.delete_engine.assert_called_once_with("engine1")
+        assert gae.store_results.call_count == 2
+        first_store = gae.store_results.call_args_list[0].kwargs
+        assert first_store["target_collection"] == "results"
+        assert first_store["job_ids"] == ["algo0", "algo2"]
+        assert first_store["attribute_names"] == [
+            configs[0].result_field,
+            configs[2].result_field,
+        ]
+        assert len(orchestrator.analysis_history) == 3
+
+    def test_run_batch_shares_engine_per_graph(self, mock_env_amp):
+        """Test configs on the same graph reuse one engine and graph load."""
+        gae = self._mock_gae("engine1")
+        orchestrator = GAEOrchestrator(verbose=False, gae_connection=gae)
+        orchestrator.db = MagicMock()
+        configs = [
+            AnalysisConfig(
+                name=name,
+                vertex_collections=vertices,
+                edge_collections=["e1"],
+            )
+            for name, vertices in [
+                ("a", ["v1", "v2"]),
+                ("b", ["v3"]),
+                ("c", ["v2", "v1"]),
+            ]
+        ]
+
+        groups = orchestrator._group_configs_by_graph(configs)
+        assert [[c.name for c in group] for group in groups.values()] == [
+            ["a", "c"],
+            ["b"],
+        ]
+
+        results = orchestrator.run_batch(configs)
+
+        assert [r.config.name for r in results] == ["a", "b", "c"]
+        assert all(r.status == AnalysisStatus.COMPLETED for r in results)
+        assert gae.deploy_engine.call_count == 2
+        assert gae.load_graph.call_count == 2
+        assert gae.store_results.call_count == 3
+        assert gae.delete_engine.call_count == 2
+        assert results[0].engine_id == results[2].engine_id
+        assert results[2].graph_id == "graph"
+
+    def test_save_history(self, tmp_path, mock_env_amp):
+        """Test history is written as JSON matching AnalysisResult.to_dict()."""
+        orchestrator = GAEOrchestrator(verbose=False)
+        config = AnalysisConfig(
+            name="saved", vertex_collections=["v1"], edge_collections=["e1"]
+        )
+        result = AnalysisResult(
+            config=config,
+            status=AnalysisStatus.COMPLETED,
+            start_time=datetime(2025, 1, 2, 3, 4, 5),
+            end_time=datetime(2025, 1, 2, 3, 5, 5),
+            duration_seconds=60.0,
+        )
+        orchestrator.analysis_history.append(result)
+        filepath = tmp_path / "history.json"
+
+        orchestrator.save_history(str(filepath))
+
+        with open(filepath) as f:
+            saved = json.load(f)
+        assert saved == [result.to_dict()]
+        assert saved[0]["status"] == "completed"
+        assert saved[0]["start_time"] == "2025-01-02T03:04:05"
+        assert saved[0]["config"]["vertex_collections"] == ["v1"]
+
+        # to_dict() shares the config's containers instead of copying them
+        assert result.to_dict()["config"]["vertex_collections"] is (
+            config.vertex_collections
+        )
+        assert result.to_dict()["config"] is result.to_dict()["config"]
+        assert "_config_dict" not in result.to_dict()
+
+    def test_log_uses_logging_module(self, caplog, mock_env_amp):
+        """Test progress messages go to the module logger at their level."""
+        orchestrator = GAEOrchestrator(verbose=True)
+
+        with caplog.at_level(
+            "INFO", logger="graph_analytics_orchestrator.gae_orchestrator"
+        ):
+            orchestrator._log("Deploying %s engine...", "e16")
+            orchestrator._log("Engine %s left running", "engine-1", level="WARN")
+
+        assert [(r.levelname, r.getMessage()) for r in caplog.records] == [
+            ("INFO", "Deploying e16 engine..."),
+            ("WARNING", "Engine engine-1 left running"),
+        ]
+
+    def test_quiet_orchestrator_logs_nothing(self, caplog, mock_env_amp):
+        """Test verbose=False stays silent even next to a verbose instance."""
+        module_logger = logging.getLogger(
+            "graph_analytics_orchestrator.gae_orchestrator"
+        )
+        with patch.object(module_logger, "hasHandlers", return_value=False):
+            GAEOrchestrator(verbose=True)
+        quiet = GAEOrchestrator(verbose=False)
+
+        arg = MagicMock()
+        with caplog.at_level("INFO"):
+            quiet._log("Deploying engine...")
+            quiet._log("Engine %s left running", arg, level="ERROR")
+
+        assert caplog.records == []
+        # Arguments are never formatted for a quiet orchestrator
+        arg.__str__.assert_not_called()
+        # Console output uses its own logger; the library logger is untouched
+        assert module_logger.level == logging.NOTSET
+        assert module_logger.handlers == []
+
+    @patch("graph_analytics_orchestrator.gae_orchestrator.time.sleep")
+    def test_wait_for_job_detects_format_once(self, mock_sleep, mock_env_amp):
+        """Test the job response format is detected on the first poll only."""
+        orchestrator = GAEOrchestrator(verbose=False)
+        orchestrator.gae = MagicMock()
+        orchestrator.gae.get_job.side_effect = [
+            {"progress": 1, "total": 3, "error": False},
+            {"progress": 2, "total": 3, "error": False},
+            {"progress": 3, "total": 3, "error": False},
+        ]
+
+        with patch.object(
+            orchestrator, "_job_handler", wraps=orchestrator._job_handler
+        ) as detect:
+            job = orchestrator._wait_for_job("job1", "Load")
+
+        assert job["progress"] == 3
+        detect.assert_called_once()
+
+    @patch("graph_analytics_orchestrator.gae_orchestrator.time.sleep")
+    def test_wait_for_job_survives_failed_poll(self, mock_sleep, mock_env_amp):
+        """Test an empty response mid-job is treated as unknown, not fatal."""
+        orchestrator = GAEOrchestrator(verbose=False)
+        orchestrator.gae = MagicMock()
+        orchestrator.gae.get_job.side_effect = [
+            {"state": "running"},
+            {},  # get_job returns {} when a poll fails
+            {"state": "done"},
+        ]
+
+        job = orchestrator._wait_for_job("job1", "Load")
+
+        assert job == {"state": "done"}
+        assert orchestrator.gae.get_job.call_count == 3
+
+    @patch("graph_analytics_orchestrator.gae_orchestrator.time.sleep")
+    def test_wait_for_job_state_failure(self, mock_sleep, mock_env_amp):
+        """Test a failed state-based job raises with its error."""
+        orchestrator = GAEOrchestrator(verbose=False)
+        orchestrator.gae = MagicMock()
+        orchestrator.gae.get_job.side_effect = [
+            {},
+            {"state": "running"},
+            {"state": "failed", "error": "out of memory"},
+        ]
+
+        with pytest.raises(RuntimeError, match="Load failed: out of memory"):
+            orchestrator._wait_for_job("job1", "Load")
+
+    def test_existing_engine_check_runs_once(self, mock_env_amp):
+        """Test the existing-engine check is skipped once it has passed."""
+        gae = self._mock_gae("engine1")
+        orchestrator = GAEOrchestrator(verbose=False, gae_connection=gae)
+        orchestrator.db = MagicMock()
+        config = AnalysisConfig(
+            name="again", vertex_collections=["v1"], edge_collections=["e1"]
+        )
+
+        orchestrator.run_analysis(config)
+        orchestrator.run_analysis(config)
+        assert gae.list_engines.call_count == 1
+
+        orchestrator.force_recheck_engines()
+        orchestrator.run_analysis(config)
+        assert gae.list_engines.call_count == 2
+
+    def test_durations_use_monotonic_clock(self, mock_env_amp):
+        """Test durations come from the monotonic clock, not wall-clock time."""
+        orchestrator = GAEOrchestrator(verbose=False)
+        config = AnalysisConfig(
+            name="timed", vertex_collections=["v1"], edge_collections=["e1"]
+        )
+        result = orchestrator._new_result(config)
+        result._start_monotonic = 100.0
+
+        with patch(
+            "graph_analytics_orchestrator.gae_orchestrator.time.monotonic",
+            return_value=142.5,
+        ):
+            orchestrator._mark_completed(result)
+
+        assert result.duration_seconds == 42.5
+        assert result.end_time is not None
+        assert "_start_monotonic" not in result.to_dict()
+
+    @pytest.mark.parametrize(
+        "algorithm, method",
+        [
+            ("pagerank", "run_pagerank"),
+            ("label_propagation", "run_label_propagation"),
+            ("scc", "run_scc"),
+            ("wcc", "run_wcc"),
+        ],
+    )
+    def test_run_algorithm_dispatch(self, algorithm, method, mock_env_amp):
+        """Test each algorithm is submitted through its connection method."""
+        gae = self._mock_gae("engine1")
+        getattr(gae, method).return_value = {"job_id": "algo"}
+        orchestrator = GAEOrchestrator(verbose=False, gae_connection=gae)
+        config = AnalysisConfig(
+            name="dispatch",
+            vertex_collections=["v1"],
+            edge_collections=["e1"],
+            algorithm=algorithm,
+        )
+        result = orchestrator._new_result(config)
+        result.graph_id = "graph"
+
+        orchestrator._run_algorithm(result)
+
+        getattr(gae, method).assert_called_once_with(
+            graph_id="graph", **config.algorithm_params
+        )
+        assert result.job_id == "algo"
+
+    def test_run_algorithm_unsupported(self, mock_env_amp):
+        """Test betweenness and unknown algorithms are rejected."""
+        orchestrator = GAEOrchestrator(verbose=False, gae_connection=MagicMock())
+        for algorithm, message in [
+            ("betweenness", "not yet supported"),
+            ("louvain", "Unsupported algorithm: louvain"),
+        ]:
+            config = AnalysisConfig(
+                name="x",
+                vertex_collections=["v1"],
+                edge_collections=["e1"],
+                algorithm=algorithm,
+            )
+            with pytest.raises(ValueError, match=message):
+                orchestrator._run_algorithm(orchestrator._new_result(config))
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+"
+    )
+    def test_analysis_dataclasses_are_slotted(self, mock_env_amp):
+        """Test configs and results carry no per-instance __dict__."""
+        config = AnalysisConfig(
+            name="slots", vertex_collections=["v1"], edge_collections=["e1"]
+        )
+        result = GAEOrchestrator(verbose=False)._new_result(config)
+
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.not_a_field = 1
+
+    def test_history_stream_round_trip(self, tmp_path, mock_env_amp):
+        """Test streamed NDJSON history loads back, skipping a torn line."""
+        gae = self._mock_gae("engine1")
+        orchestrator = GAEOrchestrator(verbose=False, gae_connection=gae)
+        orchestrator.db = MagicMock()
+        orchestrator.db.collection.return_value.count.return_value = 5
+        filepath = tmp_path / "history.ndjson"
+        config = AnalysisConfig(
+            name="streamed", vertex_collections=["v1"], edge_collections=["e1"]
+        )
+
+        orchestrator.open_history_stream(str(filepath))
+        first = orchestrator.run_analysis(config)
+        second = orchestrator.run_analysis(config)
+        orchestrator.close_history_stream()
+
+        lines = filepath.read_bytes().splitlines()
+        assert len(lines) == 2
+        # Simulate a crash part-way through writing a third record
+        with open(filepath, "ab") as f:
+            f.write(lines[0][:20])
+
+        restored = GAEOrchestrator(verbose=False)
+        loaded = restored.load_history(str(filepath))
+
+        assert len(loaded) == 2
+        assert restored.analysis_history == loaded
+        assert loaded[0].to_dict() == first.to_dict()
+        assert loaded[1].status == AnalysisStatus.COMPLETED
+        assert loaded[1].config.name == second.config.name
@@ -1,15 +1,55 @@
 """Tests for queries module."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call, patch
 
+from graph_analytics_orchestrator.constants import DEFAULT_CURSOR_BATCH_SIZE
 from graph_analytics_orchestrator.queries import (
+    pa,
+    _filter_clause,
     cross_reference_results,
     get_top_influential_connected,
     get_results_with_details,
 )
 
 
+class TestFilterClause:
+    """Tests for _filter_clause helper."""
+
+    @pytest.mark.parametrize(
+        "expression, clause, value",
+        [
+            ("r.score >= 0.000002", "FILTER r.score >= @f", 0.000002),
+            ("r.rank < 10", "FILTER r.rank < @f", 10),
+            ("r.delta > -1.5e3", "FILTER r.delta > @f", -1500.0),
+            ("w.component_id == 'nodes/x'", "FILTER w.component_id == @f", "nodes/x"),
+            ('r.a.b != "it\'s"', "FILTER r.a.b != @f", "it's"),
+            ("r.flag == true", "FILTER r.flag == @f", True),
+            ("r.label != null", "FILTER r.label != @f", None),
+        ],
+    )
+    def test_simple_comparisons_are_bound(self, expression, clause, value):
+        """Test simple comparisons bind their comparand."""
+        assert _filter_clause(expression, "f") == (clause, {"f": value})
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "r.a >= 1 AND r.b < 2",
+            "r.a == 'x' OR r.b == 'y'",
+            "LENGTH(r.items) > 0",
+            "r.a >= r.b",
+        ],
+    )
+    def test_complex_expressions_verbatim(self, expression):
+        """Test anything but a single simple comparison is used as-is."""
+        assert _filter_clause(expression, "f") == (f"FILTER {expression}", {})
+
+    def test_no_filter(self):
+        """Test an empty filter produces no clause."""
+        assert _filter_clause(None, "f") == ("", {})
+
+
 class TestCrossReferenceResults:
     """Tests for cross_reference_results function."""
 
@@ -43,9 +83,14 @@ class TestCrossReferenceResults:
 
         # Verify query was executed
         executed_query = mock_db.aql.execute.call_args[0][0]
-        assert "pagerank_results" in executed_query
-        assert "wcc_results" in executed_query
-        assert "FILTER r.pagerank_influence >= 0.5" in executed_query
+        assert "FILTER r.pagerank_influence >= @filter1" in executed_query
+        assert "FILTER w.component_id == @filter2" in executed_query
+        bind_vars = mock_db.aql.execute.call_args[1]["bind_vars"]
+        assert bind_vars["filter1"] == 0.5
+        assert bind_vars["filter2"] == "comp1"
+        assert bind_vars["@col1"] == "pagerank_results"
+        assert bind_vars["@col2"] == "wcc_results"
+        assert bind_vars["limit"] == 100
 
     def test_cross_reference_no_filters(self):
         """Test cross-referencing without filters."""
@@ -56,7 +101,8 @@ class TestCrossReferenceResults:
 
         assert result == []
         executed_query = mock_db.aql.execute.call_args[0][0]
-        assert "FILTER" not in executed_query or "FILTER r2 != null" in executed_query
+        # Only the join condition is filtered
+        assert executed_query.count("FILTER") == 1
 
     def test_cross_reference_custom_join_fields(self):
         """Test cross-referencing with custom join fields."""
@@ -68,8 +114,81 @@ class TestCrossReferenceResults:
         )
 
         executed_query = mock_db.aql.execute.call_args[0][0]
-        assert "r1.vertex_id" in executed_query
-        assert "r2_inner.id" in executed_query
+        assert "FILTER w.@key2 == r.@key1" in executed_query
+        bind_vars = mock_db.aql.execute.call_args[1]["bind_vars"]
+        assert bind_vars["key1"] == ["vertex_id"]
+        assert bind_vars["key2"] == ["id"]
+
+    def test_cross_reference_nested_join_fields(self):
+        """Test dotted join fields are bound as nested attribute paths."""
+        mock_db = MagicMock()
+        mock_db.aql.execute.return_value = []
+
+        cross_reference_results(
+            mock_db,
+            "collection1",
+            "collection2",
+            join_fields={"result_data.id": "vertex.ref.id"},
+        )
+
+        bind_vars = mock_db.aql.execute.call_args[1]["bind_vars"]
+        assert bind_vars["key1"] == ["result_data", "id"]
+        assert bind_vars["key2"] == ["vertex", "ref", "id"]
+
+    def test_cross_reference_single_join(self):
+        """Test the collections are joined without a per-row subquery."""
+        mock_db = MagicMock()
+        mock_db.aql.execute.return_value = []
+
+        cross_reference_results(
+            mock_db,
+            "pagerank_results",
+            "wcc_results",
+            filter2='w.component_id == "comp1"',
+            limit=10,
+        )
+
+        executed_query = mock_db.aql.execute.call_args[0][0]
+        assert "FIRST(" not in executed_query
+        assert "FOR w IN @@col2" in executed_query
+        assert "FILTER w.component_id == @filter2" in executed_query
+        # LIMIT must precede RETURN to be valid AQL
+        assert executed_query.index("LIMIT @limit") < executed_query.index("RETURN")
+
+    def test_cross_reference_query_text_stable(self):
+        """Test the query text doesn't change with collections or limits."""
+        mock_db = MagicMock()
+        mock_db.aql.execute.return_value = []
+
+        cross_reference_results(mock_db, "a1", "a2", limit=10)
+        cross_reference_results(mock_db, "b1", "b2", limit=20)
+
+        first, second = (c[0][0] for c in mock_db.aql.execute.call_args_list)
+        assert first == second
+
+    def test_cross_reference_batches_up_to_limit(self):
+        """Test collected results are fetched in batches sized to the limit."""
+        mock_db = MagicMock()
+        mock_db.aql.execute.return_value = []
+
+        cross_reference_results(mock_db, "c1", "c2", limit=50)
+
+        kwargs = mock_db.aql.execute.call_args[1]
+        assert kwargs["batch_size"] == 50
+        assert "stream" not in kwargs
+
+    def test_cross_reference_stream(self):
+        """Test stream=True hands back the server-side cursor."""
+        mock_db = MagicMock()
+        cursor = iter([{"id": "nodes/1"}])
+        mock_db.aql.execute.return_value = cursor
+
+        result = cross_reference_results(mock_db, "c1", "c2", stream=True)
+
+        assert result is cursor
+        kwargs = mock_db.aql.execute.call_args[1]
+        assert kwargs["stream"] is True
+        assert kwargs["batch_size"] == DEFAULT_CURSOR_BATCH_SIZE
 
 
 class TestGetTopInfluentialConnected:
@@ -100,24 +219,28 @@ class TestGetTopInfluentialConnected:
         # Verify component_id was used in query
         call_args = mock_db.aql.execute.call_args
         assert call_args[1]["bind_vars"]["component_id"] == "comp1"
+        executed_query = call_args[0][0]
+        assert "FIRST(" not in executed_query
+        assert "w.component_id == @component_id" in executed_query
 
     def test_get_top_influential_find_largest_component(self):
-        """Test getting top influential by finding largest component."""
+        """Test the largest component is found within the main query."""
         mock_db = MagicMock()
-
-        # Mock largest component query
-        mock_db.aql.execute.side_effect = [
-            ["comp1"],  # Largest component query
-            [],  # Main query
-        ]
+        mock_db.aql.execute.return_value = []
 
         result = get_top_influential_connected(
             mock_db, "pagerank_results", "wcc_results", limit=10
         )
 
         assert result == []
-        # Verify largest component query was executed first
-        assert mock_db.aql.execute.call_count == 2
+        # Component lookup and join run as a single query
+        mock_db.aql.execute.assert_called_once()
+        mock_db.collection.assert_not_called()
+        executed_query, kwargs = mock_db.aql.execute.call_args
+        assert "LET target = FIRST(" in executed_query[0]
+        assert "FILTER target != null" in executed_query[0]
+        assert "w.component_id == target" in executed_query[0]
+        assert "component_id" not in kwargs["bind_vars"]
 
     def test_get_top_influential_with_vertex_details(self):
         """Test getting top influential with vertex details."""
@@ -139,8 +262,58 @@ class TestGetTopInfluentialConnected:
 
         assert len(result) == 1
         executed_query = mock_db.aql.execute.call_args[0][0]
-        assert "LET person = DOCUMENT(pr.id)" in executed_query
+        assert "LET person = FIRST(FOR x IN @@vertex_coll" in executed_query
+        assert "x._id == pr.id LIMIT 1" in executed_query
+        assert "DOCUMENT(" not in executed_query
         assert "full_name: person.full_name" in executed_query
+        bind_vars = mock_db.aql.execute.call_args[1]["bind_vars"]
+        assert bind_vars == {
+            "@vertex_coll": "nodes",
+            "@pagerank_col": "pagerank_results",
+            "@wcc_col": "wcc_results",
+            "component_id": "comp1",
+            "limit": 100,
+        }
+
+    def test_get_top_influential_keeps_rows_without_vertex(self):
+        """Test that top vertices without a vertex document are not dropped."""
+        mock_db = MagicMock()
+
+        mock_results = [
+            {
+                "vertex_id": "nodes/1",
+                "full_name": "John Doe",
+                "pagerank_influence": 0.8,
+            },
+            {"vertex_id": "nodes/2", "full_name": None, "pagerank_influence": 0.7},
+        ]
+        mock_db.aql.execute.return_value = mock_results
+
+        result = get_top_influential_connected(
+            mock_db,
+            component_id="comp1",
+            limit=2,
+            include_vertex_details=True,
+            vertex_fields=["full_name"],
+        )
+
+        assert [row["vertex_id"] for row in result] == ["nodes/1", "nodes/2"]
+        assert result[1]["full_name"] is None
+        executed_query = mock_db.aql.execute.call_args[0][0]
+        # An outer join: no inner FOR over the vertex collection and no
+        # FILTER discarding rows whose vertex is missing
+        assert "FOR person IN" not in executed_query
+        assert "person != null" not in executed_query
+
+        get_top_influential_connected(
+            mock_db,
+            component_id="comp1",
+            include_vertex_details=True,
+            vertex_collection=None,
+        )
+        executed_query = mock_db.aql.execute.call_args[0][0]
+        assert "LET person = DOCUMENT(pr.id)" in executed_query
+        assert "person != null" not in executed_query
 
     def test_get_top_influential_no_components(self):
         """Test when no components found."""
@@ -184,8 +357,10 @@ class TestGetResultsWithDetails:
         assert "result_data" in result[0]
 
         executed_query = mock_db.aql.execute.call_args[0][0]
-        assert "FILTER r.pagerank_influence >= 0.5" in executed_query
-        assert "LIMIT 100" in executed_query
+        assert "FILTER r.pagerank_influence >= @filter" in executed_query
+        assert "LIMIT @limit" in executed_query
+        assert mock_db.aql.execute.call_args[1]["bind_vars"]["filter"] == 0.5
+        assert mock_db.aql.execute.call_args[1]["bind_vars"]["limit"] == 100
 
     def test_get_results_default_fields(self):
         """Test with default vertex fields."""
@@ -211,6 +386,29 @@ class TestGetResultsWithDetails:
         assert "CustomField1" in executed_query
         assert "CustomField2" in executed_query
 
+    def test_get_results_rejects_invalid_fields(self):
+        """Test field paths are validated before being spliced into AQL."""
+        mock_db = MagicMock()
+
+        with pytest.raises(ValueError, match="Invalid field name"):
+            get_results_with_details(
+                mock_db, "pagerank_results", fields=["name} RETURN 1 //"]
+            )
+        mock_db.aql.execute.assert_not_called()
+
+    def test_get_results_nested_and_empty_fields(self):
+        """Test dotted paths use their last segment and no fields is valid."""
+        mock_db = MagicMock()
+        mock_db.aql.execute.return_value = []
+
+        get_results_with_details(mock_db, "pagerank_results", fields=["a.b.city"])
+        assert "city: person.a.b.city," in mock_db.aql.execute.call_args[0][0]
+
+        get_results_with_details(mock_db, "pagerank_results", fields=[])
+        executed_query = mock_db.aql.execute.call_args[0][0]
+        assert ", ," not in executed_query
+        assert "result_data: r" in executed_query
+
     def test_get_results_no_filter(self):
         """Test without result filter."""
         mock_db = MagicMock()
@@ -219,5 +417,137 @@ class TestGetResultsWithDetails:
         get_results_with_details(mock_db, "pagerank_results")
 
         executed_query = mock_db.aql.execute.call_args[0][0]
-        # Should not have FILTER clause for results (only for person != null)
+        # Should not have FILTER clause for results (only the vertex join)
+        assert executed_query.count("FILTER") == 1
+        assert "FILTER person._id == r.id" in executed_query
+        assert mock_db.aql.execute.call_args[1]["bind_vars"] == {
+            "@vertex_coll": "nodes",
+            "@col": "pagerank_results",
+        }
+
+    def test_get_results_stream(self):
+        """Test streaming results with details."""
+        mock_db = MagicMock()
+        cursor = iter([])
+        mock_db.aql.execute.return_value = cursor
+
+        result = get_results_with_details(mock_db, "pagerank_results", stream=True)
+
+        assert result is cursor
+        assert mock_db.aql.execute.call_args[1]["stream"] is True
+
+    def test_get_results_pandas_from_cursor(self):
+        """Test the DataFrame is built straight from a streaming cursor."""
+        mock_db = MagicMock()
+        cursor = iter([])
+        mock_db.aql.execute.return_value = cursor
+
+        with patch("graph_analytics_orchestrator.queries.pd") as mock_pd:
+            result = get_results_with_details(
+                mock_db,
+                "pagerank_results",
+                fields=["full_name", "profile.city"],
+                return_format="pandas",
+            )
+
+        assert result is mock_pd.DataFrame.from_records.return_value
+        mock_pd.DataFrame.from_records.assert_called_once_with(
+            cursor, columns=["result_id", "full_name", "city", "result_data"]
+        )
+        assert mock_db.aql.execute.call_args[1]["stream"] is True
+
+    def test_get_results_arrow_in_record_batches(self):
+        """Test the arrow format builds the Table batch by batch."""
+        mock_db = MagicMock()
+        rows = [{"result_id": f"nodes/{i}"} for i in range(3)]
+        mock_db.aql.execute.return_value = iter(rows)
+
+        with patch("graph_analytics_orchestrator.queries.pa") as mock_pa, patch(
+            "graph_analytics_orchestrator.queries.DEFAULT_CURSOR_BATCH_SIZE", 2
+        ):
+            from_pylist = mock_pa.Table.from_pylist
+            result = get_results_with_details(
+                mock_db, "pagerank_results", return_format="arrow"
+            )
+
+        assert result is mock_pa.concat_tables.return_value
+        # Each batch infers its own schema
+        assert from_pylist.call_args_list == [call(rows[:2]), call(rows[2:])]
+        mock_pa.concat_tables.assert_called_once_with(
+            [from_pylist.return_value] * 2, promote_options="default"
+        )
+
+    @pytest.mark.skipif(pa is None, reason="pyarrow not installed")
+    def test_get_results_arrow_sparse_fields_across_batches(self):
+        """Test fields first seen in a later batch keep their values."""
+        mock_db = MagicMock()
+        rows = [
+            {"result_id": "nodes/0", "score": None, "result_data": {"id": 0}},
+            {"result_id": "nodes/1", "score": None, "result_data": {"id": 1}},
+            {"result_id": "nodes/2", "score": 0.5, "result_data": {"id": 2}},
+            {
+                "result_id": "nodes/3",
+                "score": None,
+                "result_data": {"id": 3, "component": "c1"},
+            },
+            {"result_id": "nodes/4", "result_data": {"id": 4}},
+        ]
+        mock_db.aql.execute.return_value = iter(rows)
+
+        with patch("graph_analytics_orchestrator.queries.DEFAULT_CURSOR_BATCH_SIZE", 2):
+            table = get_results_with_details(
+                mock_db, "pagerank_results", return_format="arrow"
+            )
+
+        assert table.num_rows == 5
+        assert table.column("score").to_pylist() == [None, None, 0.5, None, None]
+        components = [
+            row["component"] for row in table.column("result_data").to_pylist()
+        ]
+        assert components == [None, None, None, "c1", None]
+
+    def test_get_results_columnar_rejects_stream(self):
+        """Test a columnar format cannot be combined with stream=True."""
+        mock_db = MagicMock()
+
+        with pytest.raises(ValueError, match="stream=True"):
+            get_results_with_details(
+                mock_db, "pagerank_results", stream=True, return_format="pandas"
+            )
+
+        mock_db.aql.execute.assert_not_called()
+
+    def test_get_results_missing_columnar_library(self):
+        """Test a clear error when the format's library is not installed."""
+        mock_db = MagicMock()
+
+        with patch("graph_analytics_orchestrator.queries.pd", None):
+            with pytest.raises(ImportError, match="pandas"):
+                get_results_with_details(
+                    mock_db, "pagerank_results", return_format="pandas"
+                )
+
+        mock_db.aql.execute.assert_not_called()
+
+    def test_get_results_invalid_return_format(self):
+        """Test an unknown return format is rejected before querying."""
+        mock_db = MagicMock()
+
+        with pytest.raises(ValueError, match="return_format"):
+            get_results_with_details(mock_db, "pagerank_results", return_format="csv")
+
+        mock_db.aql.execute.assert_not_called()
+
+    def test_get_results_any_vertex_collection(self):
+        """Test ids spanning collections fall back to DOCUMENT()."""
+        mock_db = MagicMock()
+        mock_db.aql.execute.return_value = []
+
+        get_results_with_details(mock_db, "pagerank_results", vertex_collection=None)
+
+        executed_query = mock_db.aql.execute.call_args[0][0]
+        assert "LET person = DOCUMENT(r.id)" in executed_query
         assert "FILTER person != null" in executed_query
+        assert mock_db.aql.execute.call_args[1]["bind_vars"] == {
+            "@col": "pagerank_results"
+        }
@@ -1,7 +1,7 @@
 """Tests for results module."""
 
 import pytest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 from pathlib import Path
 
 from graph_analytics_orchestrator.results import (
@@ -24,7 +24,7 @@ class TestEnsureResultCollectionIndexes:
         mock_coll = MagicMock()
 
         # Mock collection exists
-        mock_db.has_collection.return_value = True
+        mock_db.collections.return_value = [{"name": "pagerank_results"}]
         mock_db.collection.return_value = mock_coll
 
         # Mock no existing index
@@ -34,36 +34,71 @@ class TestEnsureResultCollectionIndexes:
             mock_db, ["pagerank_results"], verbose=False
         )
 
-        assert result["created"] == 1
+        assert result["created"] == 2
         assert result["existing"] == 0
         assert result["missing"] == 0
-        mock_coll.add_persistent_index.assert_called_once()
+        assert mock_coll.add_persistent_index.call_args_list == [
+            call(
+                fields=["id"],
+                unique=False,
+                name="idx_pagerank_results_id",
+                in_background=True,
+            ),
+            call(
+                fields=["pagerank_influence"],
+                unique=False,
+                name="idx_pagerank_results_pagerank_influence",
+                in_background=True,
+            ),
+        ]
 
     def test_index_already_exists(self):
         """Test when index already exists."""
         mock_db = MagicMock()
         mock_coll = MagicMock()
 
-        mock_db.has_collection.return_value = True
+        mock_db.collections.return_value = [{"name": "pagerank_results"}]
         mock_db.collection.return_value = mock_coll
 
-        # Mock existing index on 'id' field
-        existing_index = {"type": "persistent", "fields": ["id"]}
-        mock_coll.indexes.return_value = [existing_index]
+        # Mock existing indexes on 'id' and 'pagerank_influence' fields
+        mock_coll.indexes.return_value = [
+            {"type": "primary", "fields": ["_key"]},
+            {"type": "persistent", "fields": ["id"]},
+            {"type": "persistent", "fields": ["pagerank_influence", "id"]},
+        ]
 
         result = ensure_result_collection_indexes(
             mock_db, ["pagerank_results"], verbose=False
         )
 
         assert result["created"] == 0
-        assert result["existing"] == 1
+        assert result["existing"] == 2
         assert result["missing"] == 0
         mock_coll.add_persistent_index.assert_not_called()
 
+    def test_only_missing_result_field_index_created(self):
+        """Test an existing 'id' index is kept and the result field indexed."""
+        mock_db = MagicMock()
+        mock_coll = MagicMock()
+
+        mock_db.collections.return_value = [{"name": "wcc_results"}]
+        mock_db.collection.return_value = mock_coll
+        mock_coll.indexes.return_value = [{"type": "persistent", "fields": ["id"]}]
+
+        result = ensure_result_collection_indexes(mock_db, ["wcc_results"])
+
+        assert result == {"created": 1, "existing": 1, "missing": 0}
+        mock_coll.add_persistent_index.assert_called_once_with(
+            fields=["component_id"],
+            unique=False,
+            name="idx_wcc_results_component_id",
+            in_background=True,
+        )
+
     def test_collection_missing(self):
         """Test when collection doesn't exist."""
         mock_db = MagicMock()
-        mock_db.has_collection.return_value = False
+        mock_db.collections.return_value = [{"name": "other_collection"}]
 
         result = ensure_result_collection_indexes(
             mock_db, ["missing_collection"], verbose=False
@@ -78,14 +113,37 @@ class TestEnsureResultCollectionIndexes:
         mock_db = MagicMock()
         mock_coll = MagicMock()
 
-        mock_db.has_collection.return_value = True
+        mock_db.collections.return_value = [
+            {"name": "pagerank_results"},
+            {"name": "wcc_results"},
+            {"name": "label_propagation_results"},
+        ]
         mock_db.collection.return_value = mock_coll
         mock_coll.indexes.return_value = []
 
         result = ensure_result_collection_indexes(mock_db, verbose=False)
 
-        # Should process default collections
-        assert mock_db.has_collection.call_count == 3
+        # Should process default collections, listing them only once
+        # Each default collection gets an 'id' and a result field index
+        assert result == {"created": 6, "existing": 0, "missing": 0}
+        mock_db.collections.assert_called_once()
+        mock_db.has_collection.assert_not_called()
+
+    def test_mixed_outcomes_counted(self):
+        """Test concurrent outcomes are tallied per collection."""
+        mock_db = MagicMock()
+        indexed, unindexed, failing = MagicMock(), MagicMock(), MagicMock()
+        indexed.indexes.return_value = [{"type": "persistent", "fields": ["id"]}]
+        unindexed.indexes.return_value = []
+        failing.indexes.side_effect = RuntimeError("boom")
+        colls = {"a": indexed, "b": unindexed, "c": failing}
+        mock_db.collections.return_value = [{"name": name} for name in colls]
+        mock_db.collection.side_effect = colls.get
+
+        result = ensure_result_collection_indexes(mock_db, ["a", "b", "c", "d"])
+
+        assert result == {"created": 1, "existing": 1, "missing": 2}
+        unindexed.add_persistent_index.assert_called_once()
 
 
 class TestVerifyResultCollection:
@@ -98,11 +156,9 @@ class TestVerifyResultCollection:
 
         mock_db.has_collection.return_value = True
         mock_db.collection.return_value = mock_coll
-        mock_coll.count.return_value = 100
-
-        # Mock sample document with 'id' field
+        # Mock count and sample document with 'id' field
         sample_doc = {"id": "nodes/123", "pagerank_influence": 0.5}
-        mock_db.aql.execute.return_value = [sample_doc]
+        mock_db.aql.execute.return_value = [{"count": 100, "sample": sample_doc}]
 
         # Mock index exists
         existing_index = {"type": "persistent", "fields": ["id"]}
@@ -115,6 +171,7 @@ class TestVerifyResultCollection:
         assert result["has_id_field"] is True
         assert result["has_index"] is True
         assert result["valid"] is True
+        mock_coll.count.assert_not_called()
 
     def test_verify_missing_collection(self):
         """Test verification of missing collection."""
@@ -126,6 +183,40 @@ class TestVerifyResultCollection:
         assert result["exists"] is False
         assert result["valid"] is False
 
+    def test_verify_empty_collection_short_circuits(self):
+        """Test an empty collection is invalid without listing indexes."""
+        mock_db = MagicMock()
+        mock_coll = MagicMock()
+
+        mock_db.has_collection.return_value = True
+        mock_db.collection.return_value = mock_coll
+        mock_db.aql.execute.return_value = [{"count": 0, "sample": None}]
+
+        result = verify_result_collection(mock_db, "pagerank_results")
+
+        assert result["exists"] is True
+        assert result["count"] == 0
+        assert result["valid"] is False
+        mock_coll.indexes.assert_not_called()
+
+    def test_verify_without_id_check_counts_directly(self):
+        """Test skipping the 'id' check counts without sampling."""
+        mock_db = MagicMock()
+        mock_coll = MagicMock()
+
+        mock_db.has_collection.return_value = True
+        mock_db.collection.return_value = mock_coll
+        mock_coll.count.return_value = 5
+        mock_coll.indexes.return_value = [{"type": "persistent", "fields": ["id"]}]
+
+        result = verify_result_collection(
+            mock_db, "pagerank_results", check_id_field=False
+        )
+
+        assert result["count"] == 5
+        assert result["valid"] is True
+        mock_db.aql.execute.assert_not_called()
+
     def test_verify_no_id_field(self):
         """Test verification when 'id' field is missing."""
         mock_db = MagicMock()
@@ -133,17 +224,16 @@ class TestVerifyResultCollection:
 
         mock_db.has_collection.return_value = True
         mock_db.collection.return_value = mock_coll
-        mock_coll.count.return_value = 100
-
-        # Mock sample document without 'id' field
+        # Mock count and sample document without 'id' field
         sample_doc = {"pagerank_influence": 0.5}
-        mock_db.aql.execute.return_value = [sample_doc]
+        mock_db.aql.execute.return_value = [{"count": 100, "sample": sample_doc}]
         mock_coll.indexes.return_value = []
 
         result = verify_result_collection(mock_db, "pagerank_results")
 
         assert result["has_id_field"] is False
         assert result["valid"] is False
+        mock_coll.indexes.assert_not_called()
 
 
 class TestValidateResultSchema:
@@ -152,15 +242,17 @@ class TestValidateResultSchema:
     def test_validate_valid_schema(self):
         """Test validation of valid schema."""
         mock_db = MagicMock()
-        mock_coll = MagicMock()
-
         mock_db.has_collection.return_value = True
-        mock_db.collection.return_value = mock_coll
-        mock_coll.count.return_value = 100
 
-        # Mock sample documents
-        sample_docs = [{"id": "nodes/123", "pagerank_influence": 0.5}]
-        mock_db.aql.execute.return_value = sample_docs
+        # Mock server-side schema summary
+        mock_db.aql.execute.return_value = [
+            {
+                "count": 100,
+                "sample_count": 100,
+                "missing": [],
+                "values": {"pagerank_influence": 0.5},
+            }
+        ]
 
         result = validate_result_schema(
             mock_db,
@@ -172,20 +264,28 @@ class TestValidateResultSchema:
         assert result["valid"] is True
         assert result["has_required_fields"] is True
         assert result["field_types_match"] is True
+        assert result["sample_count"] == 100
         assert len(result["issues"]) == 0
 
+        # One query; no separate count or document sample
+        mock_db.collection.assert_not_called()
+        bind_vars = mock_db.aql.execute.call_args[1]["bind_vars"]
+        assert bind_vars == {
+            "@col": "pagerank_results",
+            "sample_size": 100,
+            "fields": ["id", "pagerank_influence"],
+            "typed_fields": ["pagerank_influence"],
+        }
+
     def test_validate_missing_fields(self):
         """Test validation with missing required fields."""
         mock_db = MagicMock()
-        mock_coll = MagicMock()
-
         mock_db.has_collection.return_value = True
-        mock_db.collection.return_value = mock_coll
-        mock_coll.count.return_value = 100
 
-        # Mock sample without required field
-        sample_docs = [{"pagerank_influence": 0.5}]
-        mock_db.aql.execute.return_value = sample_docs
+        # Mock summary of a sample without required field
+        mock_db.aql.execute.return_value = [
+            {"count": 100, "sample_count": 100, "missing": ["id"], "values": {}}
+        ]
 
         result = validate_result_schema(
             mock_db, "pagerank_results", expected_fields=["id", "pagerank_influence"]
@@ -193,20 +293,22 @@ class TestValidateResultSchema:
 
         assert result["valid"] is False
         assert result["has_required_fields"] is False
-        assert len(result["issues"]) > 0
+        assert result["issues"] == ["Missing required fields: ['id']"]
 
     def test_validate_type_mismatch(self):
         """Test validation with type mismatch."""
         mock_db = MagicMock()
-        mock_coll = MagicMock()
-
         mock_db.has_collection.return_value = True
-        mock_db.collection.return_value = mock_coll
-        mock_coll.count.return_value = 100
 
-        # Mock sample with wrong type
-        sample_docs = [{"id": "nodes/123", "pagerank_influence": "0.5"}]
-        mock_db.aql.execute.return_value = sample_docs
+        # Mock summary of a sample with wrong type
+        mock_db.aql.execute.return_value = [
+            {
+                "count": 100,
+                "sample_count": 100,
+                "missing": [],
+                "values": {"pagerank_influence": "0.5"},
+            }
+        ]
 
         result = validate_result_schema(
             mock_db,
@@ -218,6 +320,19 @@ class TestValidateResultSchema:
         assert result["valid"] is False
         assert result["field_types_match"] is False
 
+    def test_validate_empty_collection(self):
+        """Test validation of an empty collection."""
+        mock_db = MagicMock()
+        mock_db.has_collection.return_value = True
+        mock_db.aql.execute.return_value = [
+            {"count": 0, "sample_count": 0, "missing": [], "values": {}}
+        ]
+
+        result = validate_result_schema(mock_db, "pagerank_results")
+
+        assert result["valid"] is False
+        assert result["issues"] == ["Collection is empty"]
+
 
 class TestCompareResultCollections:
     """Tests for compare_result_collections function."""
@@ -225,18 +340,10 @@ class TestCompareResultCollections:
     def test_compare_collections(self):
         """Test comparison of two collections."""
         mock_db = MagicMock()
-        mock_coll1 = MagicMock()
-        mock_coll2 = MagicMock()
-
         mock_db.has_collection.side_effect = lambda x: x in ["coll1", "coll2"]
-        mock_db.collection.side_effect = lambda x: (
-            mock_coll1 if x == "coll1" else mock_coll2
-        )
-        mock_coll1.count.return_value = 100
-        mock_coll2.count.return_value = 80
 
-        # Mock overlap query
-        mock_db.aql.execute.return_value = [50]  # 50 overlapping IDs
+        # Mock count query, then overlap query (50 overlapping IDs)
+        mock_db.aql.execute.side_effect = [[[100, 80]], [50]]
 
         result = compare_result_collections(mock_db, "coll1", "coll2")
 
@@ -247,6 +354,43 @@ class TestCompareResultCollections:
         assert result["collection1_only"] == 50
         assert result["collection2_only"] == 30
 
+        count_call, overlap_call = mock_db.aql.execute.call_args_list
+        assert "LENGTH(@@col1), LENGTH(@@col2)" in count_call[0][0]
+        mock_db.collection.assert_not_called()
+
+        overlap_query = overlap_call[0][0]
+        assert "INTERSECTION" not in overlap_query
+        assert "FILTER r2.id == r1.id" in overlap_query
+
+    def test_compare_missing_collection(self):
+        """Test a missing collection short-circuits with a direct count."""
+        mock_db = MagicMock()
+        mock_db.has_collection.side_effect = lambda x: x == "coll1"
+        mock_db.collection.return_value.count.return_value = 100
+
+        result = compare_result_collections(mock_db, "coll1", "missing")
+
+        assert result["collection1_count"] == 100
+        assert result["collection2_count"] == 0
+        assert result["overlap_count"] == 0
+        mock_db.aql.execute.assert_not_called()
+
+    def test_compare_field_differences_single_query(self):
+        """Test all compared fields are counted by one query."""
+        mock_db = MagicMock()
+        mock_db.has_collection.return_value = True
+        mock_db.aql.execute.side_effect = [[[10, 10]], [10], [[3, None]]]
+
+        result = compare_result_collections(
+            mock_db, "coll1", "coll2", compare_fields=["score", "rank"]
+        )
+
+        assert result["field_differences"] == {"score": 3, "rank": 0}
+        assert mock_db.aql.execute.call_count == 3
+        diff_query = mock_db.aql.execute.call_args[0][0]
+        assert "diff0 = SUM(r1.score != r2.score ? 1 : 0)" in diff_query
+        assert "diff1 = SUM(r1.rank != r2.rank ? 1 : 0)" in diff_query
+
 
 class TestBulkUpdateResultMetadata:
     """Tests for bulk_update_result_metadata function."""
@@ -254,28 +398,32 @@ class TestBulkUpdateResultMetadata:
     def test_bulk_update_success(self):
         """Test successful bulk update."""
         mock_db = MagicMock()
-        mock_coll = MagicMock()
-
-        mock_db.collection.return_value = mock_coll
 
-        # Mock batch query results
-        mock_db.aql.execute.side_effect = [
-            ["key1", "key2"],  # First batch
-            [],  # Second batch (empty, stops loop)
-        ]
-
-        # Mock document retrieval and update
-        mock_doc1 = {"_key": "key1", "id": "nodes/1"}
-        mock_doc2 = {"_key": "key2", "id": "nodes/2"}
-        mock_coll.get.side_effect = [mock_doc1, mock_doc2]
+        # Mock per-batch updated keys (short second batch stops the loop)
+        mock_db.aql.execute.side_effect = [["k1", "k2"], ["k3"]]
 
         metadata = {"analysis_date": "2025-01-01", "version": "1.0"}
         result = bulk_update_result_metadata(
-            mock_db, "pagerank_results", metadata, batch_size=1000
+            mock_db, "pagerank_results", metadata, batch_size=2
         )
 
-        assert result == 2
-        assert mock_coll.update.call_count == 2
+        assert result == 3
+        assert mock_db.aql.execute.call_count == 2
+
+        # Updates run server-side, without per-document requests
+        first, second = mock_db.aql.execute.call_args_list
+        assert "UPDATE r WITH @metadata IN @@col" in first[0][0]
+        assert first[0][0] == second[0][0]
+        assert first[1]["bind_vars"] == {
+            "@col": "pagerank_results",
+            "batch_size": 2,
+            "metadata": metadata,
+            "last_key": None,
+        }
+        # Keyset pagination resumes after the last updated key
+        assert "FILTER r._key > @last_key" in first[0][0]
+        assert second[1]["bind_vars"]["last_key"] == "k2"
+        mock_db.collection.assert_not_called()
 
 
 class TestCopyResults:
@@ -292,16 +440,23 @@ class TestCopyResults:
             mock_source_coll if x == "source" else mock_target_coll
         )
 
-        # Mock batch query results
-        batch1 = [{"id": "nodes/1", "value": 0.5}]
-        batch2 = []
-        mock_db.aql.execute.side_effect = [batch1, batch2]
+        # Mock per-batch copied source keys
+        mock_db.aql.execute.side_effect = [["1"], ["2"], []]
 
-        result = copy_results(mock_db, "source", "target", batch_size=1000)
+        result = copy_results(mock_db, "source", "target", batch_size=1)
 
-        assert result == 1
+        assert result == 2
         mock_db.create_collection.assert_called_once_with("target")
-        mock_target_coll.import_bulk.assert_called_once()
+        last_keys = [
+            c[1]["bind_vars"]["last_key"] for c in mock_db.aql.execute.call_args_list
+        ]
+        assert last_keys == [None, "1", "2"]
+
+        # Documents are inserted server-side, never fetched by the client
+        query, kwargs = mock_db.aql.execute.call_args
+        assert "INSERT r INTO @@target" in query[0]
+        assert kwargs["bind_vars"]["@target"] == "target"
+        mock_target_coll.import_bulk.assert_not_called()
 
     def test_copy_with_filter(self):
         """Test copy with filter query."""
@@ -320,9 +475,10 @@ class TestCopyResults:
             mock_db, "source", "target", filter_query="r.value >= 0.5", batch_size=1000
         )
 
-        # Verify filter was included in query
+        # Verify filter was included in query, with its threshold bound
         executed_query = mock_db.aql.execute.call_args[0][0]
-        assert "FILTER r.value >= 0.5" in executed_query
+        assert "FILTER r.value >= @filter" in executed_query
+        assert mock_db.aql.execute.call_args[1]["bind_vars"]["filter"] == 0.5
 
 
 class TestDeleteResultsByFilter:
@@ -331,29 +487,29 @@ class TestDeleteResultsByFilter:
     def test_delete_results_success(self):
         """Test successful deletion."""
         mock_db = MagicMock()
-        mock_coll = MagicMock()
-
-        mock_db.collection.return_value = mock_coll
 
-        # Mock batch query results
-        mock_db.aql.execute.side_effect = [
-            ["key1", "key2"],  # First batch
-            [],  # Second batch (empty, stops loop)
-        ]
+        # Mock per-batch removed keys (short second batch stops the loop)
+        mock_db.aql.execute.side_effect = [["k1", "k2"], ["k3"]]
 
         result = delete_results_by_filter(
-            mock_db, "pagerank_results", "r.value < 0.001", batch_size=1000
+            mock_db, "pagerank_results", "r.value < 0.001", batch_size=2
         )
 
-        assert result == 2
-        assert mock_coll.delete.call_count == 2
+        assert result == 3
+        query = mock_db.aql.execute.call_args[0][0]
+        assert "FILTER r.value < @filter" in query
+        assert "REMOVE r._key IN @@col" in query
+        assert mock_db.aql.execute.call_args[1]["bind_vars"] == {
+            "@col": "pagerank_results",
+            "batch_size": 2,
+            "filter": 0.001,
+            "last_key": "k2",
+        }
+        mock_db.collection.assert_not_called()
 
     def test_delete_no_matches(self):
         """Test deletion when no documents match."""
         mock_db = MagicMock()
-        mock_coll = MagicMock()
-
-        mock_db.collection.return_value = mock_coll
         mock_db.aql.execute.return_value = []
 
         result = delete_results_by_filter(
@@ -361,4 +517,4 @@ class TestDeleteResultsByFilter:
         )
 
         assert result == 0
-        mock_coll.delete.assert_not_called()
+        mock_db.aql.execute.assert_called_once()
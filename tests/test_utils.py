@@ -44,6 +44,26 @@ class TestValidateEndpointFormat:
         assert is_valid is False
         assert "http" in error.lower() or "https" in error.lower()
 
+    def test_non_numeric_port(self):
+        """Test endpoint whose port isn't a number."""
+        is_valid, error = validate_endpoint_format("https://example.com:abc/path")
+        assert is_valid is False
+        assert "non-standard port: abc" in error
+        assert "https://example.com:8529" in error
+
+    def test_ipv6_endpoint(self):
+        """Test bracketed IPv6 hosts with and without a port."""
+        assert validate_endpoint_format("http://[::1]:8529") == (True, None)
+        is_valid, error = validate_endpoint_format("http://[::1]")
+        assert is_valid is False
+        assert "missing port" in error.lower()
+
+    def test_malformed_endpoint(self):
+        """Test a URL the parser rejects is reported, not raised."""
+        is_valid, error = validate_endpoint_format("http://[::1:8529")
+        assert is_valid is False
+        assert error.startswith("Invalid endpoint format:")
+
     def test_empty_endpoint(self):
         """Test empty endpoint."""
         is_valid, error = validate_endpoint_format("")
@@ -84,6 +104,12 @@ class TestCheckPasswordFormat:
         assert is_valid is False
         assert any("quotes" in issue.lower() for issue in issues)
 
+    def test_password_with_mismatched_quotes(self):
+        """Test quotes that don't wrap the whole password are allowed."""
+        is_valid, issues = check_password_format("\"mypassword'")
+        assert is_valid is True
+        assert issues == []
+
     def test_empty_password(self):
         """Test empty password."""
         is_valid, issues = check_password_format("")